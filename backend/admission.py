@@ -0,0 +1,214 @@
+import asyncio
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+
+class GradientLimit:
+    """Concurrency limit adapted from observed latency.
+
+    Recent latency (a moving average) is compared with a baseline, the
+    lowest latency seen lately, which drifts up slowly so a lasting
+    slowdown eventually becomes the new normal. While recent latency stays
+    within ``tolerance`` times the baseline the limit grows by about
+    sqrt(limit) whenever it is actually being used; once queueing pushes
+    latency past that the limit shrinks in proportion. Failed requests cut
+    it multiplicatively (AIMD style). The limit stays in [min_limit, max_limit].
+    """
+
+    def __init__(self, initial: int, min_limit: int = 1, max_limit: Optional[int] = None,
+                 tolerance: float = 2.0, smoothing: float = 0.2, backoff: float = 0.9, drift: float = 0.0001):
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit or initial
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.backoff = backoff
+        self.drift = drift
+        self._recent: Optional[float] = None
+        self._baseline: Optional[float] = None
+
+    @property
+    def current(self) -> int:
+        return int(self.limit)
+
+    def update(self, latency: float, inflight: int, failed: bool = False):
+        if failed:
+            self.limit = max(self.min_limit, self.limit * self.backoff)
+            return
+        if self._recent is None:
+            self._recent = self._baseline = latency
+            return
+        self._recent += (latency - self._recent) * 0.1
+        self._baseline = min(latency, self._baseline * (1 + self.drift))
+
+        gradient = max(0.5, min(1.0, self.tolerance * self._baseline / max(self._recent, 1e-9)))
+        headroom = math.sqrt(self.limit) if inflight >= self.limit / 2 else 0.0
+        target = self.limit * gradient + headroom
+        self.limit += (target - self.limit) * self.smoothing
+        self.limit = min(self.max_limit, max(self.min_limit, self.limit))
+
+
+class FixedLimit:
+    """Constant concurrency limit for routes whose latency says little about load"""
+
+    def __init__(self, limit: int):
+        self.current = limit
+
+    def update(self, latency: float, inflight: int, failed: bool = False):
+        pass
+
+
+class ConcurrencyPool:
+    """Bounded concurrency with a bounded FIFO wait queue.
+
+    Requests beyond the limit wait for a slot for up to ``queue_timeout``
+    seconds; when ``max_queue`` requests are already waiting, or the wait
+    times out, the request is shed instead of piling up behind the others.
+    """
+
+    def __init__(self, name: str, limit, max_queue: int, queue_timeout: float):
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.inflight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.admitted = 0
+        self.queued = 0
+        self.shed = 0
+        self.timeouts = 0
+
+    async def acquire(self) -> bool:
+        if self.inflight < self.limit.current and not self._waiters:
+            self.inflight += 1
+            self.admitted += 1
+            return True
+        if len(self._waiters) >= self.max_queue:
+            self.shed += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.queued += 1
+        try:
+            # release() hands the slot over by counting it before resolving the waiter
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            self.shed += 1
+            return False
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+        self.admitted += 1
+        return True
+
+    def release(self):
+        self.inflight -= 1
+        while self._waiters and self.inflight < self.limit.current:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.inflight += 1
+                waiter.set_result(None)
+
+    def complete(self, latency: float, failed: bool = False):
+        self.limit.update(latency, self.inflight, failed)
+        self.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit.current,
+            "inflight": self.inflight,
+            "waiting": len(self._waiters),
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "shed": self.shed,
+            "timeouts": self.timeouts,
+        }
+
+
+@dataclass(frozen=True)
+class AdmissionRule:
+    """Send ``method path`` to a pool; a trailing ``*`` matches a prefix and pool None exempts the route"""
+    method: str
+    path: str
+    pool: Optional[str]
+
+
+class AdmissionControl:
+    """Maps requests to concurrency pools; the first matching rule wins"""
+
+    def __init__(self, pools: List[ConcurrencyPool], rules: List[AdmissionRule], retry_after: float = 1.0):
+        self.pools = {pool.name: pool for pool in pools}
+        self.rules = rules
+        self.retry_after = retry_after
+
+    def pool_for(self, method: str, path: str) -> Optional[ConcurrencyPool]:
+        for rule in self.rules:
+            if rule.method != method:
+                continue
+            if path == rule.path or (rule.path.endswith("*") and path.startswith(rule.path[:-1])):
+                return self.pools[rule.pool] if rule.pool else None
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            f"{name}_{key}": value
+            for name, pool in self.pools.items()
+            for key, value in pool.stats().items()
+        }
+
+
+class AdmissionMiddleware:
+    """ASGI middleware shedding load with 503 + Retry-After once a route's pool and queue are full"""
+
+    def __init__(self, app, control: AdmissionControl):
+        self.app = app
+        self.control = control
+
+    async def __call__(self, scope, receive, send):
+        pool = None
+        if scope["type"] == "http":
+            pool = self.control.pool_for(scope["method"], scope["path"])
+        if pool is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await pool.acquire():
+            await _service_unavailable(send, self.control.retry_after)
+            return
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            pool.complete(time.perf_counter() - start, failed=status >= 500)
+
+
+async def _service_unavailable(send, retry_after: float):
+    body = b'{"detail":"Server is busy. Please try again shortly."}'
+    await send({
+        "type": "http.response.start",
+        "status": 503,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("ascii")),
+            (b"retry-after", str(max(1, math.ceil(retry_after))).encode("ascii")),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,96 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AnalyticsBuffer:
+    """Bounded in-process buffer that writes analytics records with insert_many.
+
+    ``record`` never awaits: records are queued and flushed by a background
+    task once ``max_batch`` records are waiting or ``flush_interval`` seconds
+    have passed. When the queue is full new records are dropped and counted.
+    ``on_flush`` is awaited with each batch after it has been written.
+    """
+
+    def __init__(self, collection, max_batch: int = 100, flush_interval: float = 1.0,
+                 max_queue: int = 10000,
+                 on_flush: Optional[Callable[[List[Dict[str, Any]]], Awaitable[None]]] = None):
+        self.collection = collection
+        self.on_flush = on_flush
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+
+    def start(self):
+        if self._task is None:
+            self._closing = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Flush everything still queued and stop the background writer"""
+        if self._task is None:
+            return
+        self._closing = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+
+    def record(self, document: Dict[str, Any]) -> bool:
+        """Queue a record without blocking; returns False if it was dropped"""
+        try:
+            self._queue.put_nowait(document)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            return False
+        if self._queue.qsize() >= self.max_batch:
+            self._wakeup.set()
+        return True
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+            if self._closing:
+                return
+
+    async def flush(self):
+        """Write queued records in batches of at most max_batch"""
+        while not self._queue.empty():
+            batch: List[Dict[str, Any]] = []
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            self.batches += 1
+            try:
+                await self.collection.insert_many(batch, ordered=False)
+                self.written += len(batch)
+            except Exception as e:
+                self.failed += len(batch)
+                logger.error(f"Error writing {len(batch)} analytics records: {str(e)}")
+                continue
+            if self.on_flush is not None:
+                try:
+                    await self.on_flush(batch)
+                except Exception as e:
+                    logger.error(f"Error in analytics flush hook: {str(e)}")
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "batches": self.batches,
+        }
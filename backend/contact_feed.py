@@ -0,0 +1,231 @@
+import asyncio
+import itertools
+import logging
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Set
+
+from pymongo.errors import OperationFailure
+
+from fast_json import dumps
+
+logger = logging.getLogger(__name__)
+
+# Server codes for a resume token that has fallen off the oplog
+HISTORY_LOST_CODES = (136, 280, 286)
+
+
+@dataclass
+class FeedEvent:
+    seq: int
+    id: str
+    data: bytes
+
+
+class FeedSubscriber:
+    """One connected client: a bounded queue the hub pushes into"""
+
+    def __init__(self, buffer_size: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+        self.lagged = False
+
+
+def sse_message(event: str, data: bytes = b"{}", event_id: Optional[str] = None) -> bytes:
+    head = f"id: {event_id}\n" if event_id else ""
+    return f"{head}event: {event}\n".encode("utf-8") + b"data: " + data + b"\n\n"
+
+
+class ContactFeed:
+    """Fans new contact submissions out to Server-Sent Events clients.
+
+    A single change stream on the collection feeds every subscriber. Where
+    change streams are unavailable (standalone mongod, local stand-ins) the
+    API publishes inserts in-process instead, which only reaches clients of
+    the same process. Recent events are kept in a replay ring so reconnects
+    with ``Last-Event-ID`` resume without gaps; older change stream tokens
+    are replayed from the server. In-process event ids are prefixed with a
+    per-process epoch, so an id issued before a restart or by another worker
+    never matches this process's events and the client is told to reset
+    instead of being replayed the wrong ones. A subscriber whose buffer fills up is
+    disconnected with a ``lagged`` event rather than buffered without limit.
+    """
+
+    def __init__(self, collection, fields: List[str], mode: str = "auto", buffer_size: int = 100,
+                 replay_size: int = 1000, heartbeat: float = 15.0):
+        self.collection = collection
+        self.fields = fields
+        self.mode = mode
+        self.buffer_size = buffer_size
+        self.heartbeat = heartbeat
+        self.source: Optional[str] = None
+        self._ring: Deque[FeedEvent] = deque(maxlen=replay_size)
+        self._subscribers: Set[FeedSubscriber] = set()
+        self._seq = itertools.count(1)
+        self.epoch = uuid.uuid4().hex[:12]
+        self._last_seq = 0
+        self._resume_token: Optional[Dict[str, Any]] = None
+        self._task: Optional[asyncio.Task] = None
+        self.published = 0
+        self.lagged = 0
+
+    def _pipeline(self) -> List[Dict[str, Any]]:
+        return [
+            {"$match": {"operationType": "insert"}},
+            {"$project": {"fullDocument": {field: 1 for field in self.fields}}},
+        ]
+
+    async def start(self):
+        """Open the shared change stream, falling back to in-process publishing"""
+        if self.mode != "memory":
+            try:
+                stream = self.collection.watch(self._pipeline())
+                change = await stream.try_next()
+            except Exception as e:
+                if self.mode == "change_stream":
+                    raise
+                logger.warning(f"Change streams unavailable, contact feed is in-process only: {str(e)}")
+            else:
+                self.source = "change_stream"
+                if change is not None:
+                    self._publish(change["_id"]["_data"], change["fullDocument"])
+                self._resume_token = stream.resume_token
+                self._task = asyncio.create_task(self._follow(stream))
+                return
+        self.source = "memory"
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        for subscriber in list(self._subscribers):
+            self._drop(subscriber)
+
+    async def _follow(self, stream):
+        """Read the shared change stream forever, reopening it from the last token on errors"""
+        delay = 1.0
+        while True:
+            try:
+                async with stream:
+                    async for change in stream:
+                        self._resume_token = change["_id"]
+                        self._publish(change["_id"]["_data"], change["fullDocument"])
+                        delay = 1.0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Contact change stream failed, reopening in {delay:.0f}s: {str(e)}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 60.0)
+            stream = self.collection.watch(self._pipeline(), resume_after=self._resume_token)
+
+    def publish_local(self, document: Dict[str, Any]):
+        """Publish an insert made by this process when there is no change stream"""
+        if self.source == "memory":
+            seq = next(self._seq)
+            self._publish(f"{self.epoch}-{seq}", document, seq)
+
+    def _event(self, event_id: str, document: Dict[str, Any], seq: int = 0) -> FeedEvent:
+        return FeedEvent(seq, event_id, dumps({field: document.get(field) for field in self.fields}))
+
+    def _publish(self, event_id: str, document: Dict[str, Any], seq: Optional[int] = None):
+        seq = seq if seq is not None else next(self._seq)
+        event = self._event(event_id, document, seq)
+        self._ring.append(event)
+        self._last_seq = seq
+        self.published += 1
+        for subscriber in list(self._subscribers):
+            try:
+                subscriber.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self._drop(subscriber)
+
+    def _drop(self, subscriber: FeedSubscriber):
+        if subscriber in self._subscribers:
+            self._subscribers.discard(subscriber)
+            subscriber.lagged = True
+            self.lagged += 1
+            try:
+                subscriber.queue.put_nowait(None)
+            except asyncio.QueueFull:
+                pass
+
+    def _ring_from(self, event_id: str, inclusive: bool = False) -> Optional[List[FeedEvent]]:
+        for index, event in enumerate(self._ring):
+            if event.id == event_id:
+                return list(self._ring)[index if inclusive else index + 1:]
+        return None
+
+    async def _replay_from_server(self, event_id: str, until_seq: int) -> AsyncIterator[FeedEvent]:
+        """Events after event_id from a private change stream, until it meets the replay ring"""
+        ring_ids = {event.id for event in self._ring}
+        async with self.collection.watch(self._pipeline(), resume_after={"_data": event_id}) as stream:
+            while True:
+                change = await stream.try_next()
+                if change is None:
+                    return
+                change_id = change["_id"]["_data"]
+                if change_id in ring_ids:
+                    # Caught up with the ring; the rest is served from memory
+                    for event in self._ring_from(change_id, inclusive=True) or []:
+                        if event.seq <= until_seq:
+                            yield event
+                    return
+                yield self._event(change_id, change["fullDocument"])
+
+    async def subscribe(self, last_event_id: Optional[str] = None) -> AsyncIterator[bytes]:
+        """SSE byte stream for one client: backlog since last_event_id, then live events"""
+        subscriber = FeedSubscriber(self.buffer_size)
+        self._subscribers.add(subscriber)
+        joined_at = self._last_seq
+        sent_seq = 0
+        try:
+            yield b"retry: 3000\n\n"
+            if last_event_id:
+                backlog = self._ring_from(last_event_id)
+                if backlog is not None:
+                    for event in backlog:
+                        if event.seq <= joined_at:
+                            sent_seq = event.seq
+                            yield sse_message("contact", event.data, event.id)
+                elif self.source == "change_stream" and "-" not in last_event_id:
+                    try:
+                        async for event in self._replay_from_server(last_event_id, joined_at):
+                            sent_seq = max(sent_seq, event.seq)
+                            yield sse_message("contact", event.data, event.id)
+                    except OperationFailure as e:
+                        if e.code not in HISTORY_LOST_CODES:
+                            raise
+                        yield sse_message("reset")
+                else:
+                    # Too old to replay, or issued by another process (an in-process id from another
+                    # epoch); the client should reload with GET /api/contact
+                    yield sse_message("reset")
+
+            while True:
+                if subscriber.lagged and subscriber.queue.empty():
+                    yield sse_message("lagged")
+                    return
+                try:
+                    event = await asyncio.wait_for(subscriber.queue.get(), self.heartbeat)
+                except asyncio.TimeoutError:
+                    yield b": keepalive\n\n"
+                    continue
+                if event is None:
+                    yield sse_message("lagged")
+                    return
+                if event.seq <= sent_seq:
+                    continue
+                sent_seq = event.seq
+                yield sse_message("contact", event.data, event.id)
+        finally:
+            self._subscribers.discard(subscriber)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "subscribers": len(self._subscribers),
+            "published": self.published,
+            "lagged": self.lagged,
+            "source": self.source,
+        }
@@ -0,0 +1,136 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from rollups import BUCKET_COUNT, bucket_start
+
+logger = logging.getLogger(__name__)
+
+
+def day_of(field: str) -> Dict[str, Any]:
+    """Aggregation expression truncating a date field to midnight UTC"""
+    return {"$dateFromParts": {
+        "year": {"$year": f"${field}"},
+        "month": {"$month": f"${field}"},
+        "day": {"$dayOfMonth": f"${field}"},
+    }}
+
+
+def per_day_facet(field: str, since: datetime) -> List[Dict[str, Any]]:
+    return [
+        {"$match": {field: {"$gte": since}}},
+        {"$group": {"_id": day_of(field), "count": {"$sum": 1}}},
+    ]
+
+
+def zero_filled(rows: List[Dict[str, Any]], since: datetime, days: int) -> List[Dict[str, Any]]:
+    """Daily points from since, including days without any rows"""
+    counts = {row["_id"]: row["count"] for row in rows}
+    return [
+        {"start": since + timedelta(days=offset), "count": counts.get(since + timedelta(days=offset), 0)}
+        for offset in range(days)
+    ]
+
+
+class AdminDashboard:
+    """Admin overview built from one ``$facet`` aggregation per collection.
+
+    The contact, status check and download bucket aggregations run
+    concurrently, so a dashboard costs one round trip per collection
+    rather than one query per widget. Download totals and recent downloads
+    come from the rollups, which already hold them.
+    """
+
+    def __init__(self, contacts, status_checks, rollups, contact_projection: Dict[str, int],
+                 status_projection: Dict[str, int], days: int = 30, top_companies: int = 5, recent: int = 10):
+        self.contacts = contacts
+        self.status_checks = status_checks
+        self.rollups = rollups
+        self.contact_projection = contact_projection
+        self.status_projection = status_projection
+        self.days = days
+        self.top_companies = top_companies
+        self.recent = recent
+
+    async def _contacts(self, since: datetime) -> Dict[str, Any]:
+        pipeline = [{"$facet": {
+            "total": [{"$count": "count"}],
+            "by_status": [{"$group": {"_id": "$status", "count": {"$sum": 1}}}],
+            "per_day": per_day_facet("timestamp", since),
+            "top_companies": [
+                {"$match": {"company": {"$nin": [None, ""]}}},
+                {"$group": {"_id": "$company", "count": {"$sum": 1}}},
+                {"$sort": {"count": -1, "_id": 1}},
+                {"$limit": self.top_companies},
+            ],
+            "recent": [
+                {"$sort": {"timestamp": -1, "id": -1}},
+                {"$limit": self.recent},
+                {"$project": self.contact_projection},
+            ],
+        }}]
+        facets = (await self.contacts.aggregate(pipeline).to_list(1))[0]
+        return {
+            "total": facets["total"][0]["count"] if facets["total"] else 0,
+            "by_status": {row["_id"]: row["count"] for row in facets["by_status"]},
+            "per_day": zero_filled(facets["per_day"], since, self.days),
+            "top_companies": [{"company": row["_id"], "count": row["count"]} for row in facets["top_companies"]],
+            "recent": facets["recent"],
+        }
+
+    async def _status_checks(self, since: datetime) -> Dict[str, Any]:
+        pipeline = [{"$facet": {
+            "total": [{"$count": "count"}],
+            "per_day": per_day_facet("timestamp", since),
+            "recent": [
+                {"$sort": {"timestamp": -1, "id": -1}},
+                {"$limit": self.recent},
+                {"$project": self.status_projection},
+            ],
+        }}]
+        facets = (await self.status_checks.aggregate(pipeline).to_list(1))[0]
+        return {
+            "total": facets["total"][0]["count"] if facets["total"] else 0,
+            "per_day": zero_filled(facets["per_day"], since, self.days),
+            "recent": facets["recent"],
+        }
+
+    async def _downloads(self, since: datetime, now: datetime) -> Dict[str, Any]:
+        pipeline = [{"$facet": {
+            "per_day": [
+                {"$match": {"bucket": "day", "start": {"$gte": since}}},
+                {"$project": {"_id": "$start", "count": BUCKET_COUNT}},
+            ],
+            "last_24h": [
+                {"$match": {"bucket": "hour", "start": {"$gt": bucket_start(now, "hour") - timedelta(hours=24)}}},
+                {"$group": {"_id": None, "count": {"$sum": BUCKET_COUNT}}},
+            ],
+        }}]
+        facets, total = await asyncio.gather(
+            self.rollups.buckets.aggregate(pipeline).to_list(1),
+            self.rollups.total()
+        )
+        facets = facets[0]
+        return {
+            "total": total,
+            "last_24h": facets["last_24h"][0]["count"] if facets["last_24h"] else 0,
+            "per_day": zero_filled(facets["per_day"], since, self.days),
+            "recent": self.rollups.recent()[:self.recent],
+        }
+
+    async def build(self) -> Dict[str, Any]:
+        now = datetime.utcnow()
+        since = bucket_start(now, "day") - timedelta(days=self.days - 1)
+        contacts, status_checks, downloads = await asyncio.gather(
+            self._contacts(since),
+            self._status_checks(since),
+            self._downloads(since, now)
+        )
+        return {
+            "generated_at": now,
+            "days": self.days,
+            "contacts": contacts,
+            "status_checks": status_checks,
+            "downloads": downloads,
+        }
@@ -0,0 +1,118 @@
+import asyncio
+import importlib.util
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+logger = logging.getLogger(__name__)
+
+# Wire compressors and the module each one needs; zlib ships with Python
+COMPRESSOR_MODULES = {
+    "zstd": "zstandard",
+    "snappy": "snappy",
+    "zlib": "zlib",
+}
+
+
+def available_compressors(requested: str) -> str:
+    """Keep only the requested compressors whose libraries are installed"""
+    names = [name.strip() for name in requested.split(",") if name.strip()]
+    return ",".join(
+        name for name in names
+        if name in COMPRESSOR_MODULES and importlib.util.find_spec(COMPRESSOR_MODULES[name]) is not None
+    )
+
+
+class DatabaseManager:
+    """Owns the Motor client: pool tuning from env, warm-up, cached readiness and shutdown"""
+
+    def __init__(self, url: str, name: str, client_options: Dict[str, Any], warm_connections: int = 0,
+                 ready_ttl: float = 2.0):
+        self.client = AsyncIOMotorClient(url, **client_options)
+        self.db = self.client[name]
+        self.warm_connections = warm_connections
+        self.ready_ttl = ready_ttl
+        self.draining = False
+        self._ready: Optional[bool] = None
+        self._ready_error: Optional[str] = None
+        self._ready_checked = 0.0
+        self._ready_check: Optional[asyncio.Future] = None
+
+    @classmethod
+    def from_env(cls, event_listeners: Optional[List[Any]] = None) -> "DatabaseManager":
+        env = os.environ
+        options: Dict[str, Any] = {
+            "maxPoolSize": int(env.get('MONGO_MAX_POOL_SIZE', '100')),
+            "minPoolSize": int(env.get('MONGO_MIN_POOL_SIZE', '0')),
+            "maxIdleTimeMS": int(env.get('MONGO_MAX_IDLE_TIME_MS', '300000')),
+            "connectTimeoutMS": int(env.get('MONGO_CONNECT_TIMEOUT_MS', '5000')),
+            "serverSelectionTimeoutMS": int(env.get('MONGO_SERVER_SELECTION_TIMEOUT_MS', '5000')),
+            "waitQueueTimeoutMS": int(env.get('MONGO_WAIT_QUEUE_TIMEOUT_MS', '2000')),
+            "readPreference": env.get('MONGO_READ_PREFERENCE', 'primary'),
+            "appname": env.get('MONGO_APP_NAME', 'portfolio-api'),
+        }
+        if env.get('MONGO_SOCKET_TIMEOUT_MS'):
+            options["socketTimeoutMS"] = int(env['MONGO_SOCKET_TIMEOUT_MS'])
+        compressors = available_compressors(env.get('MONGO_COMPRESSORS', 'zstd,snappy,zlib'))
+        if compressors:
+            options["compressors"] = compressors
+        if event_listeners:
+            options["event_listeners"] = event_listeners
+
+        return cls(
+            env['MONGO_URL'],
+            env['DB_NAME'],
+            options,
+            warm_connections=int(env.get('MONGO_WARM_CONNECTIONS', str(options["minPoolSize"] or 4))),
+            ready_ttl=float(env.get('HEALTH_READY_CACHE_TTL', '2'))
+        )
+
+    async def warm(self):
+        """Open pool connections up front so the first requests don't pay for handshakes"""
+        start = time.perf_counter()
+        try:
+            await asyncio.gather(*[
+                self.client.admin.command('ping') for _ in range(max(1, self.warm_connections))
+            ])
+        except Exception as e:
+            self._record_ready(False, str(e))
+            logger.error(f"MongoDB warm-up failed: {str(e)}")
+            return
+        self._record_ready(True, None)
+        logger.info(f"MongoDB pool warmed with {self.warm_connections} connections in "
+                    f"{(time.perf_counter() - start) * 1000:.0f} ms")
+
+    def _record_ready(self, ready: bool, error: Optional[str]):
+        self._ready = ready
+        self._ready_error = error
+        self._ready_checked = time.monotonic()
+
+    async def _ping(self):
+        try:
+            await self.client.admin.command('ping')
+            self._record_ready(True, None)
+        except Exception as e:
+            if self._ready is not False:
+                logger.error(f"MongoDB readiness ping failed: {str(e)}")
+            self._record_ready(False, str(e))
+
+    async def readiness(self) -> Dict[str, Any]:
+        """Ping result cached for ready_ttl seconds, shared by concurrent probes"""
+        if self.draining:
+            return {"ready": False, "reason": "draining"}
+
+        if self._ready is None or time.monotonic() - self._ready_checked >= self.ready_ttl:
+            if self._ready_check is None or self._ready_check.done():
+                self._ready_check = asyncio.ensure_future(self._ping())
+            await asyncio.shield(self._ready_check)
+
+        if not self._ready:
+            return {"ready": False, "reason": "database unavailable"}
+        return {"ready": True}
+
+    def close(self):
+        self.draining = True
+        self.client.close()
@@ -0,0 +1,112 @@
+import hashlib
+import math
+import re
+import time
+from typing import Dict, Optional
+
+NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def submission_digest(email: str, message: str) -> bytes:
+    """Hash of an (email, message) pair that ignores case, whitespace and punctuation"""
+    normalized_email = email.strip().lower()
+    normalized_message = NON_WORD.sub(" ", message.lower()).strip()
+    return hashlib.sha256(f"{normalized_email}\x00{normalized_message}".encode("utf-8")).digest()
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over 32-byte digests, using double hashing"""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.hashes = max(1, int(round(self.size / capacity * math.log(2))))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, digest: bytes):
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:16], "little") | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, digest: bytes):
+        for position in self._positions(digest):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, digest: bytes) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(digest))
+
+
+class RotatingBloomFilter:
+    """Two-generation Bloom filter remembering digests for one to two windows.
+
+    The current generation is retired when ``window`` seconds pass or it
+    reaches capacity, so memory stays fixed however many submissions arrive.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 1e-6, window: float = 86400):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.window = window
+        self._current = BloomFilter(capacity, error_rate)
+        self._previous: Optional[BloomFilter] = None
+        self._rotated_at = time.monotonic()
+        self.rotations = 0
+
+    def _maybe_rotate(self):
+        now = time.monotonic()
+        if now - self._rotated_at >= self.window or self._current.count >= self.capacity:
+            self._previous = self._current
+            self._current = BloomFilter(self.capacity, self.error_rate)
+            self._rotated_at = now
+            self.rotations += 1
+
+    def add(self, digest: bytes):
+        self._maybe_rotate()
+        self._current.add(digest)
+
+    def __contains__(self, digest: bytes) -> bool:
+        self._maybe_rotate()
+        return digest in self._current or (self._previous is not None and digest in self._previous)
+
+    def memory_bytes(self) -> int:
+        return len(self._current.bits) + (len(self._previous.bits) if self._previous else 0)
+
+
+class ContactDeduplicator:
+    """In-memory first line of defence against repeated contact submissions"""
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 1e-6, window: float = 86400):
+        self.window = window
+        self.filter = RotatingBloomFilter(capacity, error_rate, window)
+        self.suppressed = 0
+        self.backstop_hits = 0
+
+    def is_duplicate(self, digest: bytes) -> bool:
+        if digest in self.filter:
+            self.suppressed += 1
+            return True
+        return False
+
+    def remember(self, digest: bytes):
+        self.filter.add(digest)
+
+    def backstop_key(self, digest: bytes, now: Optional[float] = None) -> str:
+        """Value for the unique dedup_hash index, scoped to the current window.
+
+        The window number is part of the key, so the index only rejects
+        repeats within the same window and a message sent again later is
+        stored like any other.
+        """
+        bucket = int((time.time() if now is None else now) // self.window)
+        return f"{bucket}:{digest.hex()}"
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "suppressed": self.suppressed,
+            "backstop_hits": self.backstop_hits,
+            "rotations": self.filter.rotations,
+            "memory_bytes": self.filter.memory_bytes(),
+        }
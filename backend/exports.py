@@ -0,0 +1,80 @@
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+# Leading characters spreadsheet apps treat as formulas
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _csv_cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    value = str(value)
+    if value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+async def iter_export(cursor, fields: List[str], fmt: str, batch_size: int = 500,
+                      compress: bool = False) -> AsyncIterator[bytes]:
+    """Encode rows from an async cursor as NDJSON or CSV, one chunk per batch.
+
+    Only one batch of encoded rows is held at a time, and with ``compress``
+    the output is gzipped incrementally.
+    """
+    compressor = zlib.compressobj(wbits=31) if compress else None
+    buffer = io.StringIO()
+    writer = csv.writer(buffer) if fmt == "csv" else None
+
+    def take_chunk() -> bytes:
+        data = buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+        return compressor.compress(data) if compressor else data
+
+    if writer:
+        writer.writerow(fields)
+
+    pending = 0
+    async for row in cursor:
+        if writer:
+            writer.writerow([_csv_cell(row.get(field)) for field in fields])
+        else:
+            buffer.write(json.dumps({field: row.get(field) for field in fields}, default=_json_default))
+            buffer.write("\n")
+        pending += 1
+        if pending >= batch_size:
+            pending = 0
+            chunk = take_chunk()
+            if chunk:
+                yield chunk
+
+    chunk = take_chunk()
+    if compressor:
+        chunk += compressor.flush()
+    if chunk:
+        yield chunk
+
+
+def export_headers(name: str, fmt: str, compress: bool) -> Dict[str, str]:
+    headers = {"Content-Disposition": f'attachment; filename="{name}.{fmt}"'}
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+    return headers
@@ -0,0 +1,52 @@
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib encoder
+    orjson = None
+
+# Router-wide response class; FastAPI still validates against response_model first
+DefaultJSONResponse = ORJSONResponse if orjson is not None else JSONResponse
+
+
+def _default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, default=_default, separators=(",", ":")).encode("utf-8")
+
+
+def model_projection(model: Type[BaseModel]) -> Dict[str, int]:
+    """Mongo projection returning exactly the model's fields"""
+    return {"_id": 0, **{field: 1 for field in model.model_fields}}
+
+
+def trusted_rows(rows: Iterable[Dict[str, Any]], model: Type[BaseModel]) -> List[Dict[str, Any]]:
+    """Treat projected rows written by this API as already valid for model.
+
+    Rows missing a field (written before it existed) are completed with
+    ``model_construct`` defaults instead of running validation.
+    """
+    fields = model.model_fields
+    trusted = []
+    for row in rows:
+        if len(row) != len(fields):
+            row = model.model_construct(**row).model_dump()
+        trusted.append(row)
+    return trusted
+
+
+def rows_response(rows: Iterable[Dict[str, Any]], model: Type[BaseModel],
+                  headers: Optional[Dict[str, str]] = None) -> Response:
+    """Encode trusted DB rows directly, skipping per-row model building and response_model validation"""
+    return Response(content=dumps(trusted_rows(rows, model)), media_type="application/json", headers=headers)
@@ -0,0 +1,43 @@
+from typing import Dict, Iterable, Optional
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against a strong ETag"""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or (tag[2:] if tag.startswith("W/") else tag) == etag:
+            return True
+    return False
+
+
+def accepted_encodings(accept_encoding: Optional[str]) -> Dict[str, float]:
+    """Content codings from an Accept-Encoding header mapped to their q-values"""
+    accepted = {}
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def choose_encoding(accept_encoding: Optional[str], available: Iterable[str]) -> Optional[str]:
+    """Best acceptable coding among available (in preference order), or None for identity"""
+    accepted = accepted_encodings(accept_encoding)
+    best, best_q = None, 0.0
+    for coding in available:
+        q = accepted.get(coding, accepted.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
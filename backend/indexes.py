@@ -0,0 +1,93 @@
+import logging
+from typing import Dict, List, Optional
+
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+from pymongo.errors import OperationFailure
+
+from search import SEARCH_WEIGHTS
+
+logger = logging.getLogger(__name__)
+
+# Server error codes raised when an index exists with different options
+INDEX_CONFLICT_CODES = (85, 86)
+
+
+def _ttl(seconds: Optional[int]) -> Dict[str, int]:
+    return {"expireAfterSeconds": seconds} if seconds else {}
+
+
+def declare_indexes(status_checks_ttl: Optional[int] = None,
+                    resume_downloads_ttl: Optional[int] = None) -> Dict[str, List[IndexModel]]:
+    """Indexes required by the API queries, keyed by collection name"""
+    return {
+        "status_checks": [
+            IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+            IndexModel([("timestamp", DESCENDING)], name="timestamp_desc", **_ttl(status_checks_ttl)),
+            IndexModel([("timestamp", DESCENDING), ("id", DESCENDING)], name="timestamp_id_desc"),
+        ],
+        "contact_submissions": [
+            IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+            IndexModel([("timestamp", DESCENDING), ("id", DESCENDING)], name="timestamp_id_desc"),
+            IndexModel([("status", ASCENDING), ("timestamp", DESCENDING), ("id", DESCENDING)],
+                       name="status_timestamp_id"),
+            # Keys carry the dedup window number, so uniqueness only holds within one window
+            IndexModel([("dedup_hash", ASCENDING)], name="dedup_hash_unique", unique=True, sparse=True),
+            IndexModel([(field, TEXT) for field in SEARCH_WEIGHTS], name="contact_text", weights=SEARCH_WEIGHTS),
+            # Only submissions whose notification job is not written yet, for the outbox sweep
+            IndexModel([("timestamp", ASCENDING)], name="pending_notification",
+                       partialFilterExpression={"pending_notification": {"$exists": True}}),
+        ],
+        "resume_downloads": [
+            IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+            IndexModel([("download_date", DESCENDING)], name="download_date_desc",
+                       **_ttl(resume_downloads_ttl)),
+        ],
+        "notification_outbox": [
+            IndexModel([("status", ASCENDING), ("next_attempt_at", ASCENDING)], name="status_next_attempt"),
+            IndexModel([("status", ASCENDING), ("lease_until", ASCENDING)], name="status_lease"),
+        ],
+        "resume_download_buckets": [
+            IndexModel([("bucket", ASCENDING), ("start", ASCENDING)], name="bucket_start"),
+        ],
+    }
+
+
+async def ensure_indexes(db, declared: Dict[str, List[IndexModel]]) -> Dict[str, str]:
+    """Create declared indexes idempotently, updating TTLs that changed.
+
+    A failed build, e.g. a unique index over legacy duplicates, is logged
+    and skipped so the remaining indexes are still created. Returns the
+    failures as ``{"collection.index": error}``.
+    """
+    failures: Dict[str, str] = {}
+    for collection_name, models in declared.items():
+        collection = db[collection_name]
+        for model in models:
+            spec = model.document
+            try:
+                await _ensure_index(db, collection, collection_name, model)
+            except Exception as e:
+                failures[f"{collection_name}.{spec['name']}"] = str(e)
+                logger.error(f"Error creating index {collection_name}.{spec['name']}: {str(e)}")
+    if failures:
+        logger.error(f"{len(failures)} indexes could not be created: {', '.join(failures)}")
+    else:
+        logger.info(f"Indexes ensured for {', '.join(declared)}")
+    return failures
+
+
+async def _ensure_index(db, collection, collection_name: str, model: IndexModel):
+    try:
+        await collection.create_indexes([model])
+    except OperationFailure as e:
+        if e.code not in INDEX_CONFLICT_CODES:
+            raise
+        spec = model.document
+        if "expireAfterSeconds" not in spec:
+            logger.warning(f"Index {collection_name}.{spec['name']} exists with different options: {str(e)}")
+            return
+        await db.command({
+            "collMod": collection_name,
+            "index": {"name": spec["name"], "expireAfterSeconds": spec["expireAfterSeconds"]}
+        })
+        logger.info(f"Updated TTL on {collection_name}.{spec['name']}")
@@ -0,0 +1,216 @@
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from fastapi.responses import Response
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+from prometheus_client.core import GaugeMetricFamily
+from pymongo import monitoring
+
+REGISTRY = CollectorRegistry()
+
+REQUEST_BUCKETS = (.005, .01, .025, .05, .1, .25, .5, 1.0, 2.5, 5.0, 10.0)
+MONGO_BUCKETS = (.0005, .001, .0025, .005, .01, .025, .05, .1, .25, .5, 1.0, 2.5)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template",
+    ["method", "route"], buckets=REQUEST_BUCKETS, registry=REGISTRY
+)
+HTTP_REQUESTS = Counter(
+    "http_requests", "HTTP responses by route template and status code",
+    ["method", "route", "status"], registry=REGISTRY
+)
+HTTP_IN_FLIGHT = Gauge("http_requests_in_flight", "HTTP requests currently being served", registry=REGISTRY)
+
+MONGO_COMMAND_DURATION = Histogram(
+    "mongodb_command_duration_seconds", "MongoDB command round trip time",
+    ["command", "outcome"], buckets=MONGO_BUCKETS, registry=REGISTRY
+)
+MONGO_CHECKOUT_WAIT = Histogram(
+    "mongodb_pool_checkout_wait_seconds", "Time spent waiting for a pooled MongoDB connection",
+    ["outcome"], buckets=MONGO_BUCKETS, registry=REGISTRY
+)
+MONGO_CONNECTIONS_IN_USE = Gauge(
+    "mongodb_pool_connections_in_use", "MongoDB connections checked out of the pool", registry=REGISTRY
+)
+
+CONTACT_SUBMISSIONS = Counter(
+    "contact_submissions", "Contact form submissions by outcome", ["outcome"], registry=REGISTRY
+)
+RESUME_DOWNLOADS = Counter("resume_downloads", "Counted resume downloads", registry=REGISTRY)
+
+# Label children bound once so hot paths never build label tuples
+CONTACT_ACCEPTED = CONTACT_SUBMISSIONS.labels("accepted")
+CONTACT_DUPLICATE = CONTACT_SUBMISSIONS.labels("duplicate")
+CONTACT_FAILED = CONTACT_SUBMISSIONS.labels("failed")
+CHECKOUT_SUCCEEDED = MONGO_CHECKOUT_WAIT.labels("success")
+CHECKOUT_FAILED = MONGO_CHECKOUT_WAIT.labels("failure")
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class _RouteMetrics:
+    """Pre-bound histogram child plus per-status counter children for one route"""
+
+    __slots__ = ("method", "route", "duration", "statuses")
+
+    def __init__(self, method: str, route: str):
+        self.method = method
+        self.route = route
+        self.duration = HTTP_REQUEST_DURATION.labels(method, route)
+        self.statuses: Dict[int, Any] = {}
+
+    def observe(self, status: int, elapsed: float):
+        self.duration.observe(elapsed)
+        counter = self.statuses.get(status)
+        if counter is None:
+            counter = self.statuses[status] = HTTP_REQUESTS.labels(self.method, self.route, str(status))
+        counter.inc()
+
+
+class MetricsMiddleware:
+    """ASGI middleware timing every request against its route template.
+
+    Children are bound for each (method, route) when the middleware stack is
+    built. Requests that never reach a route (404s, rate limited requests on
+    parameterised paths) are folded into a single ``<unmatched>`` route so
+    arbitrary paths can't grow the label set.
+    """
+
+    def __init__(self, app, routes: List[Any]):
+        self.app = app
+        self._routes: Dict[Tuple[str, str], _RouteMetrics] = {}
+        for route in routes:
+            path = getattr(route, "path_format", None)
+            for method in getattr(route, "methods", None) or ():
+                if path:
+                    self._routes[(method, path)] = _RouteMetrics(method, path)
+
+    def _metrics_for(self, scope) -> _RouteMetrics:
+        method = scope["method"]
+        route = scope.get("route")
+        path = route.path_format if route is not None else scope["path"]
+        metrics = self._routes.get((method, path))
+        if metrics is None:
+            metrics = self._routes.get((method, UNMATCHED_ROUTE))
+            if metrics is None:
+                metrics = self._routes[(method, UNMATCHED_ROUTE)] = _RouteMetrics(method, UNMATCHED_ROUTE)
+        return metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            self._metrics_for(scope).observe(status, time.perf_counter() - start)
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """Records every driver command's duration, keyed by command name"""
+
+    def __init__(self):
+        self._children: Dict[Tuple[str, str], Any] = {}
+
+    def _observe(self, command: str, outcome: str, duration_micros: int):
+        child = self._children.get((command, outcome))
+        if child is None:
+            child = self._children[(command, outcome)] = MONGO_COMMAND_DURATION.labels(command, outcome)
+        child.observe(duration_micros / 1_000_000)
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        self._observe(event.command_name, "success", event.duration_micros)
+
+    def failed(self, event):
+        self._observe(event.command_name, "failure", event.duration_micros)
+
+
+class MongoPoolMetrics(monitoring.ConnectionPoolListener):
+    """Measures pool checkout waits and connections in use.
+
+    Check-out events fire on the thread doing the checkout, so the start time
+    is kept thread-local until the matching checked-out or failed event.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def connection_check_out_started(self, event):
+        self._local.started = time.perf_counter()
+
+    def _waited(self) -> float:
+        started = getattr(self._local, "started", None)
+        self._local.started = None
+        return time.perf_counter() - started if started is not None else 0.0
+
+    def connection_checked_out(self, event):
+        CHECKOUT_SUCCEEDED.observe(self._waited())
+        MONGO_CONNECTIONS_IN_USE.inc()
+
+    def connection_check_out_failed(self, event):
+        CHECKOUT_FAILED.observe(self._waited())
+
+    def connection_checked_in(self, event):
+        MONGO_CONNECTIONS_IN_USE.dec()
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        pass
+
+
+def mongo_listeners() -> List[Any]:
+    return [MongoCommandMetrics(), MongoPoolMetrics()]
+
+
+class StatsCollector:
+    """Publishes a component's ``stats()`` dict as gauges at scrape time"""
+
+    def __init__(self, prefix: str, stats: Callable[[], Dict[str, Any]]):
+        self.prefix = prefix
+        self.stats = stats
+
+    def collect(self):
+        for key, value in self.stats().items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                yield GaugeMetricFamily(f"{self.prefix}_{key}", f"{self.prefix} {key}", value=value)
+
+
+def register_stats(prefix: str, stats: Callable[[], Dict[str, Any]]):
+    REGISTRY.register(StatsCollector(prefix, stats))
+
+
+def metrics_response() -> Response:
+    return Response(content=generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,153 @@
+import asyncio
+import functools
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+@dataclass
+class CacheCounters:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    failures: int = 0
+
+
+class CachedValue:
+    """One asynchronously loaded value with stale-while-revalidate.
+
+    Within ``ttl`` seconds of loading the value is served as is. For a
+    further ``stale_ttl`` seconds it is still served, while a single
+    background load refreshes it. After that callers wait for a load, and
+    concurrent callers share one in-flight load instead of each running the
+    loader. ``invalidate`` discards the value, and any load started before
+    it, so a write is never hidden by a read that raced it.
+    """
+
+    def __init__(self, loader: Callable[[], Awaitable[Any]], ttl: float, stale_ttl: float = 0.0,
+                 counters: Optional[CacheCounters] = None):
+        self.loader = loader
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.counters = counters or CacheCounters()
+        self._value: Any = _MISSING
+        self._loaded_at = 0.0
+        self._generation = 0
+        self._inflight: Optional[asyncio.Future] = None
+
+    async def get(self) -> Any:
+        if self._value is not _MISSING:
+            age = time.monotonic() - self._loaded_at
+            if age < self.ttl:
+                self.counters.hits += 1
+                return self._value
+            if age < self.ttl + self.stale_ttl:
+                self.counters.stale_hits += 1
+                if self._inflight is None or self._inflight.done():
+                    # Nobody awaits a background refresh, so failures are logged here
+                    self._start_load().add_done_callback(self._log_failure)
+                return self._value
+
+        self.counters.misses += 1
+        if self._inflight is not None and not self._inflight.done():
+            self.counters.coalesced += 1
+        # Shield so one cancelled caller doesn't cancel the load others are waiting on
+        return await asyncio.shield(self._start_load())
+
+    def _start_load(self) -> asyncio.Future:
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.ensure_future(self._load(self._generation))
+            self._inflight.add_done_callback(self._count_failure)
+        return self._inflight
+
+    async def _load(self, generation: int) -> Any:
+        value = await self.loader()
+        if generation == self._generation:
+            self._value = value
+            self._loaded_at = time.monotonic()
+        return value
+
+    def _count_failure(self, future: asyncio.Future):
+        if not future.cancelled() and future.exception() is not None:
+            self.counters.failures += 1
+
+    def _log_failure(self, future: asyncio.Future):
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Error refreshing cached value: {str(future.exception())}")
+
+    def invalidate(self):
+        self._value = _MISSING
+        self._generation += 1
+        self._inflight = None
+
+    def stats(self) -> Dict[str, int]:
+        return asdict(self.counters)
+
+
+class Microcache:
+    """Short-lived per-arguments caching for hot read endpoints.
+
+    ``cached(namespace)`` wraps a route handler so identical concurrent
+    calls share one computation and its result is reused for ``ttl``
+    seconds, then served stale for ``stale_ttl`` more while it refreshes.
+    Entries are keyed by the handler's keyword arguments (query parameters)
+    and each namespace keeps at most ``max_entries`` of them. Writes call
+    ``invalidate(namespace)`` so this process never serves a result older
+    than its own last write; other workers catch up within the TTL.
+    """
+
+    def __init__(self, ttl: float = 1.0, stale_ttl: float = 0.0, max_entries: int = 256):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._entries: Dict[str, "OrderedDict[Any, CachedValue]"] = {}
+        self._counters: Dict[str, CacheCounters] = {}
+        self.invalidations = 0
+
+    def cached(self, namespace: str, ttl: Optional[float] = None, stale_ttl: Optional[float] = None):
+        """Decorator for a route handler whose result depends only on its arguments"""
+        entries = self._entries.setdefault(namespace, OrderedDict())
+        counters = self._counters.setdefault(namespace, CacheCounters())
+
+        def decorator(handler):
+            @functools.wraps(handler)
+            async def wrapper(**kwargs):
+                key = tuple(sorted(kwargs.items()))
+                entry = entries.get(key)
+                if entry is None:
+                    entry = entries[key] = CachedValue(
+                        functools.partial(handler, **kwargs),
+                        self.ttl if ttl is None else ttl,
+                        self.stale_ttl if stale_ttl is None else stale_ttl,
+                        counters
+                    )
+                    while len(entries) > self.max_entries:
+                        entries.popitem(last=False)
+                else:
+                    entries.move_to_end(key)
+                return await entry.get()
+            return wrapper
+        return decorator
+
+    def invalidate(self, namespace: str):
+        entries = self._entries.get(namespace)
+        if entries:
+            for entry in entries.values():
+                entry.invalidate()
+            entries.clear()
+        self.invalidations += 1
+
+    def stats(self) -> Dict[str, int]:
+        stats = {"invalidations": self.invalidations}
+        for namespace, counters in self._counters.items():
+            stats[f"{namespace}_entries"] = len(self._entries[namespace])
+            for name, value in asdict(counters).items():
+                stats[f"{namespace}_{name}"] = value
+        return stats
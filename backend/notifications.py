@@ -0,0 +1,256 @@
+import asyncio
+import logging
+import random
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+from typing import Any, Dict, List, Optional
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+logger = logging.getLogger(__name__)
+
+# Contact field holding a notification until its outbox job is written
+PENDING_NOTIFICATION = "pending_notification"
+
+
+class SMTPTransport:
+    """Sends mail with smtplib on a worker thread so the event loop never blocks"""
+
+    def __init__(self, host: str, port: int = 587, username: Optional[str] = None,
+                 password: Optional[str] = None, starttls: bool = True, timeout: float = 10.0):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+
+    def _send(self, message: EmailMessage):
+        # Only load smtplib once mail is actually sent
+        import smtplib
+
+        with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+            if self.starttls:
+                smtp.starttls()
+            if self.username:
+                smtp.login(self.username, self.password or "")
+            smtp.send_message(message)
+
+    async def send(self, message: EmailMessage):
+        await asyncio.to_thread(self._send, message)
+
+
+def contact_notification(contact: Dict[str, Any], sender: str, recipient: str) -> Dict[str, Any]:
+    """Outbox payload for a new contact submission"""
+    name = " ".join(contact["name"].split())
+    return {
+        "from": sender,
+        "to": recipient,
+        "reply_to": contact["email"],
+        "subject": f"New portfolio contact from {name}",
+        "body": (
+            f"Name: {name}\n"
+            f"Email: {contact['email']}\n"
+            f"Company: {contact.get('company') or 'Not specified'}\n\n"
+            f"{contact['message']}\n"
+        ),
+    }
+
+
+class NotificationOutbox:
+    """Transactional outbox for contact notification emails.
+
+    Jobs are written next to the submission and delivered by background
+    workers that claim and lease them one at a time, retry with exponential
+    backoff, and record the outcome on the contact's ``status``. Without a
+    transaction the payload is first embedded in the contact itself under
+    ``pending_notification``; a periodic sweep queues any whose job insert
+    never happened. Jobs are keyed by contact id, so queueing twice is harmless.
+    """
+
+    def __init__(self, outbox, contacts, transport=None, workers: int = 2, poll_interval: float = 5.0,
+                 lease: float = 60.0, max_attempts: int = 6, backoff_base: float = 30.0,
+                 recover_interval: float = 60.0, recover_batch: int = 100):
+        self.outbox = outbox
+        self.contacts = contacts
+        self.transport = transport
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.lease = lease
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.recover_interval = recover_interval
+        self.recover_batch = recover_batch
+        self._wakeup = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+        self._sweeper: Optional[asyncio.Task] = None
+        self._closing = False
+        self.sent = 0
+        self.retried = 0
+        self.failed = 0
+        self.recovered = 0
+
+    async def enqueue(self, contact_id: str, payload: Dict[str, Any], session=None):
+        """Queue the notification for contact_id; a second call for the same contact is a no-op"""
+        now = datetime.utcnow()
+        try:
+            await self.outbox.insert_one({
+                "_id": contact_id,
+                "contact_id": contact_id,
+                "payload": payload,
+                "status": "pending",
+                "attempts": 0,
+                "next_attempt_at": now,
+                "created_at": now,
+            }, session=session)
+        except DuplicateKeyError:
+            pass
+        self._wakeup.set()
+
+    async def queue_pending(self, contact_id: str, payload: Dict[str, Any]):
+        """Queue a notification embedded in its contact, then drop it from the contact"""
+        await self.enqueue(contact_id, payload)
+        await self.contacts.update_one({"id": contact_id}, {"$unset": {PENDING_NOTIFICATION: ""}})
+
+    async def recover(self) -> int:
+        """Queue notifications still embedded in contacts, e.g. after a failed job insert"""
+        cursor = self.contacts.find(
+            {PENDING_NOTIFICATION: {"$exists": True}}, {"_id": 0, "id": 1, PENDING_NOTIFICATION: 1}
+        ).sort("timestamp", 1).limit(self.recover_batch)
+        recovered = 0
+        async for contact in cursor:
+            await self.queue_pending(contact["id"], contact[PENDING_NOTIFICATION])
+            recovered += 1
+        if recovered:
+            self.recovered += recovered
+            logger.info(f"Queued {recovered} notifications left pending on contacts")
+        return recovered
+
+    def start(self):
+        if self.transport is None:
+            logger.warning("No mail transport configured; contact notifications stay queued in the outbox")
+            return
+        self._closing = False
+        self._tasks = [asyncio.create_task(self._run(f"worker-{i}")) for i in range(self.workers)]
+        self._sweeper = asyncio.create_task(self._recover_periodically())
+
+    async def stop(self):
+        """Let workers finish the job in hand, then stop"""
+        self._closing = True
+        self._wakeup.set()
+        tasks = self._tasks
+        if self._sweeper is not None:
+            # Nothing to finish between sweeps
+            self._sweeper.cancel()
+            tasks = tasks + [self._sweeper]
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = []
+        self._sweeper = None
+
+    async def _run(self, worker_id: str):
+        while not self._closing:
+            try:
+                job = await self._claim(worker_id)
+            except Exception as e:
+                logger.error(f"Error claiming notification jobs: {str(e)}")
+                job = None
+
+            if job is not None:
+                try:
+                    await self._deliver(job)
+                except Exception as e:
+                    # The job keeps its lease and is claimed again once it expires
+                    logger.error(f"Error delivering notification for contact {job['contact_id']}: {str(e)}")
+                continue
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def _recover_periodically(self):
+        while not self._closing:
+            try:
+                await self.recover()
+            except Exception as e:
+                logger.error(f"Error recovering pending notifications: {str(e)}")
+            await asyncio.sleep(self.recover_interval)
+
+    async def _claim(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """Claim one due job, including one whose lease expired.
+
+        Jobs are leased one at a time, so the lease only has to outlast a
+        single delivery rather than a batch of them sent back to back.
+        """
+        now = datetime.utcnow()
+        return await self.outbox.find_one_and_update(
+            {"$or": [
+                {"status": "pending", "next_attempt_at": {"$lte": now}},
+                {"status": "sending", "lease_until": {"$lte": now}},
+            ]},
+            {"$set": {
+                "status": "sending",
+                "worker": worker_id,
+                "lease_until": now + timedelta(seconds=self.lease),
+            }},
+            sort=[("next_attempt_at", 1)],
+            return_document=ReturnDocument.AFTER
+        )
+
+    async def _deliver(self, job: Dict[str, Any]):
+        payload = job["payload"]
+        message = EmailMessage()
+        message["From"] = payload["from"]
+        message["To"] = payload["to"]
+        message["Reply-To"] = payload["reply_to"]
+        message["Subject"] = payload["subject"]
+        message.set_content(payload["body"])
+
+        try:
+            await self.transport.send(message)
+        except Exception as e:
+            await self._retry_or_fail(job, e)
+            return
+
+        await self.outbox.update_one(
+            {"_id": job["_id"]},
+            {"$set": {"status": "sent", "sent_at": datetime.utcnow()}, "$unset": {"lease_until": ""}}
+        )
+        await self.contacts.update_one(
+            {"id": job["contact_id"], "status": "new"}, {"$set": {"status": "notified"}}
+        )
+        self.sent += 1
+
+    async def _retry_or_fail(self, job: Dict[str, Any], error: Exception):
+        attempts = job["attempts"] + 1
+        if attempts >= self.max_attempts:
+            await self.outbox.update_one(
+                {"_id": job["_id"]},
+                {"$set": {"status": "failed", "attempts": attempts, "last_error": str(error)},
+                 "$unset": {"lease_until": ""}}
+            )
+            await self.contacts.update_one(
+                {"id": job["contact_id"], "status": "new"}, {"$set": {"status": "notification_failed"}}
+            )
+            self.failed += 1
+            logger.error(f"Giving up on notification for contact {job['contact_id']}: {str(error)}")
+            return
+
+        # Exponential backoff with jitter so a mail outage doesn't retry in lockstep
+        delay = self.backoff_base * (2 ** (attempts - 1)) * random.uniform(0.8, 1.2)
+        await self.outbox.update_one(
+            {"_id": job["_id"]},
+            {"$set": {
+                "status": "pending",
+                "attempts": attempts,
+                "last_error": str(error),
+                "next_attempt_at": datetime.utcnow() + timedelta(seconds=delay),
+            }, "$unset": {"lease_until": ""}}
+        )
+        self.retried += 1
+        logger.warning(f"Notification for contact {job['contact_id']} failed, retrying in {delay:.0f}s: {str(error)}")
+
+    def stats(self) -> Dict[str, int]:
+        return {"sent": self.sent, "retried": self.retried, "failed": self.failed, "recovered": self.recovered}
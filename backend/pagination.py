@@ -0,0 +1,74 @@
+import base64
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Convert an aware datetime to the naive UTC form stored in MongoDB"""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def encode_cursor(timestamp: datetime, id: str) -> str:
+    """Opaque continuation token for the row after (timestamp, id)"""
+    raw = json.dumps([timestamp.isoformat(), id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> Tuple[datetime, str]:
+    """Inverse of encode_cursor; raises ValueError on malformed tokens"""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        timestamp, id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(timestamp), str(id)
+    except (TypeError, ValueError, UnicodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def encode_score_cursor(score: float, id: str) -> str:
+    """Continuation token for the row after (score, id) in a relevance ordered page"""
+    raw = json.dumps([score, id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_score_cursor(token: str) -> Tuple[float, str]:
+    """Inverse of encode_score_cursor; raises ValueError on malformed tokens"""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        score, id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return float(score), str(id)
+    except (TypeError, ValueError, UnicodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def date_range(field: str, since: Optional[datetime], until: Optional[datetime]) -> Dict[str, Any]:
+    """Filter on field within [since, until)"""
+    bounds = {}
+    if since is not None:
+        bounds["$gte"] = naive_utc(since)
+    if until is not None:
+        bounds["$lt"] = naive_utc(until)
+    return {field: bounds} if bounds else {}
+
+
+async def fetch_page(collection, query: Dict[str, Any], field: str, limit: int,
+                     after: Optional[Tuple[datetime, str]] = None,
+                     projection: Optional[Dict[str, int]] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Fetch one newest-first page ordered by (field, id) and the token for the next page"""
+    if after:
+        after_timestamp, after_id = after
+        keyset = {"$or": [
+            {field: {"$lt": after_timestamp}},
+            {field: after_timestamp, "id": {"$lt": after_id}},
+        ]}
+        query = {"$and": [query, keyset]} if query else keyset
+
+    rows = await collection.find(query, projection).sort([(field, -1), ("id", -1)]).limit(limit + 1).to_list(limit + 1)
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1][field], rows[-1]["id"])
+    return rows, next_cursor
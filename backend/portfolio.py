@@ -0,0 +1,127 @@
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from pymongo import ReturnDocument
+
+PORTFOLIO_ID = "portfolio"
+
+
+@dataclass(frozen=True)
+class PortfolioEntry:
+    """Serialized portfolio payload for one document version"""
+    version: int
+    body: bytes
+    etag: str
+    data: Dict[str, Any]
+
+
+class PortfolioCache:
+    """Versioned LRU of pre-serialized portfolio payloads.
+
+    The current version is trusted for ``ttl`` seconds; after that a
+    version-only projection decides whether the cached bytes are still valid,
+    so the full document is only fetched when it actually changed.
+    ``on_change`` is called with each newly loaded or saved entry.
+    """
+
+    def __init__(self, collection, ttl: float = 30.0, max_entries: int = 4,
+                 on_change: Optional[Callable[[PortfolioEntry], None]] = None):
+        self.collection = collection
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.on_change = on_change
+        self._entries: "OrderedDict[int, PortfolioEntry]" = OrderedDict()
+        self._current: Optional[int] = None
+        self._checked_until = 0.0
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.version_checks = 0
+
+    async def ensure_seeded(self, data: Dict[str, Any]):
+        """Insert the initial portfolio document if the collection is empty"""
+        await self.collection.update_one(
+            {"_id": PORTFOLIO_ID},
+            {"$setOnInsert": {"data": data, "version": 1, "updated_at": datetime.utcnow()}},
+            upsert=True
+        )
+
+    async def save(self, data: Dict[str, Any]) -> PortfolioEntry:
+        """Replace the portfolio content and bump its version"""
+        doc = await self.collection.find_one_and_update(
+            {"_id": PORTFOLIO_ID},
+            {"$set": {"data": data, "updated_at": datetime.utcnow()}, "$inc": {"version": 1}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        return self._store(doc["version"], doc["data"])
+
+    def _store(self, version: int, data: Dict[str, Any]) -> PortfolioEntry:
+        body = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        entry = PortfolioEntry(
+            version=version,
+            body=body,
+            etag=f'"{version}-{hashlib.sha256(body).hexdigest()[:32]}"',
+            data=data
+        )
+        self._entries[version] = entry
+        self._entries.move_to_end(version)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._current = version
+        self._checked_until = time.monotonic() + self.ttl
+        if self.on_change is not None:
+            self.on_change(entry)
+        return entry
+
+    def _fresh_entry(self) -> Optional[PortfolioEntry]:
+        if self._current is None or time.monotonic() >= self._checked_until:
+            return None
+        return self._entries.get(self._current)
+
+    async def get(self) -> Optional[PortfolioEntry]:
+        """Return the current payload, touching MongoDB only after the TTL lapses"""
+        entry = self._fresh_entry()
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        async with self._lock:
+            # Another request may have refreshed while we waited
+            entry = self._fresh_entry()
+            if entry is not None:
+                self.hits += 1
+                return entry
+
+            self.version_checks += 1
+            head = await self.collection.find_one({"_id": PORTFOLIO_ID}, {"version": 1})
+            if head is None:
+                return None
+
+            entry = self._entries.get(head["version"])
+            if entry is not None:
+                self.hits += 1
+                self._entries.move_to_end(entry.version)
+                self._current = entry.version
+                self._checked_until = time.monotonic() + self.ttl
+                return entry
+
+            self.misses += 1
+            doc = await self.collection.find_one({"_id": PORTFOLIO_ID})
+            if doc is None:
+                return None
+            return self._store(doc["version"], doc["data"])
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "version_checks": self.version_checks,
+            "version": self._current,
+        }
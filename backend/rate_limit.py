@@ -0,0 +1,235 @@
+import json
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+logger = logging.getLogger(__name__)
+
+# Bodies larger than this are not buffered to look for an email address
+MAX_INSPECTED_BODY = 64 * 1024
+
+
+@dataclass(frozen=True)
+class Limit:
+    """Token bucket holding up to ``burst`` tokens, refilled at ``rate`` tokens per second"""
+    burst: float
+    rate: float
+
+    @classmethod
+    def parse(cls, spec: str) -> "Limit":
+        """Parse 'N/SECONDS', e.g. '5/3600' for five requests per hour"""
+        count, _, period = spec.partition("/")
+        return cls(burst=float(count), rate=float(count) / float(period or 1))
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    method: str
+    path: str
+    per_ip: Optional[Limit] = None
+    per_email: Optional[Limit] = None
+
+
+class MemoryTokenBuckets:
+    """Token buckets in a fixed number of LRU shards, bounded to ``max_keys`` in total.
+
+    Each check is a dict lookup plus an ``OrderedDict.move_to_end``; the least
+    recently used key of a full shard is evicted, which only ever forgives a client.
+    """
+
+    def __init__(self, max_keys: int = 100_000, shards: int = 64):
+        self._shards: List["OrderedDict[str, Tuple[float, float]]"] = [OrderedDict() for _ in range(shards)]
+        self._shard_capacity = max(1, max_keys // shards)
+        self.evictions = 0
+
+    async def take(self, key: str, limit: Limit) -> float:
+        """Consume one token; return 0 if allowed, else seconds until one is available"""
+        return self.take_now(key, limit, time.monotonic())
+
+    def take_now(self, key: str, limit: Limit, now: float) -> float:
+        shard = self._shards[hash(key) % len(self._shards)]
+        state = shard.get(key)
+        if state is None:
+            tokens = limit.burst
+            if len(shard) >= self._shard_capacity:
+                shard.popitem(last=False)
+                self.evictions += 1
+        else:
+            tokens, updated = state
+            tokens = min(limit.burst, tokens + (now - updated) * limit.rate)
+            shard.move_to_end(key)
+
+        if tokens >= 1:
+            shard[key] = (tokens - 1, now)
+            return 0.0
+        shard[key] = (tokens, now)
+        return (1 - tokens) / limit.rate
+
+    def __len__(self):
+        return sum(len(shard) for shard in self._shards)
+
+
+class MongoTokenBuckets:
+    """Token buckets in a MongoDB collection so every worker shares the same limits.
+
+    Refill and consume happen in one pipeline update; idle buckets expire
+    through a TTL index on ``expires_at``.
+    """
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    async def ensure_indexes(self):
+        await self.collection.create_index("expires_at", name="expires_at_ttl", expireAfterSeconds=0)
+
+    async def take(self, key: str, limit: Limit) -> float:
+        try:
+            return await self._take(key, limit)
+        except DuplicateKeyError:
+            # Two first requests for a key raced to upsert the bucket; the document exists now
+            return await self._take(key, limit)
+
+    async def _take(self, key: str, limit: Limit) -> float:
+        now = datetime.utcnow()
+        refill = {"$multiply": [
+            {"$divide": [{"$subtract": [now, {"$ifNull": ["$updated", now]}]}, 1000]},
+            limit.rate
+        ]}
+        doc = await self.collection.find_one_and_update(
+            {"_id": key},
+            [
+                {"$set": {
+                    "tokens": {"$min": [limit.burst, {"$add": [{"$ifNull": ["$tokens", limit.burst]}, refill]}]},
+                    "updated": now,
+                    "expires_at": now + timedelta(seconds=limit.burst / limit.rate),
+                }},
+                {"$set": {
+                    "allowed": {"$gte": ["$tokens", 1]},
+                    "tokens": {"$cond": [{"$gte": ["$tokens", 1]}, {"$subtract": ["$tokens", 1]}, "$tokens"]},
+                }},
+            ],
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        if doc["allowed"]:
+            return 0.0
+        return (1 - doc["tokens"]) / limit.rate
+
+
+class RateLimitMiddleware:
+    """ASGI middleware applying per-IP and per-email token buckets to configured routes"""
+
+    def __init__(self, app, buckets, rules: List[RateLimitRule], trust_forwarded_for: bool = False,
+                 proxy_hops: int = 1):
+        self.app = app
+        self.buckets = buckets
+        self.rules: Dict[Tuple[str, str], RateLimitRule] = {(r.method, r.path): r for r in rules}
+        self.trust_forwarded_for = trust_forwarded_for
+        self.proxy_hops = proxy_hops
+        self.limited = 0
+
+    async def __call__(self, scope, receive, send):
+        rule = None
+        if scope["type"] == "http":
+            rule = self.rules.get((scope["method"], scope["path"]))
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        retry_after = 0.0
+        if rule.per_ip:
+            retry_after = await self._take(f"ip:{rule.path}:{self._client_ip(scope)}", rule.per_ip)
+
+        if not retry_after and rule.per_email:
+            body, receive = await _buffer_body(receive)
+            email = _email_from_body(body)
+            if email:
+                retry_after = await self._take(f"email:{rule.path}:{email}", rule.per_email)
+
+        if retry_after:
+            self.limited += 1
+            await _too_many_requests(send, retry_after)
+            return
+        await self.app(scope, receive, send)
+
+    async def _take(self, key: str, limit: Limit) -> float:
+        """Fail open: a broken limiter store shouldn't take the contact form down with it"""
+        try:
+            return await self.buckets.take(key, limit)
+        except Exception as e:
+            logger.error(f"Error checking rate limit, allowing request: {str(e)}")
+            return 0.0
+
+    def _client_ip(self, scope) -> str:
+        if self.trust_forwarded_for:
+            # Only the entries appended by our own proxies can be trusted; anything to
+            # their left was supplied by the client
+            hops = [
+                entry.strip()
+                for name, value in scope["headers"] if name == b"x-forwarded-for"
+                for entry in value.decode("latin-1").split(",") if entry.strip()
+            ]
+            if len(hops) >= self.proxy_hops:
+                return hops[-self.proxy_hops]
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+
+async def _buffer_body(receive):
+    """Read the request body and return it with a receive callable that replays it"""
+    chunks = []
+    size = 0
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message["type"] != "http.request":
+            # Client went away; hand the message on as-is
+            async def replay_disconnect():
+                return message
+            return b"", replay_disconnect
+        chunks.append(message.get("body", b""))
+        size += len(chunks[-1])
+        more_body = message.get("more_body", False)
+    body = b"".join(chunks)
+    replayed = False
+
+    async def replay():
+        nonlocal replayed
+        if not replayed:
+            replayed = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return (body if size <= MAX_INSPECTED_BODY else b""), replay
+
+
+def _email_from_body(body: bytes) -> Optional[str]:
+    if not body:
+        return None
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return None
+    email = payload.get("email") if isinstance(payload, dict) else None
+    return email.strip().lower() if isinstance(email, str) and email.strip() else None
+
+
+async def _too_many_requests(send, retry_after: float):
+    body = b'{"detail":"Too many requests. Please try again later."}'
+    await send({
+        "type": "http.response.start",
+        "status": 429,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("ascii")),
+            (b"retry-after", str(max(1, math.ceil(retry_after))).encode("ascii")),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,136 @@
+import hashlib
+import os
+import threading
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from http_cache import etag_matches
+
+
+@dataclass(frozen=True)
+class ResumeArtifact:
+    """Snapshot of the resume PDF as it was when last hashed"""
+    path: Path
+    etag: str
+    last_modified: str
+    mtime: float
+    mtime_ns: int
+    size: int
+
+
+class ResumeArtifactCache:
+    """Content-addressed cache of the resume PDF validators.
+
+    The file is hashed once and only re-hashed when its size or mtime changes,
+    so conditional requests can be answered from memory. While ``path`` does
+    not exist yet the ``fallback`` file, if any, is served in its place.
+    """
+
+    def __init__(self, path: Path, max_age: int = 3600, fallback: Optional[Path] = None):
+        self.path = Path(path)
+        self.fallback = Path(fallback) if fallback else None
+        self.max_age = max_age
+        self._artifact: Optional[ResumeArtifact] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    def _hash_file(self, path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(64 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def exists(self) -> bool:
+        return self._stat() is not None
+
+    def peek(self) -> Optional[ResumeArtifact]:
+        """The cached artifact if the file is unchanged on disk, without ever hashing"""
+        located = self._stat()
+        if located is None:
+            return None
+        artifact = self._artifact
+        return artifact if self._unchanged(artifact, *located) else None
+
+    def get(self) -> Optional[ResumeArtifact]:
+        """Return the current artifact, re-hashing only if the file changed on disk"""
+        located = self._stat()
+        if located is None:
+            self._artifact = None
+            return None
+        path, stat = located
+
+        artifact = self._artifact
+        if self._unchanged(artifact, path, stat):
+            return artifact
+
+        with self._lock:
+            artifact = self._artifact
+            if self._unchanged(artifact, path, stat):
+                return artifact
+            artifact = ResumeArtifact(
+                path=path,
+                etag=f'"{self._hash_file(path)}"',
+                last_modified=formatdate(stat.st_mtime, usegmt=True),
+                mtime=stat.st_mtime,
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+            )
+            self._artifact = artifact
+            self.refreshes += 1
+            return artifact
+
+    def _stat(self) -> Optional[Tuple[Path, os.stat_result]]:
+        for path in (self.path, self.fallback):
+            if path is None:
+                continue
+            try:
+                return path, os.stat(path)
+            except FileNotFoundError:
+                continue
+        return None
+
+    @staticmethod
+    def _unchanged(artifact: Optional[ResumeArtifact], path: Path, stat: os.stat_result) -> bool:
+        return (artifact is not None and artifact.path == path
+                and artifact.mtime_ns == stat.st_mtime_ns and artifact.size == stat.st_size)
+
+    def headers(self, artifact: ResumeArtifact) -> Dict[str, str]:
+        """Validator and caching headers for both 200 and 304 responses"""
+        return {
+            "ETag": artifact.etag,
+            "Last-Modified": artifact.last_modified,
+            "Cache-Control": f"public, max-age={self.max_age}, must-revalidate",
+        }
+
+    def is_not_modified(self, artifact: ResumeArtifact, if_none_match: Optional[str],
+                        if_modified_since: Optional[str], etag: Optional[str] = None) -> bool:
+        """Evaluate conditional request headers (If-None-Match takes precedence)"""
+        if if_none_match is not None:
+            matched = etag_matches(if_none_match, etag or artifact.etag)
+        elif if_modified_since is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                matched = False
+            else:
+                matched = int(artifact.mtime) <= since
+        else:
+            matched = False
+
+        if matched:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return matched
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+        }
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Set
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+def _atomic_write(output_path: str, suffix: str, write):
+    directory = os.path.dirname(output_path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".resume-", suffix=suffix)
+    os.close(fd)
+    try:
+        write(tmp_path)
+        # mkstemp creates files readable by the owner only
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _render_to_path(output_path: str, document: Dict[str, Any], version: str, version_path: str) -> str:
+    """Build the resume in a worker process, move it into place and record its version"""
+    import fcntl
+
+    from resume_generator import generate_resume_pdf
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    # Other server processes render to the same path; the file lock makes them take turns too
+    with open(f"{version_path}.lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        _atomic_write(output_path, ".pdf.tmp", lambda path: generate_resume_pdf(path, document))
+        _atomic_write(version_path, ".version.tmp", lambda path: Path(path).write_text(version))
+    return output_path
+
+
+class ResumeRenderService:
+    """Runs resume PDF builds in a process pool, one render at a time.
+
+    The version of the file on disk is kept in a sidecar next to it, so a
+    restart doesn't re-render a PDF that already matches the portfolio.
+    ``schedule`` starts a render in the background; until it finishes the
+    previous file keeps being served.
+    """
+
+    def __init__(self, output_path: Path, max_workers: int = 1,
+                 on_rendered: Optional[Callable[[], None]] = None):
+        self.output_path = Path(output_path)
+        self.version_path = self.output_path.with_name(f".{self.output_path.name}.version")
+        self.max_workers = max_workers
+        self.on_rendered = on_rendered
+        self._executor: Optional["ProcessPoolExecutor"] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._lock = asyncio.Lock()
+        self._rendered: Optional[str] = None
+        self._background: Set[asyncio.Future] = set()
+
+    def _get_executor(self) -> "ProcessPoolExecutor":
+        if self._executor is None:
+            # concurrent.futures.process is only needed once a render is requested
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def rendered_version(self) -> Optional[str]:
+        """Version of the PDF currently on disk, if it was rendered by this service"""
+        if self._rendered is None:
+            try:
+                self._rendered = self.version_path.read_text().strip() or None
+            except FileNotFoundError:
+                return None
+        return self._rendered if self.output_path.exists() else None
+
+    async def ensure(self, version: str, document: Dict[str, Any]) -> Path:
+        """Render the resume unless the file on disk already matches version"""
+        if self.rendered_version() == version:
+            return self.output_path
+        return await self.render(version, document)
+
+    def schedule(self, version: str, document: Dict[str, Any]):
+        """Start rendering version in the background unless it is on disk or already rendering"""
+        if self.rendered_version() == version or version in self._inflight:
+            return
+        task = asyncio.ensure_future(self.render(version, document))
+        self._background.add(task)
+        # Nobody awaits a background render, so failures are logged here
+        task.add_done_callback(self._log_failure)
+
+    def _log_failure(self, task: asyncio.Future):
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Error rendering resume: {str(task.exception())}")
+
+    async def render(self, version: str, document: Dict[str, Any]) -> Path:
+        """Render the resume, joining an in-flight render of the same version if any"""
+        future = self._inflight.get(version)
+        if future is None:
+            future = asyncio.ensure_future(self._render_serially(version, document))
+            self._inflight[version] = future
+            future.add_done_callback(lambda done: self._inflight.pop(version, None))
+        # Shield so a cancelled request doesn't cancel the render other callers await
+        await asyncio.shield(future)
+        return self.output_path
+
+    async def _render_serially(self, version: str, document: Dict[str, Any]):
+        # Renders of different versions take turns, so the PDF and its sidecar are always
+        # written by the same render and the sidecar never names a version the file doesn't hold
+        async with self._lock:
+            if self.rendered_version() == version:
+                return
+            logger.info(f"Rendering resume version {version}")
+            await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), _render_to_path,
+                str(self.output_path), document, version, str(self.version_path)
+            )
+            self._rendered = version
+        if self.on_rendered is not None:
+            self.on_rendered()
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,211 @@
+import asyncio
+import logging
+import os
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from pymongo import UpdateOne
+from pymongo.errors import DuplicateKeyError
+
+from rollups import bucket_start
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RetentionPolicy:
+    """How long raw rows of one collection are kept, and how they go away.
+
+    ``ttl`` becomes the expireAfterSeconds of the collection's time index,
+    ``capped_bytes``/``capped_docs`` create it as a capped collection, and
+    ``archive_after`` lets the archiver fold older rows into daily summaries
+    before deleting them. Capped collections can't carry TTL indexes or have
+    rows deleted, so capping disables the other two. ``rolled_up`` marks a
+    collection already summarised at ingest, where a TTL alone loses nothing.
+    """
+
+    collection: str
+    time_field: str
+    ttl: Optional[int] = None
+    capped_bytes: Optional[int] = None
+    capped_docs: Optional[int] = None
+    archive_after: Optional[int] = None
+    group_field: Optional[str] = None
+    rolled_up: bool = False
+
+    @classmethod
+    def from_env(cls, prefix: str, collection: str, time_field: str,
+                 group_field: Optional[str] = None, rolled_up: bool = False) -> "RetentionPolicy":
+        def number(name):
+            value = os.environ.get(f"{prefix}_{name}")
+            return int(value) if value else None
+
+        policy = cls(
+            collection, time_field,
+            ttl=number("TTL_SECONDS"),
+            capped_bytes=number("CAPPED_BYTES"),
+            capped_docs=number("CAPPED_DOCS"),
+            archive_after=number("ARCHIVE_AFTER_SECONDS"),
+            group_field=group_field,
+            rolled_up=rolled_up
+        )
+        if policy.capped_docs and not policy.capped_bytes:
+            logger.warning(f"{collection} sets {prefix}_CAPPED_DOCS without {prefix}_CAPPED_BYTES; "
+                           f"capped collections need a size, so it is not capped")
+            policy.capped_docs = None
+        if policy.capped_bytes and (policy.ttl or policy.archive_after):
+            logger.warning(f"{collection} is capped; ignoring its TTL and archive settings")
+            policy.ttl = policy.archive_after = None
+        if policy.ttl and policy.archive_after and policy.ttl <= policy.archive_after:
+            logger.warning(f"{collection} TTL ({policy.ttl}s) expires rows before the archiver "
+                           f"({policy.archive_after}s) can summarise them")
+        if policy.ttl and not policy.archive_after and not policy.rolled_up:
+            logger.warning(f"{collection} TTL ({policy.ttl}s) deletes rows that are never summarised; "
+                           f"set {prefix}_ARCHIVE_AFTER_SECONDS below it to keep daily summaries")
+        return policy
+
+    @property
+    def summary_collection(self) -> str:
+        return f"{self.collection}_daily"
+
+
+async def ensure_capped(db, policy: RetentionPolicy):
+    """Create the collection capped if it doesn't exist yet; never converts existing data"""
+    if not policy.capped_bytes:
+        return
+    if policy.collection in await db.list_collection_names(filter={"name": policy.collection}):
+        options = await db[policy.collection].options()
+        if not options.get("capped"):
+            logger.warning(f"{policy.collection} already exists uncapped; run convertToCapped "
+                           f"to cap it at {policy.capped_bytes} bytes")
+        return
+    options: Dict[str, Any] = {"capped": True, "size": policy.capped_bytes}
+    if policy.capped_docs:
+        options["max"] = policy.capped_docs
+    await db.create_collection(policy.collection, **options)
+    logger.info(f"Created capped collection {policy.collection} ({policy.capped_bytes} bytes)")
+
+
+class RetentionArchiver:
+    """Rolls raw rows past ``archive_after`` into daily summaries, then deletes them.
+
+    Rows are processed oldest first in batches so memory stays bounded. Every
+    server process runs an archiver, so each policy run holds a lease in
+    ``retention_leases``, renewed before every batch; the others skip that
+    policy until it expires. The summary upsert and the delete are separate
+    writes: a crash between them counts that batch twice on the next run
+    rather than losing it.
+    """
+
+    def __init__(self, db, policies: List[RetentionPolicy], interval: float = 3600.0, batch_size: int = 1000,
+                 lease: float = 300.0):
+        self.db = db
+        self.leases = db.retention_leases
+        self.policies = [policy for policy in policies if policy.archive_after]
+        self.interval = interval
+        self.batch_size = batch_size
+        self.lease = lease
+        self.owner = uuid.uuid4().hex
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+        self.archived = 0
+        self.runs = 0
+        self.skipped = 0
+
+    def start(self):
+        if self._task is None and self.policies:
+            self._closing = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._closing = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+
+    async def _run(self):
+        while not self._closing:
+            for policy in self.policies:
+                try:
+                    await self.archive(policy)
+                except Exception as e:
+                    logger.error(f"Error archiving {policy.collection}: {str(e)}")
+            self.runs += 1
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def archive(self, policy: RetentionPolicy, now: Optional[datetime] = None) -> int:
+        """Summarise and delete every row older than the policy's cutoff"""
+        cutoff = (now or datetime.utcnow()) - timedelta(seconds=policy.archive_after)
+        raw = self.db[policy.collection]
+        projection = {policy.time_field: 1, **({policy.group_field: 1} if policy.group_field else {})}
+        archived = 0
+        try:
+            while not self._closing:
+                # Taken and renewed per batch: while it is held, no other worker summarises these rows
+                if not await self._lease(policy):
+                    if not archived:
+                        self.skipped += 1
+                    break
+                rows = await raw.find({policy.time_field: {"$lt": cutoff}}, projection) \
+                    .sort(policy.time_field, 1).limit(self.batch_size).to_list(self.batch_size)
+                if not rows:
+                    break
+                await self._summarise(policy, rows)
+                await raw.delete_many({"_id": {"$in": [row["_id"] for row in rows]}})
+                archived += len(rows)
+                if len(rows) < self.batch_size:
+                    break
+        finally:
+            await self.leases.update_one(
+                {"_id": policy.collection, "owner": self.owner}, {"$set": {"until": datetime.utcnow()}}
+            )
+        if archived:
+            self.archived += archived
+            logger.info(f"Archived {archived} {policy.collection} rows older than {cutoff.isoformat()}")
+        return archived
+
+    async def _lease(self, policy: RetentionPolicy) -> bool:
+        """Take or renew this policy's lease; False while another worker holds it"""
+        now = datetime.utcnow()
+        try:
+            await self.leases.update_one(
+                {"_id": policy.collection, "$or": [{"owner": self.owner}, {"until": {"$lte": now}}]},
+                {"$set": {"owner": self.owner, "until": now + timedelta(seconds=self.lease)}},
+                upsert=True
+            )
+        except DuplicateKeyError:
+            # The lease exists, is held by someone else and hasn't expired, so the upsert tried to insert
+            return False
+        return True
+
+    async def _summarise(self, policy: RetentionPolicy, rows: List[Dict[str, Any]]):
+        groups: Dict[tuple, List[datetime]] = defaultdict(list)
+        for row in rows:
+            key = row.get(policy.group_field) if policy.group_field else None
+            groups[(bucket_start(row[policy.time_field], "day"), key)].append(row[policy.time_field])
+
+        updates = []
+        for (day, key), moments in groups.items():
+            on_insert: Dict[str, Any] = {"day": day}
+            if policy.group_field:
+                on_insert[policy.group_field] = key
+            updates.append(UpdateOne(
+                {"_id": f"{day:%Y-%m-%d}:{key}" if policy.group_field else f"{day:%Y-%m-%d}"},
+                {"$inc": {"count": len(moments)}, "$min": {"first": min(moments)},
+                 "$max": {"last": max(moments)}, "$setOnInsert": on_insert},
+                upsert=True
+            ))
+        await self.db[policy.summary_collection].bulk_write(updates, ordered=False)
+
+    def stats(self) -> Dict[str, int]:
+        return {"archived": self.archived, "runs": self.runs, "skipped": self.skipped}
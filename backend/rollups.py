@@ -0,0 +1,154 @@
+import logging
+from collections import Counter, deque
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from pymongo import ReturnDocument, UpdateOne
+
+logger = logging.getLogger(__name__)
+
+BUCKET_SIZES = {
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+}
+
+# Cap on points returned by a single timeseries query
+MAX_BUCKETS = 24 * 31
+
+# A bucket's downloads: those applied from flushed batches plus those found by the backfill
+BUCKET_COUNT = {"$add": [{"$ifNull": ["$count", 0]}, {"$ifNull": ["$backfill_count", 0]}]}
+
+
+def bucket_start(moment: datetime, bucket: str) -> datetime:
+    """Truncate a timestamp to the start of its hour or day bucket"""
+    if bucket == "hour":
+        return moment.replace(minute=0, second=0, microsecond=0)
+    return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+class DownloadRollups:
+    """Running totals and hourly/daily buckets for resume downloads.
+
+    Counters are maintained with ``$inc`` upserts as analytics batches are
+    flushed, so stats and timeseries reads never scan raw download rows.
+    The recent-downloads ring buffer is per process and seeded at startup.
+    """
+
+    def __init__(self, counters, buckets, raw, field: str = "download_date", recent_size: int = 10):
+        self.counters = counters
+        self.buckets = buckets
+        self.raw = raw
+        self.field = field
+        self.counter_id = raw.name
+        self._recent: deque = deque(maxlen=recent_size)
+
+    async def backfill(self):
+        """Count the raw rows that predate the rollups into the counters.
+
+        ``apply`` records the earliest download it has counted in
+        ``counting_since``; only older rows are scanned. Their counts go to
+        separate ``backfill_*`` fields with ``$set``, so a backfill
+        interrupted part way is simply redone on the next startup and never
+        overwrites the ``$inc`` of a batch applied by another worker
+        meanwhile. The counter only counts as backfilled once
+        ``backfilled`` is true; counters written before that flag existed
+        must be stamped with ``legacy: true`` (or dropped to recount).
+        """
+        marker = await self.counters.find_one_and_update(
+            {"_id": self.counter_id},
+            {"$setOnInsert": {"total": 0, "backfilled": False}, "$min": {"counting_since": datetime.utcnow()}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        if marker.get("backfilled") is True or marker.get("legacy") is True:
+            return
+
+        cutoff = marker["counting_since"]
+        field = f"${self.field}"
+        for bucket in BUCKET_SIZES:
+            parts = {"year": {"$year": field}, "month": {"$month": field}, "day": {"$dayOfMonth": field}}
+            if bucket == "hour":
+                parts["hour"] = {"$hour": field}
+            pipeline = [
+                {"$match": {self.field: {"$lt": cutoff}}},
+                {"$group": {"_id": {"$dateFromParts": parts}, "count": {"$sum": 1}}}
+            ]
+            counts = {row["_id"]: row["count"] async for row in self.raw.aggregate(pipeline)}
+            await self._apply_counts(bucket, counts, update="$set", field="backfill_count")
+        total = await self.raw.count_documents({self.field: {"$lt": cutoff}})
+        await self.counters.update_one(
+            {"_id": self.counter_id}, {"$set": {"backfill_total": total, "backfilled": True}}
+        )
+        logger.info(f"Backfilled {total} {self.counter_id} into rollups")
+
+    async def seed_recent(self):
+        """Fill the in-process ring buffer with the latest raw rows"""
+        cursor = self.raw.find({}, {"_id": 0}).sort(self.field, -1).limit(self._recent.maxlen)
+        rows = await cursor.to_list(self._recent.maxlen)
+        self._recent.clear()
+        self._recent.extend(reversed(rows))
+
+    def remember(self, document: Dict[str, Any]):
+        self._recent.append(document)
+
+    def recent(self) -> List[Dict[str, Any]]:
+        """Most recent downloads, newest first"""
+        return list(reversed(self._recent))
+
+    async def apply(self, documents: Iterable[Dict[str, Any]]):
+        """Fold a flushed batch of raw rows into the counters and buckets"""
+        documents = list(documents)
+        if not documents:
+            return
+        for bucket in BUCKET_SIZES:
+            counts = Counter(bucket_start(doc[self.field], bucket) for doc in documents)
+            await self._apply_counts(bucket, counts)
+        # A counter created here has not been backfilled; rows from counting_since on are counted here
+        await self.counters.update_one(
+            {"_id": self.counter_id},
+            {
+                "$inc": {"total": len(documents)},
+                "$min": {"counting_since": min(doc[self.field] for doc in documents)},
+                "$setOnInsert": {"backfilled": False},
+            },
+            upsert=True
+        )
+
+    async def _apply_counts(self, bucket: str, counts: Dict[datetime, int], update: str = "$inc",
+                            field: str = "count"):
+        if not counts:
+            return
+        await self.buckets.bulk_write([
+            UpdateOne(
+                {"_id": f"{bucket}:{start.isoformat()}"},
+                {update: {field: count}, "$setOnInsert": {"bucket": bucket, "start": start}},
+                upsert=True
+            )
+            for start, count in counts.items()
+        ], ordered=False)
+
+    async def total(self) -> int:
+        doc = await self.counters.find_one({"_id": self.counter_id})
+        return doc.get("total", 0) + doc.get("backfill_total", 0) if doc else 0
+
+    async def timeseries(self, bucket: str, start: Optional[datetime] = None,
+                         end: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Zero-filled counts per bucket in [start, end)"""
+        size = BUCKET_SIZES[bucket]
+        end = bucket_start(end or datetime.utcnow(), bucket) + size
+        start = bucket_start(start or end - size * (24 if bucket == "hour" else 30), bucket)
+        if (end - start) / size > MAX_BUCKETS:
+            start = end - size * MAX_BUCKETS
+
+        cursor = self.buckets.find(
+            {"bucket": bucket, "start": {"$gte": start, "$lt": end}},
+            {"_id": 0, "start": 1, "count": 1, "backfill_count": 1}
+        )
+        counts = {row["start"]: row.get("count", 0) + row.get("backfill_count", 0) async for row in cursor}
+
+        points = []
+        moment = start
+        while moment < end:
+            points.append({"start": moment, "count": counts.get(moment, 0)})
+            moment += size
+        return points
@@ -0,0 +1,235 @@
+import asyncio
+import heapq
+import html
+import logging
+import math
+import re
+from array import array
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Field weights shared by the Mongo text index and the in-process fallback
+SEARCH_WEIGHTS = {"name": 10, "company": 5, "message": 1}
+
+WORD = re.compile(r"\w+", re.UNICODE)
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have i in is it me my of on or our so that the this to "
+    "was we were will with you your".split()
+)
+SUFFIXES = ("ing", "ed", "es", "s")
+
+
+def stem(word: str) -> str:
+    """Crude suffix stripping so "roles" matches "role"; Mongo's text index uses Snowball"""
+    for suffix in SUFFIXES:
+        if len(word) > len(suffix) + 3 and word.endswith(suffix):
+            return word[:-len(suffix)]
+    return word
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return [stem(word) for word in WORD.findall((text or "").lower()) if len(word) > 1 and word not in STOPWORDS]
+
+
+def parse_query(query: str) -> Tuple[List[str], List[str]]:
+    """Split a query into wanted and excluded ("-word") terms"""
+    wanted, excluded = [], []
+    for raw in query.split():
+        target = excluded if raw.startswith("-") else wanted
+        target.extend(tokenize(raw.lstrip("-")))
+    return list(dict.fromkeys(wanted)), list(dict.fromkeys(excluded))
+
+
+def snippet(document: Dict[str, Any], terms: List[str], width: int = 60) -> Optional[str]:
+    """HTML-escaped excerpt around the first matching term, with matches wrapped in <mark>"""
+    if not terms:
+        return None
+    pattern = re.compile(r"\b(?:" + "|".join(re.escape(term) for term in terms) + r")\w*", re.IGNORECASE)
+    for field in ("message", "company", "name"):
+        text = document.get(field) or ""
+        match = pattern.search(text)
+        if match is None:
+            continue
+        start = max(0, match.start() - width)
+        end = min(len(text), match.end() + width)
+        excerpt = text[start:end]
+        parts = []
+        position = 0
+        for hit in pattern.finditer(excerpt):
+            parts.append(html.escape(excerpt[position:hit.start()]))
+            parts.append(f"<mark>{html.escape(hit.group(0))}</mark>")
+            position = hit.end()
+        parts.append(html.escape(excerpt[position:]))
+        return ("…" if start > 0 else "") + "".join(parts) + ("…" if end < len(text) else "")
+    return None
+
+
+class InvertedIndex:
+    """In-process postings for contact search when $text isn't available.
+
+    Documents are numbered by ordinal and each term keeps parallel arrays
+    of ordinals and precomputed weights, so 100k submissions cost tens of
+    megabytes rather than a dict entry per posting. Scores are stable as
+    the corpus grows (no idf), matching how keyset cursors are compared.
+    """
+
+    def __init__(self, weights: Dict[str, int] = SEARCH_WEIGHTS):
+        self.weights = weights
+        self._ids: List[str] = []
+        self._ordinals: Dict[str, int] = {}
+        self._postings: Dict[str, Tuple[array, array]] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, document: Dict[str, Any]):
+        if document["id"] in self._ordinals:
+            return
+        ordinal = len(self._ids)
+        self._ids.append(document["id"])
+        self._ordinals[document["id"]] = ordinal
+
+        scores: Dict[str, float] = {}
+        for field, weight in self.weights.items():
+            counts: Dict[str, int] = {}
+            for term in tokenize(document.get(field)):
+                counts[term] = counts.get(term, 0) + 1
+            for term, count in counts.items():
+                scores[term] = scores.get(term, 0.0) + weight * (1 + math.log(count))
+
+        for term, score in scores.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = (array("I"), array("f"))
+            postings[0].append(ordinal)
+            postings[1].append(score)
+
+    def search(self, wanted: List[str], excluded: List[str], limit: int,
+               after: Optional[Tuple[float, str]] = None) -> List[Tuple[float, str]]:
+        """Top ``limit`` (score, id) pairs ordered by score then id, descending"""
+        totals: Dict[int, float] = {}
+        for term in wanted:
+            postings = self._postings.get(term)
+            if postings is not None:
+                for ordinal, score in zip(*postings):
+                    totals[ordinal] = totals.get(ordinal, 0.0) + score
+
+        skip: Set[int] = set()
+        for term in excluded:
+            postings = self._postings.get(term)
+            if postings is not None:
+                skip.update(postings[0])
+
+        ids = self._ids
+        candidates = (
+            (round(score, 4), ids[ordinal]) for ordinal, score in totals.items() if ordinal not in skip
+        )
+        if after is not None:
+            candidates = (candidate for candidate in candidates if candidate < after)
+        return heapq.nlargest(limit, candidates)
+
+
+class ContactSearch:
+    """Ranked search over contact submissions with keyset pagination.
+
+    Uses the collection's text index when the server supports ``$text`` and
+    falls back to an :class:`InvertedIndex` built at startup and fed by new
+    submissions (per process, intended for local stand-ins).
+    """
+
+    def __init__(self, collection, fields: List[str], mode: str = "auto"):
+        self.collection = collection
+        self.fields = fields
+        self.mode = mode
+        self.backend: Optional[str] = None
+        self.index = InvertedIndex()
+        self._index_lock = asyncio.Lock()
+        self.queries = 0
+
+    async def start(self):
+        if self.mode != "memory":
+            try:
+                await self.collection.aggregate([{"$match": {"$text": {"$search": "probe"}}}, {"$limit": 1}]) \
+                    .to_list(1)
+            except Exception as e:
+                if self.mode == "text":
+                    raise
+                logger.warning(f"Text search unavailable, using the in-process index: {str(e)}")
+            else:
+                self.backend = "text"
+                return
+        await self._use_memory_index()
+
+    async def _use_memory_index(self):
+        async with self._index_lock:
+            if self.backend == "memory":
+                return
+            cursor = self.collection.find({}, {"_id": 0, "id": 1, **{field: 1 for field in SEARCH_WEIGHTS}})
+            async for document in cursor:
+                self.index.add(document)
+            self.backend = "memory"
+            logger.info(f"Indexed {len(self.index)} contact submissions for search")
+
+    def add(self, document: Dict[str, Any]):
+        if self.backend == "memory":
+            self.index.add(document)
+
+    async def search(self, query: str, limit: int, after: Optional[Tuple[float, str]] = None
+                     ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[float, str]]]:
+        """One page of results with score and snippet, plus the (score, id) to continue after"""
+        self.queries += 1
+        wanted, excluded = parse_query(query)
+        rows = None
+        if self.backend == "text":
+            try:
+                rows = await self._search_text(query, limit + 1, after)
+            except Exception as e:
+                # Some stand-ins only reject $text once the collection has documents
+                if self.mode != "auto":
+                    raise
+                logger.warning(f"Text search failed, switching to the in-process index: {str(e)}")
+                await self._use_memory_index()
+        if rows is None:
+            rows = await self._search_memory(wanted, excluded, limit + 1, after)
+
+        next_after = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_after = (rows[-1]["score"], rows[-1]["id"])
+        for row in rows:
+            row["snippet"] = snippet(row, wanted)
+        return rows, next_after
+
+    async def _search_text(self, query: str, limit: int,
+                           after: Optional[Tuple[float, str]]) -> List[Dict[str, Any]]:
+        pipeline: List[Dict[str, Any]] = [
+            {"$match": {"$text": {"$search": query}}},
+            {"$addFields": {"score": {"$round": [{"$meta": "textScore"}, 4]}}},
+        ]
+        if after is not None:
+            pipeline.append({"$match": {"$or": [
+                {"score": {"$lt": after[0]}},
+                {"score": after[0], "id": {"$lt": after[1]}},
+            ]}})
+        pipeline += [
+            {"$sort": {"score": -1, "id": -1}},
+            {"$limit": limit},
+            {"$project": {"_id": 0, "score": 1, **{field: 1 for field in self.fields}}},
+        ]
+        return await self.collection.aggregate(pipeline).to_list(limit)
+
+    async def _search_memory(self, wanted: List[str], excluded: List[str], limit: int,
+                             after: Optional[Tuple[float, str]]) -> List[Dict[str, Any]]:
+        hits = self.index.search(wanted, excluded, limit, after)
+        if not hits:
+            return []
+        projection = {"_id": 0, **{field: 1 for field in self.fields}}
+        documents = {
+            document["id"]: document
+            async for document in self.collection.find({"id": {"$in": [id for _, id in hits]}}, projection)
+        }
+        return [{**documents[id], "score": score} for score, id in hits if id in documents]
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": self.backend, "indexed": len(self.index), "queries": self.queries}
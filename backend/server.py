@@ -1,37 +1,243 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Request
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
 import os
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, EmailStr
-from typing import List, Optional
+from pymongo.errors import DuplicateKeyError
+from typing import Dict, List, Optional
+from contextlib import asynccontextmanager
 import uuid
 from datetime import datetime
+from admission import (
+    AdmissionControl, AdmissionMiddleware, AdmissionRule, ConcurrencyPool, FixedLimit, GradientLimit
+)
+from analytics import AnalyticsBuffer
+from contact_feed import ContactFeed
+from dashboard import AdminDashboard
+from database import DatabaseManager
+from dedup import ContactDeduplicator, submission_digest
+from exports import EXPORT_MEDIA_TYPES, export_headers, iter_export
+from fast_json import DefaultJSONResponse, model_projection, rows_response
+from http_cache import choose_encoding, etag_matches
+from indexes import declare_indexes, ensure_indexes
+from metrics import (
+    CONTACT_ACCEPTED, CONTACT_DUPLICATE, CONTACT_FAILED, RESUME_DOWNLOADS, MetricsMiddleware, metrics_response,
+    mongo_listeners, register_stats
+)
+from microcache import CachedValue, Microcache
+from notifications import PENDING_NOTIFICATION, NotificationOutbox, SMTPTransport, contact_notification
+from pagination import date_range, decode_cursor, decode_score_cursor, encode_score_cursor, fetch_page, naive_utc
+from portfolio import PortfolioCache
+from portfolio_data import PORTFOLIO_DATA
+from rate_limit import Limit, MemoryTokenBuckets, MongoTokenBuckets, RateLimitMiddleware, RateLimitRule
+from resume_cache import ResumeArtifactCache
+from resume_renderer import ResumeRenderService
+from retention import RetentionArchiver, RetentionPolicy, ensure_capped
+from search import ContactSearch
+from rollups import DownloadRollups
+from static_assets import StaticAssetRegistry
+from structured_logging import RequestIdMiddleware, configure_logging, parse_sample_rates
 
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# Configure logging first
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# Configure logging first; records are formatted and written off the event loop
+log_pipeline = configure_logging(
+    level=os.environ.get('LOG_LEVEL', 'INFO'),
+    fmt=os.environ.get('LOG_FORMAT', 'json'),
+    max_queue=int(os.environ.get('LOG_QUEUE_SIZE', '10000')),
+    sample_rates=parse_sample_rates(os.environ.get('LOG_SAMPLE_RATES', ''))
 )
 logger = logging.getLogger(__name__)
 
-# MongoDB connection
-mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
+# MongoDB connection, pool settings come from MONGO_* env vars; listeners feed /metrics
+database = DatabaseManager.from_env(event_listeners=mongo_listeners())
+client = database.client
+db = database.db
+
+# Resume PDF validators, hashed once and refreshed only when the file changes. Renders go to
+# a generated directory; the checked-in PDF is served until the first render lands there.
+RESUME_RENDER_DIR = Path(os.environ.get('RESUME_RENDER_DIR', ROOT_DIR / "assets" / "generated"))
+resume_cache = ResumeArtifactCache(
+    RESUME_RENDER_DIR / "Uday_Jain_Resume.pdf",
+    max_age=int(os.environ.get('RESUME_CACHE_MAX_AGE', '3600')),
+    fallback=ROOT_DIR / "assets" / "Uday_Jain_Resume.pdf"
+)
+
+# Resume and certificate PDFs served with byte ranges and precompressed variants
+static_assets = StaticAssetRegistry(
+    Path(os.environ.get('ASSET_VARIANT_DIR', ROOT_DIR / "assets" / ".variants"))
+)
+resume_asset = static_assets.register(
+    "resume", resume_cache.path, cache=resume_cache, filename="Uday_Jain_Cybersecurity_Resume.pdf"
+)
+CERTIFICATES_DIR = Path(os.environ.get('CERTIFICATES_DIR', ROOT_DIR.parent / "frontend"))
+for asset_name, asset_file in (
+    ("databricks-certificate", "Databricks Certificate.pdf"),
+    ("ecc-cct-certificate", "ECC-CCT-Certificate.pdf"),
+    ("outskill-gen-ai-certificate", "Outskill_Gen_AI.pdf"),
+    ("qualys-certificate", "Qualys certification.pdf"),
+):
+    static_assets.register(asset_name, CERTIFICATES_DIR / asset_file)
+
+# Off-loop resume renderer, re-run when the portfolio version changes; each finished render
+# re-hashes the file and rebuilds its compressed variants in a worker thread
+resume_renderer = ResumeRenderService(
+    resume_cache.path,
+    max_workers=int(os.environ.get('RESUME_RENDER_WORKERS', '1')),
+    on_rendered=lambda: static_assets.schedule_refresh(resume_asset)
+)
+
+# Pre-serialized portfolio payload, revalidated against MongoDB once per TTL; every new
+# version (saved here or picked up from another worker) re-renders the resume in the background.
+# The etag pairs the version with a content hash, so another database can't alias it.
+portfolio_cache = PortfolioCache(
+    db.portfolio,
+    ttl=float(os.environ.get('PORTFOLIO_CACHE_TTL', '30')),
+    on_change=lambda entry: resume_renderer.schedule(entry.etag.strip('"'), entry.data)
+)
+
+# Pre-aggregated download counters and hourly/daily buckets
+download_rollups = DownloadRollups(
+    db.rollup_counters,
+    db.resume_download_buckets,
+    db.resume_downloads
+)
+
+async def apply_download_batch(documents):
+    """Fold a flushed batch into the rollups, then drop cached stats that predate it"""
+    await download_rollups.apply(documents)
+    microcache.invalidate("resume_stats")
+
+# Resume download analytics are buffered and written in batches off the request path
+resume_download_buffer = AnalyticsBuffer(
+    db.resume_downloads,
+    max_batch=int(os.environ.get('ANALYTICS_BATCH_SIZE', '100')),
+    flush_interval=float(os.environ.get('ANALYTICS_FLUSH_INTERVAL', '1.0')),
+    max_queue=int(os.environ.get('ANALYTICS_MAX_QUEUE', '10000')),
+    on_flush=apply_download_batch
+)
+
+# Token buckets for the contact form; the mongo backend shares limits across workers
+if os.environ.get('RATE_LIMIT_BACKEND', 'memory') == 'mongo':
+    rate_limit_buckets = MongoTokenBuckets(db.rate_limits)
+else:
+    rate_limit_buckets = MemoryTokenBuckets(max_keys=int(os.environ.get('RATE_LIMIT_MAX_KEYS', '100000')))
+
+rate_limit_rules = [
+    RateLimitRule(
+        "POST", "/api/contact",
+        per_ip=Limit.parse(os.environ.get('CONTACT_RATE_LIMIT_IP', '10/3600')),
+        per_email=Limit.parse(os.environ.get('CONTACT_RATE_LIMIT_EMAIL', '3/3600'))
+    ),
+]
+
+# Admission control: cheap reads, writes and file serving each get their own concurrency pool.
+# Read and write limits adapt to observed latency below the configured ceiling; file
+# transfers are paced by the client, so that pool keeps a fixed limit.
+ADMISSION_QUEUE_TIMEOUT = float(os.environ.get('ADMISSION_QUEUE_TIMEOUT', '2'))
+admission_control = AdmissionControl(
+    pools=[
+        ConcurrencyPool(
+            "read",
+            GradientLimit(int(os.environ.get('ADMISSION_READ_LIMIT', '64'))),
+            max_queue=int(os.environ.get('ADMISSION_READ_QUEUE', '128')),
+            queue_timeout=ADMISSION_QUEUE_TIMEOUT
+        ),
+        ConcurrencyPool(
+            "write",
+            GradientLimit(int(os.environ.get('ADMISSION_WRITE_LIMIT', '16'))),
+            max_queue=int(os.environ.get('ADMISSION_WRITE_QUEUE', '32')),
+            queue_timeout=ADMISSION_QUEUE_TIMEOUT
+        ),
+        ConcurrencyPool(
+            "files",
+            FixedLimit(int(os.environ.get('ADMISSION_FILES_LIMIT', '16'))),
+            max_queue=int(os.environ.get('ADMISSION_FILES_QUEUE', '32')),
+            queue_timeout=ADMISSION_QUEUE_TIMEOUT
+        ),
+    ],
+    rules=[
+        AdmissionRule("GET", "/api/health/*", None),
+        AdmissionRule("GET", "/api/contact/stream", None),
+        AdmissionRule("POST", "/api/contact", "write"),
+        AdmissionRule("POST", "/api/status", "write"),
+        AdmissionRule("GET", "/api/resume/download", "files"),
+        AdmissionRule("GET", "/api/resume/downloads/export", "files"),
+        AdmissionRule("GET", "/api/contact/export", "files"),
+        AdmissionRule("GET", "/api/assets/*", "files"),
+        AdmissionRule("GET", "/api/*", "read"),
+    ],
+    retry_after=float(os.environ.get('ADMISSION_RETRY_AFTER', '1'))
+)
+
+# Repeated (email, message) pairs are rejected in memory; a unique index on a per-window
+# key is the backstop, so both forget a message after CONTACT_DEDUP_WINDOW
+contact_deduplicator = ContactDeduplicator(
+    capacity=int(os.environ.get('CONTACT_DEDUP_CAPACITY', '100000')),
+    window=float(os.environ.get('CONTACT_DEDUP_WINDOW', '86400'))
+)
+
+# Contact notification emails go through an outbox drained by background workers
+notification_outbox = NotificationOutbox(
+    db.notification_outbox,
+    db.contact_submissions,
+    transport=SMTPTransport(
+        os.environ['SMTP_HOST'],
+        port=int(os.environ.get('SMTP_PORT', '587')),
+        username=os.environ.get('SMTP_USERNAME'),
+        password=os.environ.get('SMTP_PASSWORD'),
+        starttls=os.environ.get('SMTP_STARTTLS', 'true').lower() == 'true'
+    ) if os.environ.get('SMTP_HOST') else None,
+    workers=int(os.environ.get('NOTIFICATION_WORKERS', '2'))
+)
+NOTIFY_EMAIL_TO = os.environ.get('NOTIFY_EMAIL_TO', PORTFOLIO_DATA["personalInfo"]["email"])
+NOTIFY_EMAIL_FROM = os.environ.get('SMTP_FROM', NOTIFY_EMAIL_TO)
+# Requires a replica set; otherwise the submission and its job are written back to back
+OUTBOX_TRANSACTIONS = os.environ.get('OUTBOX_TRANSACTIONS', 'false').lower() == 'true'
+
+# Raw append-only collections are bounded by TTL indexes, capping or the archiver.
+# Resume downloads are already rolled up at ingest, so a TTL alone loses nothing.
+retention_policies = [
+    RetentionPolicy.from_env('STATUS_CHECKS', 'status_checks', 'timestamp', group_field='client_name'),
+    RetentionPolicy.from_env('RESUME_DOWNLOADS', 'resume_downloads', 'download_date', rolled_up=True),
+]
+retention_archiver = RetentionArchiver(
+    db,
+    retention_policies,
+    interval=float(os.environ.get('RETENTION_ARCHIVE_INTERVAL', '3600'))
+)
+
+# Component counters are read at scrape time rather than mirrored on every event
+register_stats("resume_cache", resume_cache.stats)
+register_stats("portfolio_cache", portfolio_cache.stats)
+register_stats("analytics_buffer", resume_download_buffer.stats)
+register_stats("contact_dedup", contact_deduplicator.stats)
+register_stats("notification_outbox", notification_outbox.stats)
+register_stats("logging", log_pipeline.stats)
+register_stats("retention", retention_archiver.stats)
+register_stats("admission", admission_control.stats)
+
+# Declared indexes that failed to build at startup, by "collection.index"
+index_failures: Dict[str, str] = {}
+register_stats("indexes", lambda: {"failed": len(index_failures)})
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the database pool and background services, then drain them on shutdown"""
+    await startup()
+    yield
+    await shutdown()
 
 # Create the main app without a prefix
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # Create a router with the /api prefix
-api_router = APIRouter(prefix="/api")
+api_router = APIRouter(prefix="/api", default_response_class=DefaultJSONResponse)
 
 
 # Define Models
@@ -53,6 +259,10 @@ class ContactSubmission(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     status: str = "new"
 
+class ContactSearchResult(ContactSubmission):
+    score: float
+    snippet: Optional[str] = None
+
 class ContactSubmissionCreate(BaseModel):
     name: str
     email: EmailStr
@@ -69,8 +279,88 @@ class ResumeDownload(BaseModel):
     download_date: datetime = Field(default_factory=datetime.utcnow)
     user_agent: Optional[str] = None
 
+# Fetch only the fields each response model needs
+STATUS_CHECK_PROJECTION = model_projection(StatusCheck)
+CONTACT_SUBMISSION_PROJECTION = model_projection(ContactSubmission)
+RESUME_DOWNLOAD_PROJECTION = model_projection(ResumeDownload)
+
+# Live feed of new submissions for admin clients, one shared change stream per process
+contact_feed = ContactFeed(
+    db.contact_submissions,
+    list(ContactSubmission.model_fields),
+    mode=os.environ.get('CONTACT_STREAM_SOURCE', 'auto'),
+    buffer_size=int(os.environ.get('CONTACT_STREAM_BUFFER', '100')),
+    replay_size=int(os.environ.get('CONTACT_STREAM_REPLAY', '1000'))
+)
+register_stats("contact_feed", contact_feed.stats)
+
+# Text index search, or an in-process inverted index where $text is unsupported
+contact_search = ContactSearch(
+    db.contact_submissions,
+    list(ContactSubmission.model_fields),
+    mode=os.environ.get('CONTACT_SEARCH_BACKEND', 'auto')
+)
+register_stats("contact_search", contact_search.stats)
+
+# Admin overview, one $facet per collection; served stale while a refresh runs
+admin_dashboard = AdminDashboard(
+    db.contact_submissions,
+    db.status_checks,
+    download_rollups,
+    CONTACT_SUBMISSION_PROJECTION,
+    STATUS_CHECK_PROJECTION,
+    days=int(os.environ.get('DASHBOARD_DAYS', '30'))
+)
+dashboard_cache = CachedValue(
+    admin_dashboard.build,
+    ttl=float(os.environ.get('DASHBOARD_CACHE_TTL', '10')),
+    stale_ttl=float(os.environ.get('DASHBOARD_STALE_TTL', '60'))
+)
+register_stats("dashboard_cache", dashboard_cache.stats)
+
+# Hot reads share one in-flight computation and are reused briefly; writes invalidate
+microcache = Microcache(
+    ttl=float(os.environ.get('MICROCACHE_TTL', '1')),
+    stale_ttl=float(os.environ.get('MICROCACHE_STALE_TTL', '5')),
+    max_entries=int(os.environ.get('MICROCACHE_MAX_ENTRIES', '256'))
+)
+register_stats("microcache", microcache.stats)
+
+def parse_cursor(cursor: Optional[str], decode=decode_cursor):
+    """Decode a keyset continuation token, rejecting malformed ones with 400"""
+    if not cursor:
+        return None
+    try:
+        return decode(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def next_cursor_headers(next_cursor: Optional[str]) -> dict:
+    """Expose the keyset continuation token while keeping list response bodies"""
+    return {"X-Next-Cursor": next_cursor} if next_cursor else {}
+
+async def store_contact_submission(document: dict):
+    """Insert a submission together with its notification job"""
+    notification = contact_notification(document, NOTIFY_EMAIL_FROM, NOTIFY_EMAIL_TO)
+    if not OUTBOX_TRANSACTIONS:
+        # The notification is written with the contact in one insert, so a failed job insert
+        # leaves it pending on the contact for the outbox sweep instead of losing it
+        result = await db.contact_submissions.insert_one({**document, PENDING_NOTIFICATION: notification})
+        try:
+            await notification_outbox.queue_pending(document["id"], notification)
+        except Exception as e:
+            logger.warning(f"Notification for contact {document['id']} left for the outbox sweep: {str(e)}")
+        return result
+    
+    async with await client.start_session() as session:
+        async with session.start_transaction():
+            result = await db.contact_submissions.insert_one(document, session=session)
+            await notification_outbox.enqueue(document["id"], notification, session=session)
+            return result
+
 # Add your routes to the router instead of directly to app
 @api_router.get("/")
+@microcache.cached("root")
 async def root():
     return {"message": "Uday Jain Portfolio API - Ready to serve!"}
 
@@ -79,103 +369,294 @@ async def create_status_check(input: StatusCheckCreate):
     status_dict = input.dict()
     status_obj = StatusCheck(**status_dict)
     _ = await db.status_checks.insert_one(status_obj.dict())
+    microcache.invalidate("status")
     return status_obj
 
 @api_router.get("/status", response_model=List[StatusCheck])
-async def get_status_checks():
-    status_checks = await db.status_checks.find().to_list(1000)
-    return [StatusCheck(**status_check) for status_check in status_checks]
+@microcache.cached("status")
+async def get_status_checks(
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None
+):
+    status_checks, next_cursor = await fetch_page(
+        db.status_checks, {}, "timestamp", limit, parse_cursor(cursor), STATUS_CHECK_PROJECTION
+    )
+    # Projected rows written by this API already match StatusCheck
+    return rows_response(status_checks, StatusCheck, headers=next_cursor_headers(next_cursor))
+
+@api_router.get("/health/live")
+async def liveness():
+    """Process is up; never touches the database"""
+    return {"status": "ok"}
+
+@api_router.get("/health/ready")
+async def readiness(response: Response):
+    """Database reachable (cached ping) and not shutting down"""
+    result = await database.readiness()
+    if not result["ready"]:
+        response.status_code = 503
+    if index_failures:
+        # Reported but not fatal: the queries still work, just without these indexes
+        result["index_failures"] = sorted(index_failures)
+    return result
 
 # Portfolio API Endpoints
+@api_router.get("/portfolio")
+async def get_portfolio(request: Request):
+    """Serve portfolio content from the versioned in-process cache"""
+    try:
+        entry = await portfolio_cache.get()
+    except Exception as e:
+        logger.error(f"Error fetching portfolio: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+    
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Portfolio not found")
+    
+    headers = {"ETag": entry.etag, "Cache-Control": "public, max-age=0, must-revalidate"}
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+    
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
 @api_router.post("/contact", response_model=ContactResponse)
 async def submit_contact_form(contact_data: ContactSubmissionCreate):
     """Handle contact form submissions from potential employers"""
+    success_message = "Thank you for your message! I will get back to you within 24 hours."
     try:
+        # Drop exact and near-exact repeats before touching the database
+        digest = submission_digest(contact_data.email, contact_data.message)
+        if contact_deduplicator.is_duplicate(digest):
+            CONTACT_DUPLICATE.inc()
+            return ContactResponse(success=True, message=success_message)
+        
         # Create contact submission object
         contact_obj = ContactSubmission(**contact_data.dict())
         
         # Store in MongoDB
-        result = await db.contact_submissions.insert_one(contact_obj.dict())
+        try:
+            result = await store_contact_submission(
+                {**contact_obj.dict(), "dedup_hash": contact_deduplicator.backstop_key(digest)}
+            )
+        except DuplicateKeyError:
+            contact_deduplicator.backstop_hits += 1
+            contact_deduplicator.remember(digest)
+            CONTACT_DUPLICATE.inc()
+            return ContactResponse(success=True, message=success_message)
         
         if result.inserted_id:
-            logger.info(f"Contact form submitted by {contact_data.name} ({contact_data.email})")
+            contact_deduplicator.remember(digest)
+            contact_feed.publish_local(contact_obj.dict())
+            contact_search.add(contact_obj.dict())
+            CONTACT_ACCEPTED.inc()
+            logger.info("Contact form submitted", extra={"event": "contact_submitted", "contact_id": contact_obj.id})
             return ContactResponse(
                 success=True,
-                message="Thank you for your message! I will get back to you within 24 hours.",
+                message=success_message,
                 id=contact_obj.id
             )
         else:
             raise HTTPException(status_code=500, detail="Failed to store contact submission")
             
     except Exception as e:
+        CONTACT_FAILED.inc()
         logger.error(f"Error processing contact form: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@api_router.get("/contact")
-async def get_contact_submissions():
-    """Get all contact submissions (for admin purposes)"""
+@api_router.get("/contact", response_model=List[ContactSubmission])
+async def get_contact_submissions(
+    limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    since: Optional[datetime] = Query(None, alias="from"),
+    until: Optional[datetime] = Query(None, alias="to")
+):
+    """Get contact submissions newest first, one keyset page at a time (for admin purposes)"""
+    after = parse_cursor(cursor)
+    query = date_range("timestamp", since, until)
+    if status:
+        query["status"] = status
+    
     try:
-        submissions = await db.contact_submissions.find().sort("timestamp", -1).to_list(100)
-        return [ContactSubmission(**submission) for submission in submissions]
+        submissions, next_cursor = await fetch_page(
+            db.contact_submissions, query, "timestamp", limit, after, CONTACT_SUBMISSION_PROJECTION
+        )
+        return rows_response(submissions, ContactSubmission, headers=next_cursor_headers(next_cursor))
     except Exception as e:
         logger.error(f"Error fetching contact submissions: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@api_router.get("/contact/search", response_model=List[ContactSearchResult])
+async def search_contact_submissions(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None
+):
+    """Search submissions by name, company and message, best matches first (for admin purposes)"""
+    after = parse_cursor(cursor, decode=decode_score_cursor)
+    try:
+        results, next_after = await contact_search.search(q, limit, after)
+        next_cursor = encode_score_cursor(*next_after) if next_after else None
+        return rows_response(results, ContactSearchResult, headers=next_cursor_headers(next_cursor))
+    except Exception as e:
+        logger.error(f"Error searching contact submissions: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@api_router.get("/contact/stream")
+async def stream_contact_submissions(request: Request):
+    """Server-Sent Events feed of new contact submissions (for admin purposes)"""
+    return StreamingResponse(
+        contact_feed.subscribe(request.headers.get("last-event-id")),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@api_router.get("/contact/export")
+async def export_contact_submissions(
+    request: Request,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    batch_size: int = Query(500, ge=1, le=5000),
+    status: Optional[str] = None,
+    since: Optional[datetime] = Query(None, alias="from"),
+    until: Optional[datetime] = Query(None, alias="to")
+):
+    """Stream contact submissions as NDJSON or CSV (for admin purposes)"""
+    query = date_range("timestamp", since, until)
+    if status:
+        query["status"] = status
+    
+    cursor = db.contact_submissions.find(query, CONTACT_SUBMISSION_PROJECTION) \
+        .sort([("timestamp", -1), ("id", -1)]).batch_size(batch_size)
+    compress = choose_encoding(request.headers.get("accept-encoding"), ["gzip"]) == "gzip"
+    return StreamingResponse(
+        iter_export(cursor, list(ContactSubmission.model_fields), format, batch_size, compress),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers=export_headers("contact_submissions", format, compress)
+    )
+
 @api_router.get("/resume/download")
 async def download_resume(request: Request):
     """Serve downloadable resume PDF and track analytics"""
     try:
-        # Track download analytics
+        # Track download analytics (range requests resume an already counted download)
         user_agent = request.headers.get("user-agent")
-        download_record = ResumeDownload(user_agent=user_agent)
-        await db.resume_downloads.insert_one(download_record.dict())
+        if "range" not in request.headers:
+            download_record = ResumeDownload(user_agent=user_agent)
+            resume_download_buffer.record(download_record.dict())
+            download_rollups.remember(download_record.dict())
+            RESUME_DOWNLOADS.inc()
         
-        # Path to resume file
-        resume_path = ROOT_DIR / "assets" / "Uday_Jain_Resume.pdf"
+        # Revalidating the portfolio schedules a background render when its version changed;
+        # meanwhile the last good file is served, and only a missing one is waited for
+        portfolio = await portfolio_cache.get()
+        if not resume_cache.exists():
+            if portfolio is None:
+                raise RuntimeError("No portfolio document to render the resume from")
+            await resume_renderer.ensure(portfolio.etag.strip('"'), portfolio.data)
         
-        # Check if resume file exists, if not create a placeholder
-        if not resume_path.exists():
-            # Create assets directory if it doesn't exist
-            os.makedirs(resume_path.parent, exist_ok=True)
-            
-            # For now, return a JSON response indicating resume is being generated
-            return {
-                "success": True,
-                "message": "Resume download will begin shortly. Please check back later for the PDF file.",
-                "note": "Resume file is being prepared"
-            }
+        # Validators, conditional requests and byte ranges are handled by the asset registry
+        response = await static_assets.respond(resume_asset, request, disposition="attachment")
+        if response is None:
+            raise RuntimeError("Resume render produced no file")
         
-        logger.info(f"Resume downloaded - User Agent: {user_agent}")
+        if response.status_code == 200:
+            logger.info("Resume downloaded", extra={"event": "resume_download", "user_agent": user_agent})
         
-        # Return the file for download
-        return FileResponse(
-            path=resume_path,
-            filename="Uday_Jain_Cybersecurity_Resume.pdf",
-            media_type="application/pdf"
-        )
+        return response
         
     except Exception as e:
         logger.error(f"Error processing resume download: {str(e)}")
         raise HTTPException(status_code=500, detail="Resume download failed")
 
 @api_router.get("/resume/stats")
+@microcache.cached("resume_stats")
 async def get_resume_download_stats():
     """Get resume download statistics"""
     try:
-        total_downloads = await db.resume_downloads.count_documents({})
-        recent_downloads = await db.resume_downloads.find().sort("download_date", -1).limit(10).to_list(10)
+        total_downloads = await download_rollups.total()
         
         return {
             "total_downloads": total_downloads,
-            "recent_downloads": [ResumeDownload(**download) for download in recent_downloads]
+            "recent_downloads": [ResumeDownload(**download) for download in download_rollups.recent()],
+            "cache": resume_cache.stats(),
+            "analytics": resume_download_buffer.stats()
         }
     except Exception as e:
         logger.error(f"Error fetching resume stats: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@api_router.get("/resume/stats/timeseries")
+async def get_resume_download_timeseries(
+    bucket: str = Query("hour", pattern="^(hour|day)$"),
+    start: Optional[datetime] = Query(None, alias="from"),
+    end: Optional[datetime] = Query(None, alias="to")
+):
+    """Get resume downloads per hour or day from the rollup buckets"""
+    try:
+        points = await download_rollups.timeseries(bucket, naive_utc(start), naive_utc(end))
+        return {"bucket": bucket, "points": points}
+    except Exception as e:
+        logger.error(f"Error fetching resume timeseries: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@api_router.get("/resume/downloads/export")
+async def export_resume_downloads(
+    request: Request,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    batch_size: int = Query(500, ge=1, le=5000),
+    since: Optional[datetime] = Query(None, alias="from"),
+    until: Optional[datetime] = Query(None, alias="to")
+):
+    """Stream raw resume download analytics as NDJSON or CSV"""
+    cursor = db.resume_downloads.find(
+        date_range("download_date", since, until), RESUME_DOWNLOAD_PROJECTION
+    ).sort("download_date", -1).batch_size(batch_size)
+    compress = choose_encoding(request.headers.get("accept-encoding"), ["gzip"]) == "gzip"
+    return StreamingResponse(
+        iter_export(cursor, list(ResumeDownload.model_fields), format, batch_size, compress),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers=export_headers("resume_downloads", format, compress)
+    )
+
+@api_router.get("/admin/dashboard")
+async def get_admin_dashboard():
+    """Contact, status check and download overview for the admin dashboard"""
+    try:
+        return await dashboard_cache.get()
+    except Exception as e:
+        logger.error(f"Error building admin dashboard: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@api_router.get("/assets/{name}")
+async def get_static_asset(name: str, request: Request):
+    """Serve a resume or certificate PDF with Range and precompression support"""
+    asset = static_assets.get(name)
+    response = await static_assets.respond(asset, request) if asset else None
+    if response is None:
+        raise HTTPException(status_code=404, detail="Asset not found")
+    return response
+
 # Include the router in the main app
 app.include_router(api_router)
 
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Prometheus scrape endpoint"""
+    return metrics_response()
+
+# Added before CORS so 429 responses still carry CORS headers
+app.add_middleware(
+    RateLimitMiddleware,
+    buckets=rate_limit_buckets,
+    rules=rate_limit_rules,
+    trust_forwarded_for=os.environ.get('RATE_LIMIT_TRUST_FORWARDED_FOR', 'false').lower() == 'true',
+    proxy_hops=int(os.environ.get('RATE_LIMIT_PROXY_HOPS', '1'))
+)
+
+# Sheds load before rate limit lookups and handlers run; inside CORS so 503s carry CORS headers
+if os.environ.get('ADMISSION_CONTROL', 'true').lower() == 'true':
+    app.add_middleware(AdmissionMiddleware, control=admission_control)
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
@@ -184,6 +665,83 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    client.close()
+app.add_middleware(RequestIdMiddleware)
+
+# Outermost, so rate limited and CORS preflight responses are timed too
+app.add_middleware(MetricsMiddleware, routes=app.routes)
+
+async def bootstrap_indexes():
+    for policy in retention_policies:
+        try:
+            await ensure_capped(db, policy)
+        except Exception as e:
+            logger.error(f"Error capping {policy.collection}: {str(e)}")
+    
+    ttls = {policy.collection: policy.ttl for policy in retention_policies}
+    index_failures.clear()
+    index_failures.update(await ensure_indexes(db, declare_indexes(
+        status_checks_ttl=ttls['status_checks'],
+        resume_downloads_ttl=ttls['resume_downloads']
+    )))
+
+async def prepare_rate_limits():
+    if isinstance(rate_limit_buckets, MongoTokenBuckets):
+        try:
+            await rate_limit_buckets.ensure_indexes()
+        except Exception as e:
+            logger.error(f"Error creating rate limit indexes: {str(e)}")
+
+async def start_analytics_buffer():
+    try:
+        await download_rollups.backfill()
+        await download_rollups.seed_recent()
+    except Exception as e:
+        logger.error(f"Error preparing download rollups: {str(e)}")
+    resume_download_buffer.start()
+
+async def prime_portfolio_cache():
+    try:
+        await portfolio_cache.ensure_seeded(PORTFOLIO_DATA)
+        await portfolio_cache.get()
+    except Exception as e:
+        logger.error(f"Error priming portfolio cache: {str(e)}")
+
+async def start_contact_feed():
+    try:
+        await contact_feed.start()
+    except Exception as e:
+        logger.error(f"Error starting contact feed: {str(e)}")
+
+async def start_contact_search():
+    try:
+        await contact_search.start()
+    except Exception as e:
+        logger.error(f"Error starting contact search: {str(e)}")
+
+async def startup():
+    log_pipeline.start()
+    await database.warm()
+    await bootstrap_indexes()
+    await prepare_rate_limits()
+    notification_outbox.start()
+    await start_analytics_buffer()
+    await static_assets.prepare()
+    await prime_portfolio_cache()
+    retention_archiver.start()
+    await start_contact_feed()
+    await start_contact_search()
+
+async def shutdown():
+    # Fail readiness first so load balancers stop routing here
+    database.draining = True
+    
+    # End live feeds so admin clients reconnect to another instance
+    await contact_feed.stop()
+    
+    # Drain buffered analytics and in-flight notifications before the client goes away
+    await resume_download_buffer.stop()
+    await notification_outbox.stop()
+    await retention_archiver.stop()
+    resume_renderer.shutdown()
+    database.close()
+    log_pipeline.stop()
@@ -0,0 +1,286 @@
+import asyncio
+import gzip
+import logging
+import mmap
+import os
+import re
+import tempfile
+import uuid
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
+
+from http_cache import choose_encoding
+from resume_cache import ResumeArtifact, ResumeArtifactCache
+
+try:
+    import brotli
+except ImportError:  # Optional: only gzip variants are built without it
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+# Maximum ranges honoured in one request; more are treated as abuse and ignored
+MAX_RANGES = 16
+
+RANGE_SPEC = re.compile(r"^\s*(\d*)\s*-\s*(\d*)\s*$")
+
+
+def parse_range(header: str, size: int) -> Optional[List[Tuple[int, int]]]:
+    """Parse a bytes Range header into inclusive (start, end) pairs.
+
+    Returns None when the header should be ignored (bad syntax or too many
+    ranges) and an empty list when no range is satisfiable.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or not spec:
+        return None
+    parts = spec.split(",")
+    if len(parts) > MAX_RANGES:
+        return None
+
+    ranges = []
+    for part in parts:
+        match = RANGE_SPEC.match(part)
+        if not match or match.groups() == ("", ""):
+            return None
+        first, last = match.groups()
+        if first == "":
+            # Suffix range: the last N bytes
+            length = int(last)
+            if length == 0 or size == 0:
+                continue
+            ranges.append((max(size - length, 0), size - 1))
+            continue
+        start = int(first)
+        if last and int(last) < start:
+            return None
+        if start >= size:
+            continue
+        end = min(int(last), size - 1) if last else size - 1
+        ranges.append((start, end))
+    return ranges
+
+
+class StaticAsset:
+    """A servable file with cached validators, an mmap view and precompressed variants"""
+
+    def __init__(self, name: str, cache: ResumeArtifactCache, media_type: str = "application/pdf",
+                 filename: Optional[str] = None):
+        self.name = name
+        self.cache = cache
+        self.media_type = media_type
+        self.filename = filename or cache.path.name
+        # (etag, {encoding: path}) swapped in as one value, as variants are built in a worker thread
+        self._variants: Tuple[Optional[str], Dict[str, Path]] = (None, {})
+        self._view: Optional[mmap.mmap] = None
+        self._view_for: Optional[str] = None
+
+    def view(self, artifact: ResumeArtifact) -> mmap.mmap:
+        """Memory map of the file, reopened when its content changes"""
+        if self._view is None or self._view_for != artifact.etag:
+            with open(artifact.path, "rb") as f:
+                # Dropping the old map lets in-flight responses finish with it
+                self._view = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view_for = artifact.etag
+        return self._view
+
+    def variants_for(self, artifact: ResumeArtifact) -> Optional[Dict[str, Path]]:
+        """Compressed variants of exactly this version of the file, None until they are built"""
+        etag, variants = self._variants
+        return variants if etag == artifact.etag else None
+
+    def build_variants(self, artifact: ResumeArtifact, variant_dir: Path, min_saving: float):
+        """Write gzip/brotli copies that are at least min_saving smaller than the original.
+
+        Blocking (hashing and compression at the highest levels), so it runs in
+        a worker thread; variants of older versions of the file are deleted.
+        """
+        if self._variants[0] == artifact.etag:
+            return
+        variants: Dict[str, Path] = {}
+        if artifact.size == 0:
+            self._variants = (artifact.etag, variants)
+            return
+
+        with open(artifact.path, "rb") as f:
+            data = f.read()
+        encoders = {"gzip": lambda raw: gzip.compress(raw, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            encoders["br"] = lambda raw: brotli.compress(raw, quality=11)
+
+        os.makedirs(variant_dir, exist_ok=True)
+        for encoding, encode in encoders.items():
+            variant_path = variant_dir / f"{self.name}.{artifact.etag.strip(chr(34))[:16]}.{encoding}"
+            if not variant_path.exists():
+                encoded = encode(data)
+                if len(encoded) > artifact.size * (1 - min_saving):
+                    logger.info(f"Skipping {encoding} variant for {self.name}: saves too little")
+                    continue
+                fd, tmp_path = tempfile.mkstemp(dir=variant_dir, prefix=".variant-")
+                with os.fdopen(fd, "wb") as f:
+                    f.write(encoded)
+                os.replace(tmp_path, variant_path)
+            variants[encoding] = variant_path
+        self._variants = (artifact.etag, variants)
+
+        current = {path.name for path in variants.values()}
+        for stale in variant_dir.glob(f"{self.name}.*"):
+            if stale.name not in current:
+                try:
+                    stale.unlink()
+                except FileNotFoundError:
+                    pass
+
+
+class StaticAssetRegistry:
+    """Named static assets served with validators, byte ranges and precompression"""
+
+    def __init__(self, variant_dir: Path, min_saving: float = 0.1):
+        self.variant_dir = Path(variant_dir)
+        self.min_saving = min_saving
+        self.assets: Dict[str, StaticAsset] = {}
+        self._refreshing: Dict[str, asyncio.Future] = {}
+
+    def register(self, name: str, path: Path, cache: Optional[ResumeArtifactCache] = None,
+                 **kwargs) -> StaticAsset:
+        asset = StaticAsset(name, cache or ResumeArtifactCache(path), **kwargs)
+        self.assets[name] = asset
+        return asset
+
+    def get(self, name: str) -> Optional[StaticAsset]:
+        return self.assets.get(name)
+
+    async def prepare(self):
+        """Hash every asset and build its compressed variants"""
+        for asset in self.assets.values():
+            if not await self.refresh(asset):
+                logger.warning(f"Static asset {asset.name} not found at {asset.cache.path}")
+
+    async def refresh(self, asset: StaticAsset) -> bool:
+        """Re-hash asset and rebuild its variants off the event loop; False if the file is missing"""
+        artifact = await asyncio.to_thread(asset.cache.get)
+        if artifact is None:
+            return False
+        await asyncio.to_thread(asset.build_variants, artifact, self.variant_dir, self.min_saving)
+        return True
+
+    def schedule_refresh(self, asset: StaticAsset):
+        """Start a background refresh of asset unless one is already running"""
+        task = self._refreshing.get(asset.name)
+        if task is None or task.done():
+            task = self._refreshing[asset.name] = asyncio.ensure_future(self.refresh(asset))
+            task.add_done_callback(self._log_failure)
+
+    @staticmethod
+    def _log_failure(task: asyncio.Future):
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Error preparing static asset: {str(task.exception())}")
+
+    async def respond(self, asset: StaticAsset, request: Request,
+                      disposition: str = "inline") -> Optional[Response]:
+        """Build the response for a GET of asset, or None if the file is missing.
+
+        A changed file is re-hashed in a worker thread, and until its
+        variants are rebuilt in the background it is served uncompressed.
+        """
+        artifact = asset.cache.peek()
+        if artifact is None:
+            artifact = await asyncio.to_thread(asset.cache.get)
+            if artifact is None:
+                return None
+        variants = asset.variants_for(artifact)
+        if variants is None:
+            self.schedule_refresh(asset)
+            variants = {}
+
+        range_header = request.headers.get("range")
+        if_range = request.headers.get("if-range")
+        if range_header and if_range and if_range not in (artifact.etag, artifact.last_modified):
+            range_header = None
+
+        # Compressed variants are only used for whole-file responses
+        encoding = None
+        if not range_header:
+            available = [e for e in ("br", "gzip") if e in variants]
+            encoding = choose_encoding(request.headers.get("accept-encoding"), available)
+
+        etag = f'{artifact.etag[:-1]}-{encoding}"' if encoding else artifact.etag
+        headers = asset.cache.headers(artifact)
+        headers.update({
+            "ETag": etag,
+            "Accept-Ranges": "bytes",
+            "Content-Disposition": f'{disposition}; filename="{asset.filename}"',
+        })
+        if variants:
+            headers["Vary"] = "Accept-Encoding"
+
+        if asset.cache.is_not_modified(
+            artifact,
+            request.headers.get("if-none-match"),
+            request.headers.get("if-modified-since"),
+            etag
+        ):
+            headers.pop("Content-Disposition")
+            return Response(status_code=304, headers=headers)
+
+        if range_header:
+            ranges = parse_range(range_header, artifact.size)
+            if ranges == []:
+                headers["Content-Range"] = f"bytes */{artifact.size}"
+                return Response(status_code=416, headers=headers)
+            if ranges:
+                return self._partial(asset, artifact, ranges, headers)
+
+        if encoding:
+            headers["Content-Encoding"] = encoding
+            return FileResponse(variants[encoding], media_type=asset.media_type, headers=headers)
+
+        # FileResponse uses the server's zero-copy sendfile extension when available
+        return FileResponse(artifact.path, media_type=asset.media_type, headers=headers)
+
+    def _partial(self, asset: StaticAsset, artifact: ResumeArtifact, ranges: List[Tuple[int, int]],
+                 headers: Dict[str, str]) -> Response:
+        view = asset.view(artifact)
+
+        if len(ranges) == 1:
+            start, end = ranges[0]
+            headers["Content-Range"] = f"bytes {start}-{end}/{artifact.size}"
+            headers["Content-Length"] = str(end - start + 1)
+            return StreamingResponse(_slices(view, start, end), status_code=206,
+                                     media_type=asset.media_type, headers=headers)
+
+        boundary = uuid.uuid4().hex
+        part_headers = [
+            (f"--{boundary}\r\nContent-Type: {asset.media_type}\r\n"
+             f"Content-Range: bytes {start}-{end}/{artifact.size}\r\n\r\n").encode("ascii")
+            for start, end in ranges
+        ]
+        closing = f"\r\n--{boundary}--\r\n".encode("ascii")
+        length = sum(len(h) + end - start + 1 for h, (start, end) in zip(part_headers, ranges))
+        length += 2 * (len(ranges) - 1) + len(closing)
+
+        def body() -> Iterator[bytes]:
+            for index, (part_header, (start, end)) in enumerate(zip(part_headers, ranges)):
+                if index:
+                    yield b"\r\n"
+                yield part_header
+                yield from _slices(view, start, end)
+            yield closing
+
+        headers["Content-Length"] = str(length)
+        return StreamingResponse(body(), status_code=206,
+                                 media_type=f"multipart/byteranges; boundary={boundary}", headers=headers)
+
+
+def _slices(view: mmap.mmap, start: int, end: int) -> Iterator[bytes]:
+    """Chunks of view[start:end] inclusive, copied from the page cache one at a time"""
+    position = start
+    while position <= end:
+        stop = min(position + CHUNK_SIZE, end + 1)
+        yield view[position:stop]
+        position = stop
@@ -0,0 +1,178 @@
+import logging
+import queue
+import random
+import threading
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional
+
+from fast_json import dumps
+
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# Attributes every LogRecord has; anything else came in through ``extra=``
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "request_id"}
+
+
+def parse_sample_rates(spec: str) -> Dict[str, float]:
+    """Parse "event=rate,event=rate" (e.g. "resume_download=0.1")"""
+    rates = {}
+    for item in spec.split(","):
+        if "=" in item:
+            event, rate = item.split("=", 1)
+            rates[event.strip()] = min(1.0, max(0.0, float(rate)))
+    return rates
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per line: timestamp, level, logger, message, request id and extra fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if getattr(record, "request_id", None):
+            entry["request_id"] = record.request_id
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value if isinstance(value, (str, int, float, bool, type(None))) else str(value)
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return dumps(entry).decode("utf-8")
+
+
+class RequestContextFilter(logging.Filter):
+    """Tags records with the current request id and samples high-volume events.
+
+    Runs on the calling thread, where the request's context variables are
+    visible; records carrying ``extra={"event": name}`` are kept with the
+    probability configured for that event.
+    """
+
+    def __init__(self, sample_rates: Optional[Dict[str, float]] = None):
+        super().__init__()
+        self.sample_rates = sample_rates or {}
+        self.sampled_out = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = self.sample_rates.get(getattr(record, "event", None))
+        if rate is not None and rate < 1.0 and random.random() >= rate:
+            self.sampled_out += 1
+            return False
+        record.request_id = request_id_var.get()
+        return True
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """Hands records to the listener thread without formatting or blocking.
+
+    Formatting happens on the listener thread, so callers must not mutate
+    objects passed as log arguments. When the queue is full the record is
+    dropped and counted rather than stalling the event loop.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogPipeline:
+    """Root logging through a bounded queue drained by a single writer thread"""
+
+    def __init__(self, handlers: List[logging.Handler], max_queue: int = 10000,
+                 sample_rates: Optional[Dict[str, float]] = None):
+        self.queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self.handler = NonBlockingQueueHandler(self.queue)
+        self.context = RequestContextFilter(sample_rates)
+        self.handler.addFilter(self.context)
+        self.listener = QueueListener(self.queue, *handlers, respect_handler_level=True)
+        self._lock = threading.Lock()
+        self._running = False
+
+    def install(self, level: int):
+        root = logging.getLogger()
+        for existing in root.handlers[:]:
+            root.removeHandler(existing)
+        root.addHandler(self.handler)
+        root.setLevel(level)
+
+    def start(self):
+        with self._lock:
+            if not self._running:
+                self.listener.start()
+                self._running = True
+
+    def stop(self):
+        """Flush queued records and stop the writer thread"""
+        with self._lock:
+            if self._running:
+                self.listener.stop()
+                self._running = False
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queued": self.queue.qsize(),
+            "dropped": self.handler.dropped,
+            "sampled_out": self.context.sampled_out,
+        }
+
+
+def configure_logging(level: str = "INFO", fmt: str = "json", max_queue: int = 10000,
+                      sample_rates: Optional[Dict[str, float]] = None) -> LogPipeline:
+    stream = logging.StreamHandler()
+    if fmt == "json":
+        stream.setFormatter(JSONFormatter())
+    else:
+        stream.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    pipeline = LogPipeline([stream], max_queue=max_queue, sample_rates=sample_rates)
+    pipeline.install(logging.getLevelName(level.upper()))
+    pipeline.start()
+    return pipeline
+
+
+class RequestIdMiddleware:
+    """ASGI middleware binding a request id for log records and echoing it as X-Request-ID"""
+
+    def __init__(self, app, header: str = "x-request-id"):
+        self.app = app
+        self.header = header.encode("latin-1")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == self.header:
+                # Trust a caller supplied id only if it's short and printable
+                candidate = value.decode("latin-1")
+                if 0 < len(candidate) <= 128 and candidate.isprintable():
+                    request_id = candidate
+                break
+        request_id = request_id or uuid.uuid4().hex
+        token = request_id_var.set(request_id)
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), (self.header, request_id.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Resume Download Analytics Benchmark
+Compares request throughput when every download awaits insert_one against
+queueing the record in AnalyticsBuffer and writing with insert_many
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from analytics import AnalyticsBuffer
+
+REQUESTS = 5000
+CONCURRENCY = 50
+ROUND_TRIP = 0.002  # Simulated MongoDB round-trip latency in seconds
+
+
+class SimulatedCollection:
+    """Stand-in collection where every call costs one network round trip"""
+
+    def __init__(self):
+        self.documents = 0
+        self.calls = 0
+
+    async def insert_one(self, document):
+        await asyncio.sleep(ROUND_TRIP)
+        self.calls += 1
+        self.documents += 1
+
+    async def insert_many(self, documents, ordered=True):
+        await asyncio.sleep(ROUND_TRIP)
+        self.calls += 1
+        self.documents += len(documents)
+
+
+async def drive(handler) -> float:
+    """Run REQUESTS handler calls with CONCURRENCY workers; return requests/sec"""
+    remaining = iter(range(REQUESTS))
+
+    async def worker():
+        for i in remaining:
+            await handler({"id": str(i), "user_agent": "bench"})
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(CONCURRENCY)])
+    return REQUESTS / (time.perf_counter() - start)
+
+
+async def main():
+    direct = SimulatedCollection()
+    direct_rps = await drive(direct.insert_one)
+
+    batched = SimulatedCollection()
+    buffer = AnalyticsBuffer(batched, max_batch=100, flush_interval=0.05)
+    buffer.start()
+
+    async def record(document):
+        buffer.record(document)
+        await asyncio.sleep(0)
+
+    batched_rps = await drive(record)
+    await buffer.stop()
+
+    print(f"Requests: {REQUESTS}, concurrency: {CONCURRENCY}, round trip: {ROUND_TRIP * 1000:.1f} ms")
+    print(f"Per-request insert_one: {direct_rps:,.0f} req/s, {direct.calls} round trips")
+    print(f"Batched insert_many:    {batched_rps:,.0f} req/s, {batched.calls} round trips, "
+          f"{batched.documents} documents written")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
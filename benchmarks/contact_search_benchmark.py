@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Contact Search Benchmark
+Builds 100k synthetic contact submissions and compares ranked search through
+the in-process inverted index against a case-insensitive regex scan over
+name, company and message. With --mongo-url it also loads the rows into a
+scratch database and compares the $text index against a $regex query.
+
+Usage: python benchmarks/contact_search_benchmark.py [--mongo-url mongodb://localhost:27017]
+"""
+
+import argparse
+import asyncio
+import heapq
+import random
+import re
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from search import SEARCH_WEIGHTS, InvertedIndex, parse_query
+
+ROWS = 100_000
+LIMIT = 20
+QUERIES = ["kafka", "security engineer", "databricks pipeline", "cloud -azure", "recruiter fintech"]
+
+COMPANIES = ["Acme Security", "Databricks", "Qualys", "Fintech Labs", "Cloudworks", None]
+TOPICS = [
+    "We are hiring a security engineer for our SOC team",
+    "Kafka pipelines and data engineering roles are open",
+    "Looking for a cloud architect with AWS and Azure experience",
+    "Our recruiter would like to discuss a fintech opportunity",
+    "Interested in your Databricks certification and pipeline work",
+    "Quick question about your portfolio projects",
+]
+
+
+def build_rows():
+    random.seed(7)
+    now = datetime.utcnow()
+    return [{
+        "id": str(uuid.uuid4()),
+        "name": f"{random.choice(['Alex', 'Sam', 'Priya', 'Chen', 'Maria'])} {i}",
+        "email": f"lead{i}@example.com",
+        "company": random.choice(COMPANIES),
+        "message": f"{random.choice(TOPICS)}. {random.choice(TOPICS)}. Reference {i}.",
+        "timestamp": now - timedelta(minutes=i),
+        "status": "new",
+    } for i in range(ROWS)]
+
+
+def regex_scan(rows, query):
+    """Top LIMIT rows by weighted match count, scanning every row"""
+    wanted, excluded = parse_query(query)
+    # Whole words plus the suffixes the index's stemmer strips
+    want = re.compile(r"\b(?:" + "|".join(map(re.escape, wanted)) + r")(?:ing|ed|es|s)?\b", re.IGNORECASE)
+    skip = re.compile(r"\b(?:" + "|".join(map(re.escape, excluded)) + r")(?:ing|ed|es|s)?\b",
+                      re.IGNORECASE) if excluded else None
+    scored = []
+    for row in rows:
+        score = sum(weight * len(want.findall(row[field] or "")) for field, weight in SEARCH_WEIGHTS.items())
+        if score and not (skip and any(skip.search(row[field] or "") for field in SEARCH_WEIGHTS)):
+            scored.append((score, row["id"]))
+    return heapq.nlargest(LIMIT, scored)
+
+
+def timed(fn, repeat=5):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+async def mongo_comparison(url, rows):
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from pymongo import TEXT
+
+    client = AsyncIOMotorClient(url)
+    db = client[f"search_benchmark_{uuid.uuid4().hex[:8]}"]
+    try:
+        await db.contacts.insert_many([dict(row) for row in rows])
+        await db.contacts.create_index([(field, TEXT) for field in SEARCH_WEIGHTS], weights=SEARCH_WEIGHTS)
+        print("\n🍃 MongoDB $text vs $regex")
+        for query in QUERIES:
+            start = time.perf_counter()
+            await db.contacts.aggregate([
+                {"$match": {"$text": {"$search": query}}},
+                {"$addFields": {"score": {"$meta": "textScore"}}},
+                {"$sort": {"score": -1, "id": -1}},
+                {"$limit": LIMIT},
+            ]).to_list(LIMIT)
+            text_ms = (time.perf_counter() - start) * 1000
+            wanted, _ = parse_query(query)
+            pattern = "|".join(map(re.escape, wanted))
+            start = time.perf_counter()
+            regex_filter = {"$or": [{field: {"$regex": pattern, "$options": "i"}} for field in SEARCH_WEIGHTS]}
+            await db.contacts.find(regex_filter).limit(LIMIT).to_list(LIMIT)
+            regex_ms = (time.perf_counter() - start) * 1000
+            print(f"   {query:<22} $text {text_ms:>8.2f} ms   $regex {regex_ms:>8.2f} ms")
+    finally:
+        await client.drop_database(db.name)
+        client.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mongo-url", help="also compare $text and $regex on a real mongod")
+    args = parser.parse_args()
+
+    rows = build_rows()
+    print(f"🚀 {ROWS:,} synthetic contact submissions")
+
+    start = time.perf_counter()
+    index = InvertedIndex()
+    for row in rows:
+        index.add(row)
+    build_s = time.perf_counter() - start
+
+    tracemalloc.start()
+    traced = InvertedIndex()
+    for row in rows:
+        traced.add(row)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"   inverted index built in {build_s:.1f}s, {size / 1024 / 1024:.1f} MiB")
+
+    failures = 0
+    for query in QUERIES:
+        wanted, excluded = parse_query(query)
+        index_ms, hits = timed(lambda: index.search(wanted, excluded, LIMIT))
+        scan_ms, scanned = timed(lambda: regex_scan(rows, query), repeat=1)
+        ok = len(hits) == len(scanned)
+        failures += not ok
+        print(f"{'✅ PASS' if ok else '❌ FAIL'} {query:<22} index {index_ms:>8.2f} ms   "
+              f"regex scan {scan_ms:>8.2f} ms   ({scan_ms / index_ms:.0f}x)")
+
+    if args.mongo_url:
+        asyncio.run(mongo_comparison(args.mongo_url, rows))
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
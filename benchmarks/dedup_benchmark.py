@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Contact Dedup Filter Benchmark
+Fills the rotating Bloom filter to capacity, measures its empirical false
+positive rate against distinct submissions and reports its memory footprint
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from dedup import RotatingBloomFilter, submission_digest
+
+CAPACITY = 100_000
+PROBES = 1_000_000
+
+
+def main() -> int:
+    failures = 0
+    for error_rate in (1e-3, 1e-6):
+        bloom = RotatingBloomFilter(capacity=CAPACITY, error_rate=error_rate, window=3600)
+        for i in range(CAPACITY - 1):
+            bloom.add(submission_digest(f"bot{i}@example.com", f"Buy cheap followers now #{i}"))
+
+        start = time.perf_counter()
+        false_positives = sum(
+            submission_digest(f"person{i}@example.com", f"Genuine enquiry {i}") in bloom
+            for i in range(PROBES)
+        )
+        per_check = (time.perf_counter() - start) / PROBES
+
+        # Near-exact repeats must still be caught
+        repeat = submission_digest(" BOT1@Example.com", "buy CHEAP followers, now!! #1")
+        observed = false_positives / PROBES
+        ok = repeat in bloom and observed <= error_rate * 3
+        failures += not ok
+        status = "✅ PASS" if ok else "❌ FAIL"
+        print(f"{status} target {error_rate:g}: observed false positive rate {observed:.2e} "
+              f"({false_positives}/{PROBES}), {bloom.memory_bytes() / 1024:.0f} KiB, "
+              f"{per_check * 1e6:.2f} us/check")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Streaming Export Memory Benchmark
+Drives iter_export over 100k synthetic contact submissions and asserts that
+peak memory stays bounded, compared with materializing the rows first
+"""
+
+import asyncio
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from exports import iter_export
+
+ROWS = 100_000
+BATCH_SIZE = 500
+PEAK_LIMIT = 4 * 1024 * 1024  # bytes
+FIELDS = ["id", "name", "email", "company", "message", "timestamp", "status"]
+
+
+class SyntheticCursor:
+    """Async cursor that generates rows lazily, like a Motor cursor"""
+
+    def __init__(self, rows: int):
+        self.rows = rows
+        self.start = datetime(2025, 1, 1)
+
+    async def __aiter__(self):
+        for i in range(self.rows):
+            yield {
+                "id": str(uuid.uuid4()),
+                "name": f"Recruiter {i}",
+                "email": f"recruiter{i}@example.com",
+                "company": f"Company {i % 500}",
+                "message": "Interested in discussing a security analyst role with your team. " * 3,
+                "timestamp": self.start + timedelta(seconds=i),
+                "status": "new",
+            }
+
+
+async def measure(fmt: str, compress: bool):
+    tracemalloc.start()
+    written = 0
+    start = time.perf_counter()
+    async for chunk in iter_export(SyntheticCursor(ROWS), FIELDS, fmt, BATCH_SIZE, compress):
+        written += len(chunk)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return written, peak, elapsed
+
+
+async def measure_materialized():
+    tracemalloc.start()
+    rows = [row async for row in SyntheticCursor(ROWS)]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del rows
+    return peak
+
+
+async def main() -> int:
+    failures = 0
+    for fmt, compress in (("ndjson", False), ("csv", False), ("ndjson", True), ("csv", True)):
+        written, peak, elapsed = await measure(fmt, compress)
+        ok = peak < PEAK_LIMIT
+        failures += not ok
+        status = "✅ PASS" if ok else "❌ FAIL"
+        label = f"{fmt}{'+gzip' if compress else ''}"
+        print(f"{status} {label}: {written / 1e6:.1f} MB out, peak {peak / 1e6:.2f} MB, "
+              f"{ROWS / elapsed:,.0f} rows/s")
+
+    print(f"Materialized to_list baseline: peak {await measure_materialized() / 1e6:.2f} MB")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
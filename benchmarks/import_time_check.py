@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+API Cold-Start Import Check
+Imports backend/server.py under ``python -X importtime`` in fresh interpreters,
+fails if a render-only dependency (ReportLab, the resume generator, the
+process pool, smtplib) is loaded at startup or if the import time exceeds the
+recorded baseline by more than the margin, and lists the heaviest top-level
+imports. Re-record BASELINE_MS when an intended change moves it.
+
+Usage: python benchmarks/import_time_check.py [budget_ms]
+"""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+RUNS = 5
+# Best of RUNS on the reference dev machine; override per machine with IMPORT_TIME_BASELINE_MS
+BASELINE_MS = float(os.environ.get("IMPORT_TIME_BASELINE_MS", "600"))
+MARGIN = float(os.environ.get("IMPORT_TIME_MARGIN", "0.2"))
+DEFAULT_BUDGET_MS = BASELINE_MS * (1 + MARGIN)
+
+# Modules the API must only load once a resume render or a notification is needed
+LAZY_MODULES = ("reportlab", "resume_generator", "concurrent.futures.process", "smtplib")
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def import_profile():
+    env = {
+        **os.environ,
+        "MONGO_URL": os.environ.get("MONGO_URL", "mongodb://localhost:27017"),
+        "DB_NAME": os.environ.get("DB_NAME", "import_time_check"),
+    }
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import server"],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    modules = {}
+    top_level = []
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if not match:
+            continue
+        cumulative_us, depth, name = int(match.group(2)), len(match.group(3)), match.group(4)
+        modules[name] = cumulative_us
+        if depth == 2:
+            top_level.append((cumulative_us, name))
+    return modules, top_level
+
+
+def main() -> int:
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET_MS
+    print(f"🚀 Importing server {RUNS} times under -X importtime (budget {budget_ms:.0f} ms)")
+
+    profiles = [import_profile() for _ in range(RUNS)]
+    modules, top_level = min(profiles, key=lambda profile: profile[0]["server"])
+    total_ms = modules["server"] / 1000
+    failures = 0
+
+    eager = sorted(name for name in modules if name.split(".")[0] in LAZY_MODULES or name in LAZY_MODULES)
+    if eager:
+        print(f"❌ FAIL: render-only modules loaded at startup: {', '.join(eager)}")
+        failures += 1
+    else:
+        print("✅ PASS: ReportLab, resume generator, process pool and smtplib stay unloaded")
+
+    if total_ms > budget_ms:
+        print(f"❌ FAIL: import server took {total_ms:.0f} ms (budget {budget_ms:.0f} ms)")
+        failures += 1
+    else:
+        print(f"✅ PASS: import server took {total_ms:.0f} ms (best of {RUNS})")
+
+    print("   heaviest imports:")
+    for cumulative_us, name in sorted(top_level, reverse=True)[:10]:
+        print(f"   {cumulative_us / 1000:>8.1f} ms  {name}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+JSON List Response Benchmark
+Serves 1k contact rows through a throwaway FastAPI app twice: the old path
+(model per row, response_model validation, stdlib encoder) and the fast path
+(trusted projected rows encoded straight to bytes), and reports rows/sec
+"""
+
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, Field
+
+from fast_json import orjson, rows_response
+
+ROWS = 1000
+REQUESTS = 50
+
+
+class ContactSubmission(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    name: str
+    email: str
+    company: Optional[str] = None
+    message: str
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    status: str = "new"
+
+
+def build_rows():
+    now = datetime.utcnow()
+    return [{
+        "id": str(uuid.uuid4()),
+        "name": f"Recruiter {i}",
+        "email": f"recruiter{i}@example.com",
+        "company": "Example Corp" if i % 2 else None,
+        "message": "Would love to talk about a data engineering role on our platform team. " * 3,
+        "timestamp": now - timedelta(minutes=i),
+        "status": "new",
+    } for i in range(ROWS)]
+
+
+def build_app(rows) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/old", response_model=List[ContactSubmission])
+    async def old():
+        return [ContactSubmission(**row) for row in rows]
+
+    @app.get("/fast", response_model=List[ContactSubmission])
+    async def fast():
+        return rows_response(rows, ContactSubmission)
+
+    return app
+
+
+def measure(client: TestClient, path: str) -> float:
+    client.get(path)
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        response = client.get(path)
+        assert response.status_code == 200 and len(response.json()) == ROWS
+    return ROWS * REQUESTS / (time.perf_counter() - start)
+
+
+def main() -> int:
+    rows = build_rows()
+    client = TestClient(build_app(rows))
+    print(f"🚀 {ROWS}-row responses x {REQUESTS} requests (encoder: {'orjson' if orjson else 'stdlib json'})")
+
+    if client.get("/old").json() != client.get("/fast").json():
+        print("❌ FAIL: fast path body differs from the validated response")
+        return 1
+    print("✅ PASS: fast path body matches the validated response")
+
+    old = measure(client, "/old")
+    fast = measure(client, "/fast")
+    print(f"   before: {old:>10,.0f} rows/sec")
+    print(f"   after:  {fast:>10,.0f} rows/sec ({fast / old:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
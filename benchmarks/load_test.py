@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+API Load Test
+Boots the FastAPI app in-process (lifespan included) against mongomock-motor,
+or a local mongod with --mongo-url, drives each endpoint with concurrent
+httpx async clients and writes RPS, p50/p95/p99 latency and error rates to
+JSON so runs can be compared with --compare. Client and app share one event
+loop, so numbers are for comparing runs, not for sizing production.
+
+Requires: pip install httpx mongomock-motor
+Usage: python benchmarks/load_test.py [--concurrency 16] [--requests 500]
+       [--endpoints contact,resume_stats] [--mongo-url mongodb://localhost:27017]
+       [--output results.json] [--compare previous.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+sys.path.insert(0, str(BACKEND_DIR))
+
+import httpx
+
+# name -> (method, path, body factory taking the request number)
+SCENARIOS: Dict[str, Tuple[str, str, Optional[Callable[[int], Dict[str, Any]]]]] = {
+    "contact": ("POST", "/api/contact", lambda i: {
+        "name": f"Load Test {i}",
+        "email": f"loadtest{i}-{uuid.uuid4().hex[:8]}@example.com",
+        "company": "Benchmark Inc",
+        "message": f"Load test submission {uuid.uuid4()} asking about an open security engineering role",
+    }),
+    "resume_download": ("GET", "/api/resume/download", None),
+    "resume_stats": ("GET", "/api/resume/stats", None),
+    "status_create": ("POST", "/api/status", lambda i: {"client_name": f"load-test-{i}"}),
+    "status_list": ("GET", "/api/status?limit=100", None),
+    "portfolio": ("GET", "/api/portfolio", None),
+}
+
+
+def configure_environment(mongo_url: Optional[str]) -> str:
+    """Point the app at the chosen database and lift limits that would turn the run into 429s"""
+    if mongo_url:
+        os.environ["MONGO_URL"] = mongo_url
+        target = mongo_url
+    else:
+        import mongomock_motor
+        import motor.motor_asyncio
+
+        motor.motor_asyncio.AsyncIOMotorClient = mongomock_motor.AsyncMongoMockClient
+        os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+        target = "mongomock-motor"
+    os.environ.setdefault("DB_NAME", f"load_test_{uuid.uuid4().hex[:8]}")
+    os.environ.setdefault("CONTACT_RATE_LIMIT_IP", "1000000/1")
+    os.environ.setdefault("CONTACT_RATE_LIMIT_EMAIL", "1000000/1")
+    return target
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+async def run_scenario(client: httpx.AsyncClient, name: str, total: int, concurrency: int) -> Dict[str, Any]:
+    method, path, body = SCENARIOS[name]
+    latencies: List[float] = []
+    statuses: Dict[str, int] = {}
+    errors = 0
+    counter = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, path, json=body(i) if body else None)
+                await response.aread()
+                status = str(response.status_code)
+                if response.status_code >= 400:
+                    errors += 1
+            except Exception as e:
+                status = type(e).__name__
+                errors += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": total,
+        "errors": errors,
+        "error_rate": round(errors / total, 4) if total else 0.0,
+        "rps": round(total / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "max_ms": round(latencies[-1], 2) if latencies else 0.0,
+        "statuses": statuses,
+    }
+
+
+async def run(args, target: str) -> Dict[str, Any]:
+    import server
+
+    results = {}
+    async with server.app.router.lifespan_context(server.app):
+        transport = httpx.ASGITransport(app=server.app, client=("127.0.0.1", 50000))
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=60) as client:
+            for name in args.endpoints:
+                # One untimed request so caches and lazy renders don't count against the run
+                method, path, body = SCENARIOS[name]
+                await client.request(method, path, json=body(-1) if body else None)
+                results[name] = await run_scenario(client, name, args.requests, args.concurrency)
+                summary = results[name]
+                status = "✅ PASS" if summary["errors"] == 0 else "❌ FAIL"
+                print(f"{status} {name:<16} {summary['rps']:>8.1f} rps  p50 {summary['p50_ms']:>7.2f} ms  "
+                      f"p95 {summary['p95_ms']:>7.2f} ms  p99 {summary['p99_ms']:>7.2f} ms  "
+                      f"errors {summary['error_rate']:.2%}")
+
+    return {
+        "started_at": datetime.utcnow().isoformat(),
+        "target": target,
+        "concurrency": args.concurrency,
+        "requests_per_endpoint": args.requests,
+        "python": sys.version.split()[0],
+        "results": results,
+    }
+
+
+def compare(report: Dict[str, Any], previous_path: Path):
+    previous = json.loads(previous_path.read_text())["results"]
+    print(f"\n📊 Compared with {previous_path}")
+    for name, summary in report["results"].items():
+        if name not in previous:
+            continue
+        before = previous[name]
+        rps_change = (summary["rps"] - before["rps"]) / before["rps"] if before["rps"] else 0.0
+        print(f"   {name:<16} rps {before['rps']:>8.1f} -> {summary['rps']:>8.1f} ({rps_change:+.1%})  "
+              f"p99 {before['p99_ms']:>7.2f} -> {summary['p99_ms']:>7.2f} ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=500, help="requests per endpoint")
+    parser.add_argument("--endpoints", default=",".join(SCENARIOS),
+                        help=f"comma separated subset of: {', '.join(SCENARIOS)}")
+    parser.add_argument("--mongo-url", help="run against a local mongod instead of mongomock-motor")
+    parser.add_argument("--output", type=Path, help="JSON report path (default benchmarks/results/)")
+    parser.add_argument("--compare", type=Path, help="previous JSON report to diff against")
+    args = parser.parse_args()
+
+    args.endpoints = [name.strip() for name in args.endpoints.split(",") if name.strip()]
+    unknown = [name for name in args.endpoints if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown endpoints: {', '.join(unknown)}")
+
+    target = configure_environment(args.mongo_url)
+    print(f"🚀 Load testing {len(args.endpoints)} endpoints against {target} "
+          f"({args.requests} requests, concurrency {args.concurrency})")
+    report = asyncio.run(run(args, target))
+
+    output = args.output or RESULTS_DIR / f"load_test_{datetime.utcnow():%Y%m%dT%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\n💾 Report written to {output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+    return 1 if any(summary["errors"] for summary in report["results"].values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Logging Latency Benchmark
+Serves a throwaway FastAPI endpoint that logs heavily per request and compares
+request latency with a synchronous StreamHandler against the queue-backed
+JSON pipeline (with and without sampling). The stream sleeps on every write
+to stand in for a stdout pipe whose reader can't keep up.
+"""
+
+import asyncio
+import io
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+import httpx
+from fastapi import FastAPI
+
+from structured_logging import JSONFormatter, LogPipeline
+
+REQUESTS = 400
+CONCURRENCY = 16
+LINES_PER_REQUEST = 10
+WRITE_DELAY = 0.0002
+
+logger = logging.getLogger("logging_benchmark")
+
+
+class SlowStream(io.StringIO):
+    def write(self, text):
+        time.sleep(WRITE_DELAY)
+        return super().write(text)
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/download")
+    async def download():
+        for i in range(LINES_PER_REQUEST):
+            logger.info("Resume downloaded", extra={"event": "resume_download", "user_agent": f"bench/{i}"})
+        return {"ok": True}
+
+    return app
+
+
+async def measure(app: FastAPI):
+    latencies = []
+    counter = iter(range(REQUESTS))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker():
+            for _ in counter:
+                start = time.perf_counter()
+                await client.get("/download")
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        await asyncio.gather(*[worker() for _ in range(CONCURRENCY)])
+        elapsed = time.perf_counter() - start
+    latencies.sort()
+    return REQUESTS / elapsed, latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99) - 1]
+
+
+def reset_root(handler: logging.Handler):
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+
+
+def main() -> int:
+    app = build_app()
+    print(f"🚀 {REQUESTS} requests x {LINES_PER_REQUEST} log lines, concurrency {CONCURRENCY}, "
+          f"{WRITE_DELAY * 1e6:.0f} µs per stream write")
+
+    stream = logging.StreamHandler(SlowStream())
+    stream.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    reset_root(stream)
+    results = {"sync StreamHandler": asyncio.run(measure(app))}
+
+    for label, rates in (("queue pipeline", None), ("queue pipeline, 10% sampled", {"resume_download": 0.1})):
+        json_stream = logging.StreamHandler(SlowStream())
+        json_stream.setFormatter(JSONFormatter())
+        pipeline = LogPipeline([json_stream], max_queue=REQUESTS * (LINES_PER_REQUEST + 1), sample_rates=rates)
+        pipeline.install(logging.INFO)
+        pipeline.start()
+        results[label] = asyncio.run(measure(app))
+        pipeline.stop()
+        stats = pipeline.stats()
+        print(f"   {label}: dropped {stats['dropped']}, sampled out {stats['sampled_out']}")
+
+    baseline_p99 = results["sync StreamHandler"][2]
+    for label, (rps, p50, p99) in results.items():
+        print(f"   {label:<30} {rps:>8.1f} rps  p50 {p50:>7.2f} ms  p99 {p99:>7.2f} ms")
+
+    if results["queue pipeline"][2] < baseline_p99:
+        print("✅ PASS: queue pipeline keeps log writes off the request path")
+        return 0
+    print("❌ FAIL: queue pipeline did not improve p99 latency")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Overload Test
+Drives an open-loop request rate at 0.5x to 4x the capacity of a backend that
+serves at most --capacity requests at a time in --service-ms each (a stand-in
+for a saturated MongoDB pool), once bare and once behind AdmissionMiddleware
+with an adaptive limit. Bare, the backlog grows until requests time out;
+with admission control, excess requests are shed with a fast 503 and the p99
+of the requests that are served stays bounded.
+
+Usage: python benchmarks/overload_test.py [--capacity 8] [--service-ms 5] [--seconds 3]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from admission import AdmissionControl, AdmissionMiddleware, AdmissionRule, ConcurrencyPool, GradientLimit
+
+LOAD_FACTORS = [0.5, 1.0, 2.0, 4.0]
+CLIENT_TIMEOUT = 5.0
+TICK = 0.005
+
+
+def saturating_backend(capacity: int, service_ms: float):
+    slots = asyncio.Semaphore(capacity)
+
+    async def app(scope, receive, send):
+        async with slots:
+            await asyncio.sleep(service_ms / 1000)
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-length", b"2")]})
+        await send({"type": "http.response.body", "body": b"{}"})
+    return app
+
+
+def admission(app, limit: int, max_queue: int, queue_timeout: float):
+    pool = ConcurrencyPool("read", GradientLimit(limit), max_queue=max_queue, queue_timeout=queue_timeout)
+    control = AdmissionControl([pool], [AdmissionRule("GET", "/*", "read")])
+    return AdmissionMiddleware(app, control), pool
+
+
+async def request(app) -> Dict[str, Any]:
+    scope = {"type": "http", "method": "GET", "path": "/api/status", "headers": []}
+    result = {"status": None, "retry_after": None}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            result["status"] = message["status"]
+            result["retry_after"] = dict(message["headers"]).get(b"retry-after")
+
+    start = time.perf_counter()
+    try:
+        await asyncio.wait_for(app(scope, receive, send), CLIENT_TIMEOUT)
+    except asyncio.TimeoutError:
+        result["status"] = "timeout"
+    result["ms"] = (time.perf_counter() - start) * 1000
+    return result
+
+
+async def open_loop(app, rate: float, seconds: float) -> Tuple[List[Dict[str, Any]], float]:
+    """Start requests at a fixed rate regardless of how fast they complete; returns results and wall time"""
+    tasks = []
+    start = time.perf_counter()
+    due = 0.0
+    while time.perf_counter() - start < seconds:
+        due += rate * TICK
+        while due >= 1:
+            tasks.append(asyncio.create_task(request(app)))
+            due -= 1
+        await asyncio.sleep(TICK)
+    results = await asyncio.gather(*tasks)
+    return results, time.perf_counter() - start
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))]
+
+
+def summarize(results: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+    served = sorted(r["ms"] for r in results if r["status"] == 200)
+    shed = [r for r in results if r["status"] == 503]
+    return {
+        "sent": len(results),
+        "goodput": len(served) / elapsed,
+        "p50_ms": percentile(served, 50),
+        "p99_ms": percentile(served, 99),
+        "shed": len(shed) / len(results) if results else 0.0,
+        "shed_p99_ms": percentile(sorted(r["ms"] for r in shed), 99),
+        "timeouts": sum(r["status"] == "timeout" for r in results) / len(results) if results else 0.0,
+        "retry_after": all(r["retry_after"] for r in shed),
+    }
+
+
+async def run(args) -> int:
+    capacity_rps = args.capacity / (args.service_ms / 1000)
+    print(f"🚀 Backend capacity {capacity_rps:,.0f} rps ({args.capacity} concurrent x {args.service_ms} ms), "
+          f"{args.seconds:.0f}s per load level")
+
+    failures = 0
+    summaries: Dict[str, Dict[float, Dict[str, Any]]] = {"bare": {}, "admission": {}}
+    for mode in ("bare", "admission"):
+        print(f"\n{'🧱 Without admission control' if mode == 'bare' else '🛡️  With AdmissionMiddleware'}")
+        # One app per mode, ramped through the load levels like a server whose traffic grows
+        app = saturating_backend(args.capacity, args.service_ms)
+        pool = None
+        if mode == "admission":
+            app, pool = admission(app, args.limit, args.queue, args.queue_timeout)
+        for factor in LOAD_FACTORS:
+            summary = summarize(*await open_loop(app, capacity_rps * factor, args.seconds))
+            line = (f"   {factor:>3.1f}x  goodput {summary['goodput']:>7.0f} rps  p50 {summary['p50_ms']:>8.1f} ms  "
+                    f"p99 {summary['p99_ms']:>8.1f} ms  shed {summary['shed']:>6.1%}  "
+                    f"timeouts {summary['timeouts']:>6.1%}")
+            if pool is not None:
+                line += f"  limit {pool.limit.current}"
+            print(line)
+            summaries[mode][factor] = summary
+            if not summary["retry_after"]:
+                failures += 1
+                print("❌ FAIL 503 responses without Retry-After")
+
+    # Past saturation a served request waits at most the queue timeout on top of service at the limit
+    budget = args.queue_timeout * 1000 + summaries["admission"][1.0]["p99_ms"] * 2
+    print()
+    for factor in LOAD_FACTORS[2:]:
+        summary, bare = summaries["admission"][factor], summaries["bare"][factor]
+        ok = summary["p99_ms"] <= budget and summary["timeouts"] == 0
+        failures += not ok
+        print(f"{'✅ PASS' if ok else '❌ FAIL'} {factor:.0f}x load: p99 {summary['p99_ms']:.1f} ms within "
+              f"{budget:.0f} ms (bare {bare['p99_ms']:.1f} ms, {bare['timeouts']:.1%} timeouts), "
+              f"shed p99 {summary['shed_p99_ms']:.1f} ms")
+    return 1 if failures else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--capacity", type=int, default=8, help="requests the backend serves at once")
+    parser.add_argument("--service-ms", type=float, default=5.0)
+    parser.add_argument("--seconds", type=float, default=3.0, help="duration of each load level")
+    parser.add_argument("--limit", type=int, default=32, help="admission limit ceiling")
+    parser.add_argument("--queue", type=int, default=32, help="admission wait queue length")
+    parser.add_argument("--queue-timeout", type=float, default=0.1)
+    args = parser.parse_args()
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
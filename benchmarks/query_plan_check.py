@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Query Plan Verification for Portfolio Backend
+Creates the declared indexes in a scratch database and asserts via explain()
+that every endpoint query is served by an index scan instead of a COLLSCAN
+"""
+
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+
+ROOT_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(ROOT_DIR))
+load_dotenv(ROOT_DIR / '.env')
+
+from indexes import declare_indexes, ensure_indexes
+
+SEED_ROWS = 2000
+
+# (description, collection, filter, sort, limit) for each query the API issues
+ENDPOINT_QUERIES = [
+    ("GET /api/status", "status_checks", {}, [("timestamp", -1), ("id", -1)], 101),
+    ("GET /api/contact", "contact_submissions", {}, [("timestamp", -1), ("id", -1)], 101),
+    ("GET /api/contact?status=", "contact_submissions", {"status": "new"}, [("timestamp", -1), ("id", -1)], 101),
+    ("GET /api/contact?cursor=", "contact_submissions",
+     {"$or": [{"timestamp": {"$lt": datetime(2030, 1, 1)}},
+              {"timestamp": datetime(2030, 1, 1), "id": {"$lt": "contact-1"}}]},
+     [("timestamp", -1), ("id", -1)], 101),
+    ("contact lookup by id", "contact_submissions", {"id": "contact-1"}, None, 1),
+    ("recent downloads seed", "resume_downloads", {}, [("download_date", -1)], 10),
+    ("GET /api/resume/stats/timeseries", "resume_download_buckets",
+     {"bucket": "hour", "start": {"$gte": datetime(2025, 1, 1), "$lt": datetime(2025, 1, 2)}}, None, 0),
+]
+
+
+def plan_stages(plan):
+    """Yield every stage name in an explain() plan tree"""
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            yield plan["stage"]
+        for value in plan.values():
+            yield from plan_stages(value)
+    elif isinstance(plan, list):
+        for item in plan:
+            yield from plan_stages(item)
+
+
+async def seed(db):
+    now = datetime.utcnow()
+    await db.status_checks.insert_many([
+        {"id": f"status-{i}", "client_name": "plan-check", "timestamp": now - timedelta(minutes=i)}
+        for i in range(SEED_ROWS)
+    ])
+    await db.contact_submissions.insert_many([
+        {"id": f"contact-{i}", "name": "Plan Check", "email": "plan@example.com", "message": "hello",
+         "status": ("new", "read", "responded")[i % 3], "timestamp": now - timedelta(minutes=i)}
+        for i in range(SEED_ROWS)
+    ])
+    await db.resume_downloads.insert_many([
+        {"id": f"download-{i}", "download_date": now - timedelta(minutes=i), "user_agent": "plan-check"}
+        for i in range(SEED_ROWS)
+    ])
+    await db.resume_download_buckets.insert_many([
+        {"_id": f"hour:{i}", "bucket": "hour", "start": datetime(2025, 1, 1) + timedelta(hours=i), "count": 1}
+        for i in range(SEED_ROWS)
+    ])
+
+
+async def main() -> int:
+    client = AsyncIOMotorClient(os.environ.get('MONGO_URL', 'mongodb://localhost:27017'))
+    db_name = os.environ.get('PLAN_CHECK_DB', 'portfolio_plan_check')
+    await client.drop_database(db_name)
+    db = client[db_name]
+
+    failures = 0
+    try:
+        for index, error in (await ensure_indexes(db, declare_indexes())).items():
+            failures += 1
+            print(f"❌ FAIL index {index} not created: {error}")
+        await seed(db)
+
+        for description, collection, query, sort, limit in ENDPOINT_QUERIES:
+            cursor = db[collection].find(query)
+            if sort:
+                cursor = cursor.sort(sort)
+            if limit:
+                cursor = cursor.limit(limit)
+
+            start = time.perf_counter()
+            plan = await cursor.explain()
+            elapsed = (time.perf_counter() - start) * 1000
+
+            stages = list(plan_stages(plan["queryPlanner"]["winningPlan"]))
+            ok = "COLLSCAN" not in stages and any(s in ("IXSCAN", "IDHACK", "EXPRESS_IXSCAN") for s in stages)
+            failures += not ok
+            status = "✅ PASS" if ok else "❌ FAIL"
+            print(f"{status} {description}: {' <- '.join(stages)} ({elapsed:.1f} ms)")
+    finally:
+        await client.drop_database(db_name)
+        client.close()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Contact Form Rate Limiter Benchmark
+Measures per-request overhead of the in-memory token buckets with 50k
+distinct clients, both when every client fits and under LRU eviction
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from rate_limit import Limit, MemoryTokenBuckets
+
+CLIENTS = 50_000
+CHECKS = 500_000
+LIMIT = Limit.parse("10/3600")
+
+
+def run(max_keys: int):
+    buckets = MemoryTokenBuckets(max_keys=max_keys)
+    keys = [f"ip:/api/contact:10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}" for i in range(CLIENTS)]
+    order = [random.choice(keys) for _ in range(CHECKS)]
+
+    limited = 0
+    start = time.perf_counter()
+    for key in order:
+        if buckets.take_now(key, LIMIT, time.monotonic()):
+            limited += 1
+    elapsed = time.perf_counter() - start
+    return elapsed / CHECKS, limited, len(buckets), buckets.evictions
+
+
+def main():
+    random.seed(7)
+    for label, max_keys in (("all clients resident", 100_000), ("LRU-bounded to 10k keys", 10_000)):
+        per_check, limited, resident, evictions = run(max_keys)
+        print(f"{label}: {per_check * 1e9:,.0f} ns/check, {limited:,} limited, "
+              f"{resident:,} keys resident, {evictions:,} evictions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Resume Rendering Micro-benchmark
+Compares per-render time with styles rebuilt on every call (the old
+generate_resume_pdf behaviour) against the build-once style registry
+"""
+
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from portfolio_data import PORTFOLIO_DATA
+from resume_generator import get_resume_styles, render_resume
+
+ITERATIONS = 200
+
+
+def time_renders(rebuild_styles: bool) -> float:
+    """Return mean seconds per render"""
+    # Warm up fonts and module state outside the timed loop
+    render_resume(PORTFOLIO_DATA, io.BytesIO())
+
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        if rebuild_styles:
+            get_resume_styles.cache_clear()
+        render_resume(PORTFOLIO_DATA, io.BytesIO())
+    return (time.perf_counter() - start) / ITERATIONS
+
+
+def time_style_build() -> float:
+    """Return mean seconds to build the style registry from scratch"""
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        get_resume_styles.cache_clear()
+        get_resume_styles()
+    return (time.perf_counter() - start) / ITERATIONS
+
+
+def main():
+    # Alternate the two modes and keep the best run of each to damp noise
+    before, after = [], []
+    for _ in range(3):
+        before.append(time_renders(rebuild_styles=True))
+        after.append(time_renders(rebuild_styles=False))
+    before, after = min(before), min(after)
+
+    print(f"Renders per run: {ITERATIONS}")
+    print(f"Style registry build:      {time_style_build() * 1000:.3f} ms")
+    print(f"Styles rebuilt per render: {before * 1000:.2f} ms/render")
+    print(f"Cached style registry:     {after * 1000:.2f} ms/render")
+    print(f"Speedup: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from admission import (
+    AdmissionControl, AdmissionMiddleware, AdmissionRule, ConcurrencyPool, FixedLimit, GradientLimit
+)
+
+
+def test_gradient_limit_grows_only_while_used_and_latency_holds():
+    limit = GradientLimit(initial=10, max_limit=40)
+    for _ in range(50):
+        limit.update(0.010, inflight=0)
+    assert limit.current == 10
+
+    for _ in range(100):
+        limit.update(0.010, inflight=limit.current)
+    assert limit.current == 40
+
+
+def test_gradient_limit_shrinks_when_latency_climbs_and_backs_off_on_failure():
+    limit = GradientLimit(initial=40, min_limit=4)
+    limit.update(0.010, inflight=40)
+    for _ in range(50):
+        limit.update(0.200, inflight=0)
+    shrunk = limit.current
+    assert 4 <= shrunk < 20
+
+    limit.update(0.010, inflight=0, failed=True)
+    assert limit.limit <= shrunk * 0.9 + 1
+    for _ in range(100):
+        limit.update(0.010, inflight=0, failed=True)
+    assert limit.current == 4
+
+
+def test_pool_queues_then_sheds_when_the_queue_is_full():
+    async def scenario():
+        pool = ConcurrencyPool("api", FixedLimit(1), max_queue=1, queue_timeout=5)
+        assert await pool.acquire()
+        queued = asyncio.ensure_future(pool.acquire())
+        await asyncio.sleep(0)
+        assert not await pool.acquire()
+
+        pool.release()
+        assert await queued
+        assert pool.stats() == {
+            "limit": 1, "inflight": 1, "waiting": 0, "admitted": 2, "queued": 1, "shed": 1, "timeouts": 0
+        }
+
+    asyncio.run(scenario())
+
+
+def test_pool_sheds_after_queue_timeout_and_cancelled_waiters_keep_no_slot():
+    async def scenario():
+        pool = ConcurrencyPool("api", FixedLimit(1), max_queue=4, queue_timeout=0.01)
+        assert await pool.acquire()
+        assert not await pool.acquire()
+        assert pool.timeouts == 1 and pool.stats()["waiting"] == 0
+
+        pool.queue_timeout = 5
+        cancelled = asyncio.ensure_future(pool.acquire())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.gather(cancelled, return_exceptions=True)
+        pool.release()
+        assert pool.inflight == 0
+        assert await pool.acquire()
+
+    asyncio.run(scenario())
+
+
+def test_middleware_returns_503_with_retry_after_once_pool_and_queue_are_full():
+    async def scenario():
+        gate = asyncio.Event()
+
+        async def app(scope, receive, send):
+            await gate.wait()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+
+        pool = ConcurrencyPool("contact", FixedLimit(1), max_queue=0, queue_timeout=1)
+        control = AdmissionControl(
+            [pool],
+            [AdmissionRule("GET", "/api/health", None), AdmissionRule("GET", "/api/*", "contact")],
+            retry_after=1.5
+        )
+        middleware = AdmissionMiddleware(app, control)
+
+        async def call(path):
+            messages = []
+
+            async def send(message):
+                messages.append(message)
+
+            await middleware({"type": "http", "method": "GET", "path": path}, None, send)
+            return messages
+
+        first = asyncio.ensure_future(call("/api/contact"))
+        await asyncio.sleep(0)
+        shed = await call("/api/contact")
+        assert shed[0]["status"] == 503
+        assert dict(shed[0]["headers"])[b"retry-after"] == b"2"
+
+        exempt = asyncio.ensure_future(call("/api/health"))
+        gate.set()
+        assert (await first)[0]["status"] == 200
+        assert (await exempt)[0]["status"] == 200
+        assert control.stats()["contact_shed"] == 1 and pool.inflight == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,50 @@
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from contact_feed import ContactFeed
+
+FIELDS = ["id", "name"]
+
+
+async def memory_feed():
+    feed = ContactFeed(collection=None, fields=FIELDS, mode="memory", heartbeat=0.01)
+    await feed.start()
+    for i in (1, 2, 3):
+        feed.publish_local({"id": f"contact-{i}", "name": f"Name {i}"})
+    return feed
+
+
+async def backlog(feed, last_event_id):
+    """Messages sent before the first live wait (a keepalive) when reconnecting with last_event_id"""
+    messages = []
+    stream = feed.subscribe(last_event_id)
+    async for message in stream:
+        if message.startswith(b": keepalive"):
+            break
+        messages.append(message)
+    await stream.aclose()
+    return messages[1:]
+
+
+def test_reconnect_replays_events_after_last_event_id():
+    async def scenario():
+        feed = await memory_feed()
+        first = f"{feed.epoch}-1"
+        messages = await backlog(feed, first)
+        assert [message.split(b"\n")[0] for message in messages] == [
+            f"id: {feed.epoch}-2".encode(), f"id: {feed.epoch}-3".encode()
+        ]
+
+    asyncio.run(scenario())
+
+
+def test_id_from_another_process_gets_a_reset_not_a_wrong_replay():
+    async def scenario():
+        before_restart = await memory_feed()
+        feed = await memory_feed()
+        assert await backlog(feed, f"{before_restart.epoch}-1") == [b"event: reset\ndata: {}\n\n"]
+
+    asyncio.run(scenario())
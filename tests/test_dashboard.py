@@ -0,0 +1,28 @@
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from dashboard import per_day_facet, zero_filled
+
+SINCE = datetime(2025, 1, 30)
+
+
+def test_zero_filled_covers_every_day_in_order():
+    rows = [{"_id": SINCE + timedelta(days=3), "count": 2}, {"_id": SINCE, "count": 5}]
+    points = zero_filled(rows, SINCE, 5)
+    assert [point["start"] for point in points] == [SINCE + timedelta(days=offset) for offset in range(5)]
+    assert [point["count"] for point in points] == [5, 0, 0, 2, 0]
+
+
+def test_zero_filled_ignores_rows_outside_the_window():
+    rows = [{"_id": SINCE - timedelta(days=1), "count": 9}, {"_id": SINCE + timedelta(days=2), "count": 9}]
+    assert [point["count"] for point in zero_filled(rows, SINCE, 2)] == [0, 0]
+    assert zero_filled([], SINCE, 0) == []
+
+
+def test_per_day_facet_matches_the_window_before_grouping():
+    match, group = per_day_facet("timestamp", SINCE)
+    assert match == {"$match": {"timestamp": {"$gte": SINCE}}}
+    assert group["$group"]["count"] == {"$sum": 1}
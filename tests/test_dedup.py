@@ -0,0 +1,45 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from dedup import ContactDeduplicator, RotatingBloomFilter, submission_digest
+
+
+def spam(i):
+    return submission_digest(f"bot{i}@example.com", f"Buy cheap followers now #{i}")
+
+
+def test_false_positive_rate_stays_near_target_at_capacity():
+    capacity, error_rate, probes = 10_000, 1e-3, 50_000
+    bloom = RotatingBloomFilter(capacity=capacity, error_rate=error_rate, window=3600)
+    for i in range(capacity - 1):
+        bloom.add(spam(i))
+
+    false_positives = sum(
+        submission_digest(f"person{i}@example.com", f"Genuine enquiry {i}") in bloom for i in range(probes)
+    )
+    assert false_positives / probes <= error_rate * 3
+    # Near-exact repeats are still caught
+    assert submission_digest(" BOT1@Example.com", "buy CHEAP followers, now!! #1") in bloom
+
+
+def test_memory_is_fixed_at_two_generations():
+    bloom = RotatingBloomFilter(capacity=1_000, error_rate=1e-6, window=3600)
+    generation = bloom.memory_bytes()
+    # -n ln p / (ln 2)^2 bits for 1000 entries at 1e-6 is about 3.5 KiB
+    assert generation <= 3_600
+    for i in range(4_500):
+        bloom.add(spam(i))
+
+    assert bloom.rotations == 4
+    assert bloom.memory_bytes() == 2 * generation
+    # The previous generation is still consulted, older ones are forgotten
+    assert spam(4_499) in bloom and spam(3_500) in bloom and spam(0) not in bloom
+
+
+def test_backstop_key_is_scoped_to_the_window():
+    dedup = ContactDeduplicator(capacity=10, window=100)
+    digest = spam(1)
+    assert dedup.backstop_key(digest, now=1_050) == dedup.backstop_key(digest, now=1_099)
+    assert dedup.backstop_key(digest, now=1_099) != dedup.backstop_key(digest, now=1_100)
@@ -0,0 +1,75 @@
+import asyncio
+import csv
+import gzip
+import io
+import json
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from exports import iter_export
+
+FIELDS = ["id", "name", "company", "message", "timestamp"]
+# Same budget as benchmarks/export_memory_benchmark.py, which streams 100k rows
+PEAK_LIMIT = 4 * 1024 * 1024
+
+
+class SyntheticCursor:
+    """Async cursor that generates rows lazily, like a Motor cursor"""
+
+    def __init__(self, rows: int):
+        self.rows = rows
+
+    async def __aiter__(self):
+        for i in range(self.rows):
+            yield {
+                "id": f"contact-{i}",
+                "name": f"Recruiter {i}",
+                "company": "=HYPERLINK(\"http://example.com\")" if i == 0 else f"Company {i % 50}",
+                "message": "Interested in discussing a security analyst role with your team. " * 3,
+                "timestamp": datetime(2025, 1, 1) + timedelta(seconds=i),
+            }
+
+
+async def export(rows: int, fmt: str, compress: bool = False) -> bytes:
+    return b"".join([chunk async for chunk in iter_export(SyntheticCursor(rows), FIELDS, fmt, 200, compress)])
+
+
+async def peak_memory(rows: int, fmt: str, compress: bool) -> int:
+    tracemalloc.start()
+    try:
+        async for _ in iter_export(SyntheticCursor(rows), FIELDS, fmt, 200, compress):
+            pass
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_peak_memory_is_bounded_and_independent_of_row_count():
+    async def scenario():
+        for fmt in ("ndjson", "csv"):
+            for compress in (False, True):
+                small = await peak_memory(2_000, fmt, compress)
+                large = await peak_memory(16_000, fmt, compress)
+                assert large < PEAK_LIMIT, (fmt, compress, large)
+                # Eight times the rows must not mean noticeably more memory
+                assert large < small * 1.5 + 64 * 1024, (fmt, compress, small, large)
+
+    asyncio.run(scenario())
+
+
+def test_ndjson_rows_round_trip():
+    rows = asyncio.run(export(3, "ndjson")).decode().splitlines()
+    assert [json.loads(row)["id"] for row in rows] == ["contact-0", "contact-1", "contact-2"]
+    assert json.loads(rows[1])["timestamp"] == "2025-01-01T00:00:01"
+
+
+def test_csv_has_header_and_neutralises_formulas():
+    body = gzip.decompress(asyncio.run(export(2, "csv", compress=True))).decode()
+    rows = list(csv.reader(io.StringIO(body)))
+    assert rows[0] == FIELDS
+    assert rows[1][2].startswith("'=HYPERLINK")
+    assert len(rows) == 3
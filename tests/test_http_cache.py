@@ -0,0 +1,25 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from http_cache import accepted_encodings, choose_encoding
+
+AVAILABLE = ["br", "gzip"]
+
+
+def test_refused_codings_are_not_chosen():
+    assert choose_encoding("gzip;q=0", AVAILABLE) is None
+    assert choose_encoding("identity, br;q=0", AVAILABLE) is None
+    assert choose_encoding("*;q=0, gzip", AVAILABLE) == "gzip"
+
+
+def test_highest_q_wins_and_ties_keep_server_preference():
+    assert choose_encoding("gzip, br;q=0.5", AVAILABLE) == "gzip"
+    assert choose_encoding("gzip, br", AVAILABLE) == "br"
+    assert choose_encoding("*", AVAILABLE) == "br"
+    assert choose_encoding(None, AVAILABLE) is None
+
+
+def test_q_values_are_parsed_case_insensitively():
+    assert accepted_encodings("GZIP;Q=0.3, br;q=bogus") == {"gzip": 0.3, "br": 0.0}
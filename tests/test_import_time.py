@@ -0,0 +1,17 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+from import_time_check import DEFAULT_BUDGET_MS, LAZY_MODULES, import_profile
+
+RUNS = 3
+
+
+def test_server_import_stays_within_budget_and_defers_render_dependencies():
+    profiles = [import_profile() for _ in range(RUNS)]
+    modules, _ = min(profiles, key=lambda profile: profile[0]["server"])
+
+    eager = sorted(name for name in modules if name.split(".")[0] in LAZY_MODULES or name in LAZY_MODULES)
+    assert eager == []
+    assert modules["server"] / 1000 <= DEFAULT_BUDGET_MS
@@ -0,0 +1,24 @@
+import asyncio
+import sys
+from pathlib import Path
+
+from mongomock_motor import AsyncMongoMockClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from indexes import declare_indexes, ensure_indexes
+
+
+def test_failed_index_does_not_stop_the_rest():
+    async def scenario():
+        db = AsyncMongoMockClient()["indexes_test"]
+        # Legacy rows with duplicate ids block the unique index on the first collection
+        await db.status_checks.insert_many([{"id": "same"}, {"id": "same"}])
+
+        failures = await ensure_indexes(db, declare_indexes())
+
+        assert list(failures) == ["status_checks.id_unique"]
+        assert "timestamp_id_desc" in await db.status_checks.index_information()
+        assert "bucket_start" in await db.resume_download_buckets.index_information()
+
+    asyncio.run(scenario())
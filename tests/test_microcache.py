@@ -0,0 +1,126 @@
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from microcache import CachedValue, Microcache
+
+
+class Loader:
+    """Counts calls and returns successive values, optionally held back by a gate"""
+
+    def __init__(self, gate: asyncio.Event = None, fail: bool = False):
+        self.calls = 0
+        self.gate = gate
+        self.fail = fail
+
+    async def __call__(self):
+        self.calls += 1
+        call = self.calls
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        return f"value-{call}"
+
+
+def age(cached: CachedValue, seconds: float):
+    cached._loaded_at -= seconds
+
+
+def test_concurrent_misses_share_one_load():
+    async def scenario():
+        gate = asyncio.Event()
+        loader = Loader(gate)
+        cached = CachedValue(loader, ttl=60)
+        waiters = [asyncio.ensure_future(cached.get()) for _ in range(5)]
+        await asyncio.sleep(0)
+        gate.set()
+        assert await asyncio.gather(*waiters) == ["value-1"] * 5
+        assert loader.calls == 1
+        assert cached.stats()["misses"] == 5 and cached.stats()["coalesced"] == 4
+        assert await cached.get() == "value-1" and cached.stats()["hits"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_stale_value_served_while_one_refresh_runs():
+    async def scenario():
+        loader = Loader()
+        cached = CachedValue(loader, ttl=1, stale_ttl=10)
+        assert await cached.get() == "value-1"
+
+        age(cached, 2)
+        assert [await cached.get() for _ in range(3)] == ["value-1"] * 3
+        await cached._inflight
+        assert loader.calls == 2
+        assert cached.stats()["stale_hits"] == 3
+        assert await cached.get() == "value-2"
+
+        # Past the stale window callers wait for a fresh value
+        age(cached, 20)
+        assert await cached.get() == "value-3"
+
+    asyncio.run(scenario())
+
+
+def test_failed_background_refresh_keeps_serving_stale_value():
+    async def scenario():
+        loader = Loader()
+        cached = CachedValue(loader, ttl=1, stale_ttl=10)
+        await cached.get()
+        loader.fail = True
+        age(cached, 2)
+        assert await cached.get() == "value-1"
+        await asyncio.gather(cached._inflight, return_exceptions=True)
+        assert cached.stats()["failures"] == 1
+        assert await cached.get() == "value-1"
+
+    asyncio.run(scenario())
+
+
+def test_invalidate_discards_a_load_that_raced_the_write():
+    async def scenario():
+        gate = asyncio.Event()
+        loader = Loader(gate)
+        cached = CachedValue(loader, ttl=60)
+        racing = asyncio.ensure_future(cached.get())
+        await asyncio.sleep(0)
+        cached.invalidate()
+        gate.set()
+        assert await racing == "value-1"
+        # The racing read is returned to its caller but not cached
+        assert await cached.get() == "value-2"
+        assert loader.calls == 2
+
+    asyncio.run(scenario())
+
+
+def test_microcache_keys_by_arguments_and_bounds_entries():
+    async def scenario():
+        cache = Microcache(ttl=60, max_entries=2)
+        calls = []
+
+        @cache.cached("contacts")
+        async def handler(limit: int = 10):
+            calls.append(limit)
+            return list(range(limit))
+
+        await handler(limit=1)
+        await handler(limit=2)
+        await handler(limit=1)
+        await handler(limit=3)
+        assert calls == [1, 2, 3]
+        # limit=2 was least recently used, so it was evicted
+        await handler(limit=2)
+        assert calls == [1, 2, 3, 2]
+
+        cache.invalidate("contacts")
+        await handler(limit=1)
+        assert calls == [1, 2, 3, 2, 1]
+        stats = cache.stats()
+        assert stats["invalidations"] == 1 and stats["contacts_entries"] == 1
+        assert all(isinstance(value, int) for value in stats.values())
+
+    asyncio.run(scenario())
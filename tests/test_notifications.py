@@ -0,0 +1,165 @@
+import asyncio
+import sys
+from pathlib import Path
+
+from mongomock_motor import AsyncMongoMockClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from notifications import PENDING_NOTIFICATION, NotificationOutbox, contact_notification
+
+CONTACT = {"id": "contact-1", "name": "Ada  Lovelace", "email": "ada@example.com", "company": None,
+           "message": "Hello", "status": "new"}
+
+
+class FakeTransport:
+    """Records messages instead of talking SMTP; fails the first ``failures`` sends"""
+
+    def __init__(self, failures: int = 0, delay: float = 0.0):
+        self.failures = failures
+        self.delay = delay
+        self.messages = []
+
+    async def send(self, message):
+        await asyncio.sleep(self.delay)
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("smtp unavailable")
+        self.messages.append(message)
+
+
+def make_outbox(transport, workers=1, **kwargs):
+    db = AsyncMongoMockClient()["notifications_test"]
+    outbox = NotificationOutbox(db.outbox, db.contacts, transport, workers=workers, poll_interval=0.01, **kwargs)
+    return db, outbox
+
+
+async def wait_for(condition, timeout: float = 2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not await condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+async def enqueue_contact(db, outbox, contact=CONTACT):
+    await db.contacts.insert_one(dict(contact))
+    await outbox.enqueue(contact["id"], contact_notification(contact, "site@example.com", "me@example.com"))
+
+
+def test_delivers_message_and_marks_contact_notified():
+    async def scenario():
+        transport = FakeTransport()
+        db, outbox = make_outbox(transport)
+        await enqueue_contact(db, outbox)
+        outbox.start()
+        try:
+            await wait_for(lambda: _status(db.contacts, {"id": CONTACT["id"]}, "notified"))
+        finally:
+            await outbox.stop()
+
+        message = transport.messages[0]
+        assert message["To"] == "me@example.com"
+        assert message["Reply-To"] == "ada@example.com"
+        assert message["Subject"] == "New portfolio contact from Ada Lovelace"
+        assert "Company: Not specified" in message.get_content()
+        assert (await db.outbox.find_one({}))["status"] == "sent"
+        assert outbox.stats()["sent"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_transport_failure_schedules_retry():
+    async def scenario():
+        db, outbox = make_outbox(FakeTransport(failures=1), backoff_base=30.0)
+        await enqueue_contact(db, outbox)
+        outbox.start()
+        try:
+            await wait_for(lambda: _status(db.outbox, {}, "pending", attempts=1))
+        finally:
+            await outbox.stop()
+
+        job = await db.outbox.find_one({})
+        assert job["last_error"] == "smtp unavailable"
+        assert outbox.stats()["retried"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_worker_survives_database_error_and_job_is_retried_after_lease():
+    async def scenario():
+        transport = FakeTransport()
+        db, outbox = make_outbox(transport, lease=0.05)
+        update_one = outbox.outbox.update_one
+        calls = {"count": 0}
+
+        async def flaky_update_one(*args, **kwargs):
+            calls["count"] += 1
+            if calls["count"] == 1:
+                raise ConnectionError("mongo unavailable")
+            return await update_one(*args, **kwargs)
+
+        outbox.outbox.update_one = flaky_update_one
+        await enqueue_contact(db, outbox)
+        outbox.start()
+        try:
+            await wait_for(lambda: _status(db.contacts, {"id": CONTACT["id"]}, "notified"))
+        finally:
+            await outbox.stop()
+
+        assert (await db.outbox.find_one({}))["status"] == "sent"
+        assert len(transport.messages) == 2
+
+    asyncio.run(scenario())
+
+
+def test_notification_left_on_contact_is_recovered_once():
+    async def scenario():
+        transport = FakeTransport()
+        db, outbox = make_outbox(transport)
+        payload = contact_notification(CONTACT, "site@example.com", "me@example.com")
+        # The contact insert succeeded but the job insert after it didn't
+        await db.contacts.insert_one({**CONTACT, PENDING_NOTIFICATION: payload})
+        outbox.start()
+        try:
+            await wait_for(lambda: _status(db.contacts, {"id": CONTACT["id"]}, "notified"))
+            # A late job insert from the request is a no-op
+            await outbox.queue_pending(CONTACT["id"], payload)
+        finally:
+            await outbox.stop()
+
+        assert len(transport.messages) == 1
+        assert await db.outbox.count_documents({}) == 1
+        assert PENDING_NOTIFICATION not in await db.contacts.find_one({"id": CONTACT["id"]})
+        assert outbox.stats()["recovered"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_slow_sends_are_not_duplicated_when_they_outlast_a_batch_lease():
+    async def scenario():
+        transport = FakeTransport(delay=0.05)
+        db, outbox = make_outbox(transport, workers=2, lease=0.08)
+        contacts = [{**CONTACT, "id": f"contact-{i}"} for i in range(4)]
+        for contact in contacts:
+            await enqueue_contact(db, outbox, contact)
+        outbox.start()
+        try:
+            await wait_for(lambda: _count(db.outbox, {"status": "sent"}, len(contacts)))
+            await asyncio.sleep(0.2)
+        finally:
+            await outbox.stop()
+
+        assert len(transport.messages) == len(contacts)
+
+    asyncio.run(scenario())
+
+
+async def _count(collection, query, expected):
+    return await collection.count_documents(query) == expected
+
+
+async def _status(collection, query, status, **fields):
+    document = await collection.find_one(query)
+    return document is not None and document["status"] == status and all(
+        document.get(key) == value for key, value in fields.items()
+    )
@@ -0,0 +1,55 @@
+import asyncio
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from pagination import (
+    date_range, decode_cursor, decode_score_cursor, encode_cursor, encode_score_cursor, fetch_page
+)
+
+MOMENT = datetime(2025, 1, 1, 12, 30, 15, 123000)
+
+
+def test_cursors_round_trip():
+    assert decode_cursor(encode_cursor(MOMENT, "abc")) == (MOMENT, "abc")
+    assert decode_score_cursor(encode_score_cursor(2.5, "abc")) == (2.5, "abc")
+
+
+@pytest.mark.parametrize("token", ["", "not base64!", "e30", encode_score_cursor(1.0, "abc")])
+def test_malformed_cursor_raises_value_error(token):
+    with pytest.raises(ValueError):
+        decode_cursor(token)
+
+
+def test_date_range_normalises_aware_datetimes_to_naive_utc():
+    since = datetime(2025, 1, 1, 14, tzinfo=timezone(timedelta(hours=2)))
+    assert date_range("timestamp", since, None) == {"timestamp": {"$gte": datetime(2025, 1, 1, 12)}}
+    assert date_range("timestamp", None, None) == {}
+
+
+def test_pages_cover_every_row_once_when_timestamps_tie():
+    async def scenario():
+        collection = AsyncMongoMockClient()["pagination_test"].rows
+        # Rows share timestamps, so the id has to break ties between pages
+        await collection.insert_many([
+            {"id": f"row-{i:02d}", "timestamp": MOMENT - timedelta(seconds=i // 4)} for i in range(10)
+        ])
+
+        seen, after = [], None
+        while True:
+            rows, token = await fetch_page(collection, {}, "timestamp", 3, after, {"_id": 0})
+            seen.extend(row["id"] for row in rows)
+            if token is None:
+                break
+            after = decode_cursor(token)
+
+        # Newest first, and within one timestamp by descending id, with no row repeated or skipped
+        assert seen == ["row-03", "row-02", "row-01", "row-00", "row-07", "row-06", "row-05", "row-04",
+                        "row-09", "row-08"]
+
+    asyncio.run(scenario())
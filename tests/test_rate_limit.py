@@ -0,0 +1,74 @@
+import asyncio
+import sys
+from pathlib import Path
+
+from pymongo.errors import DuplicateKeyError
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from rate_limit import Limit, MongoTokenBuckets, RateLimitMiddleware, RateLimitRule
+
+RULE = RateLimitRule("POST", "/api/contact", per_ip=Limit.parse("1/3600"))
+
+
+def scope(forwarded_for=None):
+    headers = [(b"x-forwarded-for", value.encode("latin-1")) for value in forwarded_for or []]
+    return {"type": "http", "method": "POST", "path": "/api/contact", "headers": headers,
+            "client": ("10.0.0.2", 1234)}
+
+
+def middleware(buckets=None, **kwargs):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+    return RateLimitMiddleware(app, buckets, [RULE], **kwargs)
+
+
+def test_client_ip_uses_entry_added_by_trusted_proxy():
+    limiter = middleware(trust_forwarded_for=True)
+    assert limiter._client_ip(scope(["1.1.1.1, 203.0.113.7"])) == "203.0.113.7"
+    assert limiter._client_ip(scope(["1.1.1.1", "203.0.113.7"])) == "203.0.113.7"
+    assert limiter._client_ip(scope()) == "10.0.0.2"
+
+
+def test_client_ip_with_two_proxy_hops():
+    limiter = middleware(trust_forwarded_for=True, proxy_hops=2)
+    assert limiter._client_ip(scope(["1.1.1.1, 203.0.113.7, 10.0.0.9"])) == "203.0.113.7"
+    assert limiter._client_ip(scope(["203.0.113.7"])) == "10.0.0.2"
+
+
+def test_forwarded_for_ignored_unless_trusted():
+    assert middleware()._client_ip(scope(["203.0.113.7"])) == "10.0.0.2"
+
+
+def test_store_errors_fail_open():
+    class BrokenBuckets:
+        async def take(self, key, limit):
+            raise ConnectionError("mongo unavailable")
+
+    statuses = []
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    async def receive():
+        return {"type": "http.request", "body": b"{}", "more_body": False}
+
+    asyncio.run(middleware(BrokenBuckets())(scope(), receive, send))
+    assert statuses == [200]
+
+
+def test_mongo_buckets_retry_duplicate_key_race():
+    buckets = MongoTokenBuckets(collection=None)
+    calls = []
+
+    async def take(key, limit):
+        calls.append(key)
+        if len(calls) == 1:
+            raise DuplicateKeyError("E11000 duplicate key")
+        return 0.0
+
+    buckets._take = take
+    assert asyncio.run(buckets.take("ip:/api/contact:1.2.3.4", RULE.per_ip)) == 0.0
+    assert len(calls) == 2
@@ -0,0 +1,36 @@
+import asyncio
+import copy
+import os
+import stat
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from portfolio_data import PORTFOLIO_DATA
+from resume_renderer import ResumeRenderService
+
+
+def document(name):
+    data = copy.deepcopy(PORTFOLIO_DATA)
+    data["personalInfo"]["name"] = name
+    return data
+
+
+def test_concurrent_renders_leave_pdf_and_sidecar_on_the_same_version(tmp_path):
+    async def scenario():
+        renderer = ResumeRenderService(tmp_path / "resume.pdf", max_workers=2)
+        rendered = []
+        renderer.on_rendered = lambda: rendered.append(renderer.rendered_version())
+        try:
+            await asyncio.gather(*(renderer.render(f"v{i}", document(f"Name {i}")) for i in range(3)))
+            # Already on disk, so nothing is rendered again
+            await renderer.ensure("v2", document("Name 2"))
+        finally:
+            renderer.shutdown()
+
+        assert rendered == ["v0", "v1", "v2"]
+        assert renderer.version_path.read_text() == "v2"
+        assert stat.S_IMODE(os.stat(renderer.output_path).st_mode) == 0o644
+
+    asyncio.run(scenario())
@@ -0,0 +1,56 @@
+import asyncio
+import logging
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from mongomock_motor import AsyncMongoMockClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from retention import RetentionArchiver, RetentionPolicy
+
+NOW = datetime(2025, 3, 1, 12)
+POLICY = RetentionPolicy("status_checks", "timestamp", archive_after=86400, group_field="client_name")
+
+
+async def seed(db, count):
+    await db.status_checks.insert_many([
+        {"id": str(i), "client_name": "probe", "timestamp": NOW - timedelta(days=2, minutes=i)}
+        for i in range(count)
+    ])
+
+
+def test_archiver_skips_policy_while_another_worker_holds_the_lease():
+    async def scenario():
+        db = AsyncMongoMockClient()["retention_test"]
+        await seed(db, 5)
+        first, second = RetentionArchiver(db, [POLICY]), RetentionArchiver(db, [POLICY])
+        assert await first._lease(POLICY)
+
+        assert await second.archive(POLICY, now=NOW) == 0
+        assert second.stats()["skipped"] == 1
+        assert await db.status_checks.count_documents({}) == 5
+
+        await db.retention_leases.update_one({}, {"$set": {"until": datetime.utcnow()}})
+        assert await second.archive(POLICY, now=NOW) == 5
+        summary = await db.status_checks_daily.find_one({})
+        assert summary["count"] == 5
+        # Released at the end of the run, so the next one needn't wait for expiry
+        assert await first.archive(POLICY, now=NOW) == 0
+        assert first.stats()["skipped"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_from_env_warns_about_settings_that_do_nothing_or_lose_data(monkeypatch, caplog):
+    monkeypatch.setenv("EVENTS_CAPPED_DOCS", "1000")
+    monkeypatch.setenv("EVENTS_TTL_SECONDS", "3600")
+    with caplog.at_level(logging.WARNING, logger="retention"):
+        policy = RetentionPolicy.from_env("EVENTS", "events", "timestamp")
+        RetentionPolicy.from_env("EVENTS", "rolled_up_events", "timestamp", rolled_up=True)
+
+    assert policy.capped_docs is None
+    messages = [record.getMessage() for record in caplog.records]
+    assert any("EVENTS_CAPPED_DOCS without EVENTS_CAPPED_BYTES" in message for message in messages)
+    assert sum("never summarised" in message for message in messages) == 1
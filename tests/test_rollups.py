@@ -0,0 +1,72 @@
+import asyncio
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from mongomock_motor import AsyncMongoMockClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from rollups import DownloadRollups
+
+START = datetime(2025, 1, 1, 12)
+
+
+def make_rollups():
+    db = AsyncMongoMockClient()["rollups_test"]
+    return db, DownloadRollups(db.rollup_counters, db.resume_download_buckets, db.resume_downloads)
+
+
+def downloads(count, since):
+    return [{"id": f"{since.isoformat()}-{i}", "download_date": since + timedelta(minutes=i)} for i in range(count)]
+
+
+async def flush(db, rollups, documents):
+    """What the analytics buffer does for a batch: insert the raw rows, then apply them"""
+    await db.resume_downloads.insert_many([dict(doc) for doc in documents])
+    await rollups.apply(documents)
+
+
+def test_batches_applied_before_backfill_are_not_counted_twice():
+    async def scenario():
+        db, rollups = make_rollups()
+        await db.resume_downloads.insert_many(downloads(5, START - timedelta(days=1)))
+        # Startup backfill failed, then a batch flushed and created the counter
+        await flush(db, rollups, downloads(3, START))
+        assert (await db.rollup_counters.find_one({}))["backfilled"] is False
+
+        await rollups.backfill()
+        await flush(db, rollups, downloads(2, START + timedelta(hours=1)))
+
+        assert await rollups.total() == 10
+        day = await rollups.timeseries("day", START - timedelta(days=1), START)
+        assert [point["count"] for point in day] == [5, 5]
+
+    asyncio.run(scenario())
+
+
+def test_rerunning_an_interrupted_backfill_is_idempotent():
+    async def scenario():
+        db, rollups = make_rollups()
+        await db.resume_downloads.insert_many(downloads(4, START))
+        await rollups.backfill()
+        await db.rollup_counters.update_one({}, {"$set": {"backfilled": False}})
+        await rollups.backfill()
+
+        assert await rollups.total() == 4
+        hours = await rollups.timeseries("hour", START, START)
+        assert [point["count"] for point in hours] == [4]
+
+    asyncio.run(scenario())
+
+
+def test_legacy_counter_is_not_backfilled_again():
+    async def scenario():
+        db, rollups = make_rollups()
+        await db.resume_downloads.insert_many(downloads(4, START))
+        await db.rollup_counters.insert_one({"_id": "resume_downloads", "total": 4, "legacy": True})
+        await rollups.backfill()
+
+        assert await rollups.total() == 4
+
+    asyncio.run(scenario())
@@ -0,0 +1,46 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from search import InvertedIndex, parse_query, snippet
+
+
+def test_snippet_escapes_markup_and_marks_stemmed_matches():
+    document = {"message": "<script>alert('x')</script> Hiring for Roles & <b>teams</b>"}
+    wanted, _ = parse_query("roles")
+    assert snippet(document, wanted) == (
+        "&lt;script&gt;alert(&#x27;x&#x27;)&lt;/script&gt; Hiring for <mark>Roles</mark> &amp; &lt;b&gt;teams&lt;/b&gt;"
+    )
+
+
+def test_snippet_escapes_the_marked_text_and_trims_long_fields():
+    document = {"message": "a" * 100 + " role<img src=x> " + "b" * 100, "name": "Role Model"}
+    excerpt = snippet(document, ["role"], width=10)
+    assert excerpt.startswith("…") and excerpt.endswith("…")
+    assert excerpt == "…aaaaaaaaa <mark>role</mark>&lt;img src=x…"
+    assert "<img" not in excerpt
+
+
+def test_snippet_falls_back_to_other_fields_and_none_without_a_match():
+    assert snippet({"message": "", "company": "Acme <Security>"}, ["secur"]) == "Acme &lt;<mark>Security</mark>&gt;"
+    assert snippet({"message": "hello"}, ["role"]) is None
+    assert snippet({"message": "hello"}, []) is None
+
+
+def test_parse_query_splits_excluded_terms_and_drops_stopwords():
+    assert parse_query("the Security roles -intern -the security") == (["security", "role"], ["intern"])
+
+
+def test_inverted_index_pages_by_score_then_id_and_honours_exclusions():
+    index = InvertedIndex()
+    index.add({"id": "a", "name": "Analyst", "company": "", "message": "security role"})
+    index.add({"id": "b", "name": "", "company": "Security Co", "message": "role"})
+    index.add({"id": "c", "name": "", "company": "", "message": "security intern role"})
+    index.add({"id": "d", "name": "", "company": "", "message": "security role"})
+
+    first = index.search(["security"], [], 2)
+    assert [doc_id for _, doc_id in first] == ["b", "d"]
+    rest = index.search(["security"], [], 10, after=first[-1])
+    assert [doc_id for _, doc_id in rest] == ["c", "a"]
+    assert [doc_id for _, doc_id in index.search(["security"], ["intern"], 10)] == ["b", "d", "a"]
@@ -0,0 +1,80 @@
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+from starlette.requests import Request
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from static_assets import MAX_RANGES, StaticAssetRegistry, parse_range
+
+PAYLOAD = b"%PDF-1.4\n" + b"resume " * 4096
+
+
+def request(headers=None):
+    raw = [(name.encode("latin-1"), value.encode("latin-1")) for name, value in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/api/assets/resume", "headers": raw})
+
+
+def test_changed_file_served_uncompressed_until_variants_rebuilt(tmp_path):
+    async def scenario():
+        source = tmp_path / "resume.pdf"
+        source.write_bytes(PAYLOAD)
+        registry = StaticAssetRegistry(tmp_path / ".variants")
+        asset = registry.register("resume", source)
+        await registry.prepare()
+
+        response = await registry.respond(asset, request({"accept-encoding": "gzip"}))
+        assert response.headers["content-encoding"] == "gzip"
+        old_variants = sorted(os.listdir(registry.variant_dir))
+
+        source.write_bytes(PAYLOAD + b"updated")
+        response = await registry.respond(asset, request({"accept-encoding": "gzip"}))
+        assert "content-encoding" not in response.headers
+
+        await registry._refreshing["resume"]
+        response = await registry.respond(asset, request({"accept-encoding": "gzip"}))
+        assert response.headers["content-encoding"] == "gzip"
+        new_variants = sorted(os.listdir(registry.variant_dir))
+        assert len(new_variants) == 1 and new_variants != old_variants
+
+    asyncio.run(scenario())
+
+
+def test_parse_range_single_suffix_and_open_ended():
+    assert parse_range("bytes=0-99", 1000) == [(0, 99)]
+    assert parse_range("bytes=-100", 1000) == [(900, 999)]
+    assert parse_range("bytes=900-", 1000) == [(900, 999)]
+    assert parse_range("bytes=990-2000", 1000) == [(990, 999)]
+
+
+def test_parse_range_multiple_ranges_and_unsatisfiable():
+    assert parse_range("bytes=0-0, 10-19,-5", 1000) == [(0, 0), (10, 19), (995, 999)]
+    assert parse_range("bytes=1000-1100", 1000) == []
+    assert parse_range("bytes=-0", 1000) == []
+
+
+def test_parse_range_ignores_bad_syntax_and_too_many_ranges():
+    assert parse_range("items=0-10", 1000) is None
+    assert parse_range("bytes=10-5", 1000) is None
+    assert parse_range("bytes=-", 1000) is None
+    assert parse_range("bytes=" + ",".join(f"{i}-{i}" for i in range(MAX_RANGES)), 1000) is not None
+    assert parse_range("bytes=" + ",".join(f"{i}-{i}" for i in range(MAX_RANGES + 1)), 1000) is None
+
+
+def test_multi_range_response_is_multipart_with_exact_length(tmp_path):
+    async def scenario():
+        source = tmp_path / "resume.pdf"
+        source.write_bytes(PAYLOAD)
+        registry = StaticAssetRegistry(tmp_path / ".variants")
+        asset = registry.register("resume", source)
+        response = await registry.respond(asset, request({"range": "bytes=0-3,-4"}))
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        return response, body
+
+    response, body = asyncio.run(scenario())
+    assert response.status_code == 206
+    assert response.headers["content-type"].startswith("multipart/byteranges; boundary=")
+    assert int(response.headers["content-length"]) == len(body)
+    assert b"Content-Range: bytes 0-3/" in body and b"%PDF" in body